@@ -1,10 +1,12 @@
 from dependency_injector import containers, providers
 from myapi.database import get_db
+from myapi.repositories.signal_outcome_repository import SignalOutcomeRepository
 from myapi.repositories.signals_repository import SignalsRepository
 from myapi.repositories.ticker_reference_repository import TickerReferenceRepository
 from myapi.repositories.ticker_repository import TickerRepository
 from myapi.repositories.web_search_repository import WebSearchResultRepository
 from myapi.services.ai_service import AIService
+from myapi.services.async_ai_service import AsyncAIService
 from myapi.services.aws_service import AwsService
 from myapi.services.db_signal_service import DBSignalService
 from myapi.services.discord_service import DiscordService
@@ -29,6 +31,9 @@ class RepositoryModule(containers.DeclarativeContainer):
 
     session = providers.Resource(get_db)
     signals_repository = providers.Factory(SignalsRepository, db_session=session)
+    signal_outcome_repository = providers.Factory(
+        SignalOutcomeRepository, db_session=session
+    )
     ticker_repository = providers.Factory(TickerRepository, db_session=session)
     ticker_reference_repository = providers.Factory(
         TickerReferenceRepository, db_session=session
@@ -52,6 +57,7 @@ class ServiceModule(containers.DeclarativeContainer):
         settings=config.config,
         api_key_repository=repositories.api_key_repository,
     )
+    async_ai_service = providers.Factory(AsyncAIService, ai_service=ai_service)
     discord_service = providers.Factory(DiscordService, settings=config.config)
 
     translate_service = providers.Factory(
@@ -84,18 +90,21 @@ class ServiceModule(containers.DeclarativeContainer):
         WebSearchService,
         websearch_repository=repositories.web_search_repository,
         ai_service=ai_service,
+        async_ai_service=async_ai_service,
         translate_service=translate_service,
     )
     db_signal_service = providers.Factory(
         DBSignalService,
         repository=repositories.signals_repository,
         translate_service=translate_service,
+        outcome_repository=repositories.signal_outcome_repository,
     )
 
     research_service = providers.Factory(
         ResearchService,
         websearch_repository=repositories.web_search_repository,
         ai_service=ai_service,
+        async_ai_service=async_ai_service,
         translate_service=translate_service,
     )
 
@@ -3,7 +3,17 @@
 from datetime import date, datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, Date, ForeignKey, Integer, String, Text, TIMESTAMP, func
+from sqlalchemy import (
+    Boolean,
+    Date,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    TIMESTAMP,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from myapi.database import Base
@@ -39,7 +49,13 @@ class APIKeyUsage(Base):
     """Daily API key usage tracking"""
 
     __tablename__ = "api_key_usage"
-    __table_args__ = {"schema": "crypto"}
+    __table_args__ = (
+        # INSERT ... ON CONFLICT (api_key_id, usage_date) 대상
+        Index(
+            "uq_api_key_usage_key_date", "api_key_id", "usage_date", unique=True
+        ),
+        {"schema": "crypto"},
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     api_key_id: Mapped[int] = mapped_column(
@@ -1,7 +1,8 @@
 from datetime import date as d, datetime
 from typing import Any, Optional
 
-from sqlalchemy import Date, DateTime, Float, Integer, JSON, String, func
+from sqlalchemy import Date, DateTime, Float, Index, Integer, String, func, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from myapi.database import Base
@@ -45,12 +46,20 @@ class MarketForecast(Base):
 
 class AiAnalysisModel(Base):
     __tablename__ = "ai_analysis"
-    __table_args__ = {"schema": "crypto"}
+    __table_args__ = (
+        # myapi/utils/migrate_ai_analysis.py 가 기존 테이블에 같은 인덱스를 만듭니다.
+        # 저장소 쿼리의 "value->>'ticker' = ANY(:tickers)" 표현식과 일치해야 사용됨
+        Index("ix_ai_analysis_name_date", "name", "date"),
+        Index("ix_ai_analysis_ticker", text("(value ->> 'ticker')")),
+        Index("ix_ai_analysis_etf_ticker", text("(value ->> 'etf_ticker')")),
+        Index("ix_ai_analysis_ai_model", text("(value ->> 'ai_model')")),
+        {"schema": "crypto"},
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     date: Mapped[d] = mapped_column(Date, nullable=False)
     name: Mapped[str] = mapped_column(String, nullable=False, default="market_analysis")
-    value: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    value: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
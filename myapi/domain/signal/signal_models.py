@@ -1,8 +1,8 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any, Optional
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import DateTime, Float, Integer, JSON, String
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, JSON, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from myapi.database import Base
@@ -40,3 +40,38 @@ class Signals(Base):
     good_things: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     bad_things: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     chart_pattern: Mapped[Optional[dict[str, Any]]] = mapped_column(JSON, nullable=True)
+
+
+class SignalOutcome(Base):
+    """
+    시그널 이후 실제 일봉(tickers)과 비교한 결과.
+    새 거래일 봉이 들어올 때마다 미확정(resolved=False) 시그널만 이어서 평가합니다.
+    """
+
+    __tablename__ = "signal_outcomes"
+    __table_args__ = {"schema": "crypto"}
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    signal_id: Mapped[int] = mapped_column(Integer, unique=True, index=True)
+    ticker: Mapped[str] = mapped_column(String, index=True)
+    strategy: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
+    ai_model: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
+    action: Mapped[str] = mapped_column(String)
+    signal_date: Mapped[date] = mapped_column(Date, index=True)
+
+    # 다음 거래일 방향 (시그널 날짜 이후 첫 봉의 시가 대비 종가: up/down/unchanged)
+    next_day_direction: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    next_day_correct: Mapped[bool] = mapped_column(Boolean, default=False)
+
+    # 목표가/손절가 도달 여부 (먼저 닿은 쪽: take_profit / stop_loss)
+    hit_take_profit: Mapped[bool] = mapped_column(Boolean, default=False)
+    hit_stop_loss: Mapped[bool] = mapped_column(Boolean, default=False)
+    first_hit: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    first_hit_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+
+    bars_evaluated: Mapped[int] = mapped_column(Integer, default=0)
+    evaluated_until: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    resolved: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=_now_kst_naive, onupdate=_now_kst_naive
+    )
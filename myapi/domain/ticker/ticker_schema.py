@@ -113,6 +113,21 @@ class SignalAccuracyResponse(BaseModel):
     accuracy_details: str = ""
 
 
+class SignalAccuracySummary(BaseModel):
+    """ticker / strategy / ai_model 별 시그널 정확도 집계 (signal_outcomes 기준)"""
+
+    ticker: str
+    strategy: Optional[str] = None
+    ai_model: Optional[str] = None
+    total_signals: int = 0
+    evaluated_signals: int = 0  # 다음 거래일 봉이 있는 시그널 수
+    next_day_accuracy: Optional[float] = None  # 다음 거래일 방향 적중률
+    take_profit_hits: int = 0
+    stop_loss_hits: int = 0
+    resolved_signals: int = 0  # 목표가/손절가 도달 또는 평가 기간 종료
+    take_profit_rate: Optional[float] = None  # 확정된 시그널 중 목표가 선도달 비율
+
+
 class TickerLatestWithChangeResponse(BaseModel):
     symbol: str
     date: Optional[date_]
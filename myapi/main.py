@@ -18,6 +18,12 @@ from myapi.routers import (
     research_router,
 )
 from myapi.utils.config import init_logging
+from myapi.utils.llm_cache import get_llm_response_cache
+from myapi.utils.llm_metrics import job_scope, llm_metrics
+from myapi.utils.provider_health import provider_health_snapshot
+from myapi.utils.structured_output import structured_output_stats
+from myapi.utils.translation_memory import get_translation_memory
+from myapi.utils.translation_routing import translation_tier_stats
 
 
 app = FastAPI()
@@ -59,7 +65,9 @@ app.add_middleware(
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     logger.info(f"Request: {request.method} {request.url}")
-    response = await call_next(request)
+    # 요청(SQS 배치 작업) 단위 LLM 호출 요약 로그
+    with job_scope(f"{request.method} {request.url.path}"):
+        response = await call_next(request)
     logger.info(f"Response: {response.status_code}")
     return response
 
@@ -108,6 +116,42 @@ def health_check():
     return {"status": "healthy", "service": "tqqq-fastapi"}
 
 
+@app.get("/health/llm-cache")
+def llm_cache_stats():
+    """LLM 응답 캐시 hit/miss 카운터 (현재 프로세스 기준)."""
+    return get_llm_response_cache().stats()
+
+
+@app.get("/health/structured-output")
+def structured_output_metrics():
+    """perplexity_completion 구조화 출력: 1회 호출 성공 vs repair 호출 횟수."""
+    return structured_output_stats()
+
+
+@app.get("/health/llm-metrics")
+def llm_call_metrics():
+    """공급자/모델별 LLM 호출 수, 에러, 재시도, 토큰, 추정 비용, 지연 히스토그램."""
+    return llm_metrics.snapshot()
+
+
+@app.get("/health/llm-providers")
+def llm_provider_health():
+    """공급자별 circuit breaker 상태, 최근 실패율, FALLBACK hedge 지연(p95)."""
+    return provider_health_snapshot()
+
+
+@app.get("/health/translation-memory")
+def translation_memory_stats():
+    """번역 메모리 문장 단위 hit/miss 및 모델로 보낸 문장 수 (현재 프로세스 기준)."""
+    return get_translation_memory().stats()
+
+
+@app.get("/health/translation-tiers")
+def translation_tier_metrics():
+    """번역 tier(MT / LLM)별 호출 수, 문자 수, 평균 지연, 추정 비용."""
+    return translation_tier_stats.snapshot()
+
+
 app.include_router(signal_router.router)
 app.include_router(ticker_router.router)
 app.include_router(news_router.router)
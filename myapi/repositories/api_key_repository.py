@@ -1,15 +1,20 @@
 """Repository for API key management and usage tracking"""
 
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, func
 from datetime import date, datetime
-from typing import Literal, Optional
+from typing import Dict, List, Literal, Optional, Tuple
 import logging
+import threading
 
 from myapi.domain.api_key.api_key_models import APIKey, APIKeyUsage
 
 logger = logging.getLogger(__name__)
 
+_usage_index_ready = False
+_usage_index_lock = threading.Lock()
+
 
 class ApiKeyRepository:
     """Handles database operations for API keys and usage tracking"""
@@ -131,3 +136,79 @@ class ApiKeyRepository:
         count = usage.request_count if usage else 0
 
         return int(count.real)
+
+    def _ensure_usage_index(self) -> None:
+        """마이그레이션 도구가 없으므로 upsert에 필요한 unique index를 최초 사용 시 생성합니다."""
+        global _usage_index_ready
+        if _usage_index_ready:
+            return
+        with _usage_index_lock:
+            if not _usage_index_ready:
+                for index in APIKeyUsage.__table__.indexes:  # type: ignore[attr-defined]
+                    index.create(bind=self.db.get_bind(), checkfirst=True)
+                _usage_index_ready = True
+
+    def get_active_keys_with_usage(
+        self, provider: Literal["GEMINI", "OPENAI"], usage_date: date
+    ) -> List[Tuple[APIKey, int]]:
+        """Active keys for a provider with their request count on usage_date."""
+        return [
+            (key, int(count))
+            for key, count in self.db.query(
+                APIKey, func.coalesce(APIKeyUsage.request_count, 0)
+            )
+            .outerjoin(
+                APIKeyUsage,
+                and_(
+                    APIKey.id == APIKeyUsage.api_key_id,
+                    APIKeyUsage.usage_date == usage_date,
+                ),
+            )
+            .filter(APIKey.provider == provider, APIKey.is_active == True)
+            .order_by(APIKey.priority.asc(), APIKey.id.asc())
+            .all()
+        ]
+
+    def add_usage(self, counts: Dict[int, int], usage_date: date) -> Dict[int, int]:
+        """
+        Atomically add request counts for several keys in one statement.
+
+        Uses INSERT ... ON CONFLICT (api_key_id, usage_date)
+        DO UPDATE SET request_count = request_count + excluded.request_count,
+        so concurrent workers never lose increments.
+
+        Returns:
+            api_key_id -> request count on usage_date after the update
+        """
+        if not counts:
+            return {}
+        self._ensure_usage_index()
+        now = datetime.now()
+        table = APIKeyUsage.__table__
+        stmt = insert(table).values(
+            [
+                {
+                    "api_key_id": key_id,
+                    "usage_date": usage_date,
+                    "request_count": n,
+                    "last_request_at": now,
+                }
+                for key_id, n in counts.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.api_key_id, table.c.usage_date],
+            set_={
+                "request_count": table.c.request_count + stmt.excluded.request_count,
+                "last_request_at": stmt.excluded.last_request_at,
+                "updated_at": func.now(),
+            },
+        ).returning(table.c.api_key_id, table.c.request_count)
+
+        try:
+            rows = self.db.execute(stmt).all()
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return {int(key_id): int(count) for key_id, count in rows}
@@ -0,0 +1,146 @@
+import logging
+import threading
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import sqlalchemy
+from sqlalchemy import and_, case, func, or_
+from sqlalchemy.orm import Session
+
+from myapi.domain.signal.signal_models import SignalOutcome, Signals
+from myapi.domain.ticker.ticker_model import Ticker
+
+logger = logging.getLogger(__name__)
+
+# (date, open, high, low, close)
+Bar = Tuple[date, Optional[float], Optional[float], Optional[float], Optional[float]]
+
+_table_ready = False
+_table_lock = threading.Lock()
+
+
+class SignalOutcomeRepository:
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    def _ensure_table(self) -> None:
+        """마이그레이션 도구가 없으므로 최초 사용 시 signal_outcomes 테이블을 생성합니다."""
+        global _table_ready
+        if _table_ready:
+            return
+        with _table_lock:
+            if not _table_ready:
+                SignalOutcome.__table__.create(  # type: ignore[attr-defined]
+                    bind=self.db_session.get_bind(), checkfirst=True
+                )
+                _table_ready = True
+
+    def get_latest_bar_date(self) -> Optional[date]:
+        return self.db_session.query(func.max(Ticker.date)).scalar()
+
+    def get_pending(
+        self, latest_bar_date: date
+    ) -> List[Tuple[Signals, Optional[SignalOutcome]]]:
+        """
+        아직 결과가 확정되지 않았고 latest_bar_date 이전까지만 평가된 시그널과 기존 결과 행.
+        결과 행이 없는 시그널(새 시그널)도 포함합니다.
+        """
+        self._ensure_table()
+        signal_date = func.cast(Signals.timestamp, sqlalchemy.Date)
+        return (
+            self.db_session.query(Signals, SignalOutcome)
+            .outerjoin(SignalOutcome, SignalOutcome.signal_id == Signals.id)
+            .filter(signal_date <= latest_bar_date)
+            .filter(
+                or_(
+                    SignalOutcome.id.is_(None),
+                    and_(
+                        SignalOutcome.resolved.is_(False),
+                        or_(
+                            SignalOutcome.evaluated_until.is_(None),
+                            SignalOutcome.evaluated_until < latest_bar_date,
+                        ),
+                    ),
+                )
+            )
+            .all()
+        )
+
+    def get_bars_since(self, starts: Dict[str, date]) -> Dict[str, List[Bar]]:
+        """심볼별 start 이후 일봉을 날짜순으로 반환합니다 (한 번의 쿼리로 조회)."""
+        if not starts:
+            return {}
+        rows = (
+            self.db_session.query(
+                Ticker.symbol,
+                Ticker.date,
+                Ticker.open_price,
+                Ticker.high_price,
+                Ticker.low_price,
+                Ticker.close_price,
+            )
+            .filter(Ticker.symbol.in_(list(starts)))
+            .filter(Ticker.date >= min(starts.values()))
+            .order_by(Ticker.symbol, Ticker.date, Ticker.id)
+            .all()
+        )
+        bars: Dict[str, List[Bar]] = defaultdict(list)
+        for symbol, day, open_, high, low, close in rows:
+            if day < starts[symbol]:
+                continue
+            series = bars[symbol]
+            if series and series[-1][0] == day:
+                continue  # 같은 날짜 중복 행은 먼저 저장된 행 사용
+            series.append((day, open_, high, low, close))
+        return bars
+
+    def save_all(self, outcomes: Iterable[SignalOutcome]) -> None:
+        try:
+            self.db_session.add_all(list(outcomes))
+            self.db_session.commit()
+        except Exception:
+            self.db_session.rollback()
+            raise
+
+    def get_accuracy(
+        self,
+        tickers: Optional[List[str]] = None,
+        strategy: Optional[str] = None,
+        ai_model: Optional[str] = None,
+    ):
+        """ticker / strategy / ai_model 별 집계."""
+        self._ensure_table()
+        evaluated = func.count(SignalOutcome.next_day_direction)
+        query = self.db_session.query(
+            SignalOutcome.ticker,
+            SignalOutcome.strategy,
+            SignalOutcome.ai_model,
+            func.count(SignalOutcome.id).label("total"),
+            evaluated.label("evaluated"),
+            func.sum(case((SignalOutcome.next_day_correct.is_(True), 1), else_=0)).label(
+                "next_day_correct"
+            ),
+            func.sum(case((SignalOutcome.first_hit == "take_profit", 1), else_=0)).label(
+                "take_profit_hits"
+            ),
+            func.sum(case((SignalOutcome.first_hit == "stop_loss", 1), else_=0)).label(
+                "stop_loss_hits"
+            ),
+            func.sum(case((SignalOutcome.resolved.is_(True), 1), else_=0)).label(
+                "resolved"
+            ),
+        )
+        if tickers:
+            query = query.filter(SignalOutcome.ticker.in_(tickers))
+        if strategy:
+            query = query.filter(SignalOutcome.strategy == strategy)
+        if ai_model:
+            query = query.filter(SignalOutcome.ai_model == ai_model)
+        return (
+            query.group_by(
+                SignalOutcome.ticker, SignalOutcome.strategy, SignalOutcome.ai_model
+            )
+            .order_by(SignalOutcome.ticker, SignalOutcome.strategy)
+            .all()
+        )
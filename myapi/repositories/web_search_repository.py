@@ -20,6 +20,16 @@ from myapi.domain.news.news_schema import (
 logger = logging.getLogger(__name__)
 
 
+def _value_in(field: str, values: List[str]):
+    """
+    AiAnalysisModel.value의 문자열 필드 필터: value->>'field' = ANY(:field_values).
+    식이 인덱스 표현식 (value ->> 'field')와 같아야 ix_ai_analysis_* 인덱스를 탑니다.
+    """
+    return text(f"value->>'{field}' = ANY(:{field}_values)").params(
+        **{f"{field}_values": list(values)}
+    )
+
+
 class WebSearchResultRepository:
     def __init__(self, db_session: Session):
         self.db_session = db_session
@@ -345,41 +355,19 @@ class WebSearchResultRepository:
         """
 
         try:
-            from sqlalchemy import text, or_
-
             query = self.db_session.query(AiAnalysisModel).filter(
                 AiAnalysisModel.name == name
             )
 
             # tickers 파라미터가 있으면 JSON 필드에서 ticker로 필터링
             if tickers and len(tickers) > 0:
-                # ETF 분석의 경우 etf_ticker 또는 ticker 필드로 필터링
-                if name == "etf_portfolio_analysis":
-                    ticker_filters = []
-                    for i, ticker in enumerate(tickers):
-                        ticker_filters.extend(
-                            [
-                                text(f"value->>'etf_ticker' = :ticker_{i}").params(
-                                    **{f"ticker_{i}": ticker}
-                                ),
-                            ]
-                        )
-                    query = query.filter(or_(*ticker_filters))
-                else:
-                    # 일반 분석의 경우 ticker 필드로 필터링
-                    ticker_filters = [
-                        text(f"value->>'ticker' = :ticker_{i}").params(
-                            **{f"ticker_{i}": ticker}
-                        )
-                        for i, ticker in enumerate(tickers)
-                    ]
-                    query = query.filter(or_(*ticker_filters))
+                # ETF 분석은 etf_ticker, 일반 분석은 ticker 필드로 필터링
+                field = "etf_ticker" if name == "etf_portfolio_analysis" else "ticker"
+                query = query.filter(_value_in(field, tickers))
 
             if name == "signals":
                 if models:
-                    query = query.filter(
-                        text("value->>'ai_model' = :ai_model").params(ai_model=models)
-                    )
+                    query = query.filter(_value_in("ai_model", [models]))
 
                 if strategy_filter == "AI_GENERATED":
                     query = query.filter(text("value->>'strategy' = :strategy")).params(
@@ -551,17 +539,13 @@ class WebSearchResultRepository:
         Query
             Filtered query object.
         """
-        from sqlalchemy import text, or_, and_
+        from sqlalchemy import text, and_
 
         filters = []
 
         # Filter by tickers if provided
         if tickers and len(tickers) > 0:
-            ticker_filters = [
-                text("value->>'stock_name' = :ticker").params(ticker=ticker)
-                for ticker in tickers
-            ]
-            filters.append(or_(*ticker_filters))
+            filters.append(_value_in("stock_name", tickers))
 
         # Filter by recommendation if provided
         if recommendation:
@@ -700,15 +684,11 @@ class WebSearchResultRepository:
                 query = query.filter(AiAnalysisModel.date == normalized_target)
 
             # JSON 필드에서 ticker로 필터링 (PostgreSQL의 경우)
-            query = query.filter(text("value->>'ticker' = :ticker")).params(
-                ticker=ticker
-            )
+            query = query.filter(_value_in("ticker", [ticker]))
 
             if ai_model:
                 # value ai_model 필드로 필터링
-                query = query.filter(text("value->>'ai_model' = :ai_model")).params(
-                    ai_model=ai_model
-                )
+                query = query.filter(_value_in("ai_model", [ai_model]))
 
             if strategy_filter == "AI_GENERATED":
                 query = query.filter(text("value->>'strategy' = :strategy")).params(
@@ -898,7 +878,6 @@ class WebSearchResultRepository:
             raw JSON value is returned.
         """
         import time
-        from sqlalchemy import text
 
         max_retries = 3
         retry_delay = 1
@@ -915,9 +894,7 @@ class WebSearchResultRepository:
                     .filter(
                         AiAnalysisModel.date == normalized_date,
                         AiAnalysisModel.name == name,
-                        text("value->>'ticker' = :ticker").params(
-                            ticker=ticker.upper()
-                        ),
+                        _value_in("ticker", [ticker.upper()]),
                     )
                     .first()
                 )
@@ -1025,3 +1002,33 @@ class WebSearchResultRepository:
 
         # This line should never be reached due to raise e above, but satisfies type checker
         raise RuntimeError("Failed to create analysis after all retries")
+
+    def create_analyses(
+        self,
+        analysis_date: datetime.date,
+        analyses: List[Any],
+        name: str = "market_analysis",
+    ) -> int:
+        """Store several analyses of the same date and type in one transaction."""
+        if not analyses:
+            return 0
+
+        normalized_date = (
+            analysis_date.date()
+            if isinstance(analysis_date, datetime.datetime)
+            else analysis_date
+        )
+        try:
+            self.db_session.add_all(
+                [
+                    AiAnalysisModel(date=normalized_date, name=name, value=analysis)
+                    for analysis in analyses
+                ]
+            )
+            self.db_session.commit()
+        except Exception:
+            self.db_session.rollback()
+            raise
+
+        logger.info(f"Successfully stored {len(analyses)} {name} analyses in bulk")
+        return len(analyses)
@@ -2,7 +2,6 @@ from datetime import timedelta
 
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
-import yfinance
 
 from myapi.domain.signal.signal_schema import DefaultTickers
 from myapi.utils.auth import create_access_token
@@ -1,4 +1,5 @@
 from typing import Literal, Optional
+import asyncio
 import datetime as dt
 import logging
 
@@ -36,6 +37,7 @@ from myapi.domain.news.news_schema import (
 from myapi.domain.signal.signal_schema import WebSearchTickerResponse
 from myapi.services.signal_service import SignalService
 from myapi.services.ai_service import AIService
+from myapi.services.async_ai_service import AsyncAIService
 from myapi.services.web_search_service import WebSearchService
 
 router = APIRouter(prefix="/news", tags=["news"])
@@ -517,7 +519,9 @@ async def create_etf_signal_pipeline(
         Provide[Container.services.websearch_service]
     ),
     signal_service: SignalService = Depends(Provide[Container.services.signal_service]),
-    ai_service: AIService = Depends(Provide[Container.services.ai_service]),
+    async_ai_service: AsyncAIService = Depends(
+        Provide[Container.services.async_ai_service]
+    ),
 ):
     """
     ETF 포트폴리오 변동 분석을 기반으로 해당 종목들의 시그널 분석을 수행합니다.
@@ -560,13 +564,12 @@ async def create_etf_signal_pipeline(
         for change in etf_portfolio_data.changes:
             changed_tickers.append(change.ticker.upper())
 
-        # Step 4: 각 종목에 대해 차트 분석 및 웹서치 수행
-        ticker_signals = []
-        for ticker in changed_tickers[:5]:  # 최대 5개 종목만 분석 (API 제한)
+        # Step 4: 각 종목에 대해 차트 분석 및 웹서치 수행 (종목별 LLM 호출은 동시에 실행)
+        async def analyze_ticker(ticker: str) -> dict:
             try:
                 # 웹서치를 통한 최신 뉴스/분석 수집
                 today_str = target_date.strftime("%Y-%m-%d")
-                web_search_result = ai_service.perplexity_completion(
+                web_search_result = await async_ai_service.perplexity_completion(
                     prompt=signal_service.generate_web_search_prompt(ticker, today_str),
                     schema=WebSearchTickerResponse,
                 )
@@ -598,32 +601,35 @@ async def create_etf_signal_pipeline(
                 4. Risk/reward profile for retail investors
                 """
 
-                ticker_signals.append(
-                    {
-                        "ticker": ticker,
-                        "etf_action": next(
-                            (
-                                change.action
-                                for change in etf_portfolio_data.changes
-                                if change.ticker == ticker
-                            ),
-                            "UNKNOWN",
+                return {
+                    "ticker": ticker,
+                    "etf_action": next(
+                        (
+                            change.action
+                            for change in etf_portfolio_data.changes
+                            if change.ticker == ticker
                         ),
-                        "web_search_data": (
-                            web_search_result.model_dump()
-                            if web_search_result
-                            else None
-                        ),
-                        "enhanced_context": enhanced_prompt,
-                        "analysis_status": "completed",
-                    }
-                )
+                        "UNKNOWN",
+                    ),
+                    "web_search_data": (
+                        web_search_result.model_dump()
+                        if web_search_result
+                        else None
+                    ),
+                    "enhanced_context": enhanced_prompt,
+                    "analysis_status": "completed",
+                }
 
             except Exception as e:
                 logger.error(f"Error analyzing ticker {ticker}: {e}")
-                ticker_signals.append(
-                    {"ticker": ticker, "error": str(e), "analysis_status": "failed"}
-                )
+                return {"ticker": ticker, "error": str(e), "analysis_status": "failed"}
+
+        ticker_signals = list(
+            await asyncio.gather(
+                # 최대 5개 종목만 분석 (API 제한)
+                *(analyze_ticker(ticker) for ticker in changed_tickers[:5])
+            )
+        )
 
         # Step 5: 통합 결과 반환
         pipeline_result = {
@@ -5,6 +5,7 @@ from typing import List, Literal, Optional
 from urllib import response
 from fastapi import APIRouter, Depends
 
+from myapi.services.market_data_context import MarketDataContext
 from myapi.services.translate_service import TranslateService
 from myapi.utils.auth import verify_bearer_token
 from datetime import timedelta
@@ -46,9 +47,7 @@ from myapi.services.aws_service import AwsService
 from myapi.services.db_signal_service import DBSignalService
 from myapi.services.discord_service import DiscordService
 from myapi.services.signal_service import SignalService
-from myapi.utils.utils import (
-    export_slim_tail_csv,
-)
+from myapi.utils.prompt_encoding import encode_indicator_frame
 
 
 router = APIRouter(
@@ -328,17 +327,14 @@ async def get_signals(
     mkt_ok = False
     reports: list[TickerReport] = []
 
-    spy_df = signal_service.fetch_ohlcv("SPY", start=start)
+    # 실행 단위 캐시: 시세/지표/시장 데이터는 티커당 한 번만 조회·계산
+    market = MarketDataContext(signal_service, start=start, benchmark="SPY")
+    market.prefetch(tickers)
 
     # Fetch market-wide volatility and options data (once for all tickers)
-    logger.info("Fetching VIX market volatility data...")
-    vix_data = signal_service.fetch_market_volatility_data()
-
-    logger.info("Fetching SPY options data...")
-    spy_options = signal_service.fetch_index_options_data("SPY")
-
-    logger.info("Fetching QQQ options data...")
-    qqq_options = signal_service.fetch_index_options_data("QQQ")
+    vix_data = market.vix_data()
+    spy_options = market.options_data("SPY")
+    qqq_options = market.options_data("QQQ")
 
     # Determine overall options sentiment
     options_sentiment = "neutral"
@@ -352,13 +348,11 @@ async def get_signals(
             options_sentiment = "bullish"
 
     for t in tickers:
-        df = signal_service.fetch_ohlcv(t, start=start)
+        df = market.indicators(t)
 
-        if df is None or df.empty:
+        if df.empty:
             continue
 
-        df = signal_service.add_indicators(df, spy_df)
-
         if t == "SPY":
             spy_persentage_from_200ma = (
                 ((df["Close"].iloc[-1] - df["SMA200"].iloc[-1]) / df["SMA200"].iloc[-1])
@@ -386,7 +380,6 @@ async def get_signals(
                 signals=tech_sigs,
                 fundamentals=funda,
                 news=None,
-                dataframe=export_slim_tail_csv(df, 100),
             )
         )
 
@@ -417,17 +410,15 @@ async def get_signals(
             if signal.triggered
         }
 
-        # Analyze trend context for this ticker
-        ticker_df = signal_service.fetch_ohlcv(report.ticker, start=start)
-        if ticker_df is not None and not ticker_df.empty:
-            ticker_df = signal_service.add_indicators(ticker_df, spy_df)
-            trend_data = signal_service.analyze_trend_context(ticker_df, spy_df)
+        # Analyze trend context for this ticker (1차 루프에서 계산한 지표 재사용)
+        if not market.indicators(report.ticker).empty:
+            trend_data = market.trend_context(report.ticker)
 
             # ✅ Calculate intraday metrics
-            intraday_metrics = signal_service.calculate_intraday_metrics(ticker_df)
+            intraday_metrics = market.intraday_metrics(report.ticker)
 
             # ✅ Calculate historical context
-            historical_context = signal_service.calculate_historical_context(ticker_df)
+            historical_context = market.historical_context(report.ticker)
         else:
             trend_data = signal_service._get_default_trend_context()
             intraday_metrics = None
@@ -435,7 +426,10 @@ async def get_signals(
 
         data = SignalPromptData(
             ticker=report.ticker,
-            dataframe=report.dataframe,
+            # 트리거된 전략의 지표 컬럼 위주로 토큰 예산 안에서 압축
+            dataframe=encode_indicator_frame(
+                market.indicators(report.ticker), triggered_strategies
+            ),
             last_price=report.last_price or 0.0,
             price_change_pct=report.price_change_pct or 0.0,
             triggered_strategies=triggered_strategies,
@@ -14,9 +14,9 @@ from myapi.containers import Container
 from myapi.domain.ticker.ticker_reference_schema import (
     TickerReferenceLookupResponse,
 )
-from myapi.domain.signal.signal_schema import DefaultTickers, GetSignalRequest
+from myapi.domain.signal.signal_schema import DefaultTickers
 from myapi.domain.ticker.ticker_schema import (
-    SignalAccuracyResponse,
+    SignalAccuracySummary,
     TickerCreate,
     TickerLatestWithChangeResponse,
     TickerOrderBy,
@@ -296,37 +296,30 @@ def update_ticker_informations(
         )
 
 
-@router.get("/signals", response_model=List[SignalAccuracyResponse])
+@router.get("/signals", response_model=List[SignalAccuracySummary])
 @inject
-def get_signal_accuracy(
+async def get_signal_accuracy(
+    tickers: Optional[str] = Query(
+        None, description="쉼표로 구분된 티커 목록 (없으면 전체)"
+    ),
+    strategy: Optional[str] = None,
+    ai_model: Optional[str] = None,
     db_signal_service: DBSignalService = Depends(
         Provide[Container.services.db_signal_service]
     ),
-    ticker_service: TickerService = Depends(Provide[Container.services.ticker_service]),
 ):
     """
-    주어진 티커들의 시그널 예측 정확도를 평가합니다.
+    시그널 예측 정확도를 ticker / strategy / ai_model 별로 집계합니다.
+    (signal_outcomes 테이블 기준, 새 거래일 봉이 있으면 미확정 시그널만 증분 평가)
     """
-    try:
-        # 기본 티커 목록 가져오기
-        tickers = DefaultTickers
-
-        if not tickers:
-            raise HTTPException(status_code=404, detail="등록된 티커가 없습니다")
-
-        # 시그널 정확도 조회
-        _signals = db_signal_service.get_all_signals(
-            GetSignalRequest()
-        )  # 사용하지 않으므로 _로 표시
-        _tickers = ticker_service.get_all_tickers()  # 사용하지 않으므로 _로 표시
-
-        # TODO: 실제 시그널 정확도 계산 로직 구현 필요
-        return []
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"시그널 정확도 조회 중 오류 발생: {str(e)}"
-        )
+    ticker_list = (
+        [t.strip().upper() for t in tickers.split(",") if t.strip()]
+        if tickers
+        else None
+    )
+    return await db_signal_service.get_signal_accuracy(
+        tickers=ticker_list, strategy=strategy, ai_model=ai_model
+    )
 
 
 @router.get("/weekly/price-movement")
@@ -1,18 +1,23 @@
 # services/ai_service.py
 from typing import Any, Dict, Literal, Optional, Type, TypeVar
-import boto3
-from botocore.exceptions import ClientError
 from fastapi import HTTPException
-import openai
 import json
 import logging
 
 from pydantic import BaseModel
 
 from myapi.domain.ai.ai_schema import ChatModel
+from myapi.utils.api_key_pool import get_api_key_pool
 from myapi.utils.config import Settings
-from google import genai
-from google.genai.types import Tool, GenerateContentConfig, GoogleSearch
+from myapi.utils.lazy_import import lazy_import
+from myapi.utils.llm_cache import get_llm_response_cache
+from myapi.utils.llm_metrics import track_llm_call
+from myapi.utils.sdk_clients import boto3_client, genai_client, openai_client
+from myapi.utils.structured_output import (
+    json_schema_response_format,
+    parse_structured_output,
+    record_structured_output,
+)
 
 from myapi.repositories.api_key_repository import ApiKeyRepository
 
@@ -20,6 +25,12 @@ T = TypeVar("T", bound=BaseModel)
 
 logger = logging.getLogger(__name__)
 
+# SDK import 비용이 커서 (google.genai ~2s) 실제 호출 시점에 import
+botocore_exceptions = lazy_import("botocore.exceptions")
+genai_types = lazy_import("google.genai.types")
+
+GEMINI_SEARCH_MODEL = "gemini-2.5-flash-preview-09-2025"
+
 
 class AIService:
     def __init__(
@@ -63,11 +74,10 @@ class AIService:
             return (None, None)
 
         try:
-            key_record = self.api_key_repository.get_available_key(provider)
-
-            if key_record:
-                decrypted = self.encryption.decrypt(str(key_record.api_key_encrypted))
-                return (decrypted, int(key_record.id.real))
+            # 복호화된 키와 오늘 사용량은 프로세스 단위 풀에 캐시
+            return get_api_key_pool().acquire(
+                provider, self.api_key_repository, self.encryption
+            )
 
         except Exception as e:
             logger.warning(f"Failed to get {provider} key from DB: {e}")
@@ -84,7 +94,8 @@ class AIService:
         """
         if key_id and self.api_key_repository:
             try:
-                self.api_key_repository.increment_usage(key_id)
+                # 메모리에서 집계 후 일정 건수/시간마다 한 번에 DB 반영
+                get_api_key_pool().record_usage(key_id, self.api_key_repository)
             except Exception as e:
                 logger.error(f"Failed to track usage for key {key_id}: {e}")
 
@@ -96,8 +107,36 @@ class AIService:
         schema: Type[T],
         model: ChatModel | None = None,
         max_tokens: int | None = 1024,
+        structured_output: bool = True,
+    ):
+        """
+        Perplexity 검색 결과를 schema로 반환합니다.
+
+        structured_output=True이면 Perplexity에 JSON schema 응답을 요청하고 로컬에서 검증하며,
+        검증에 실패한 경우에만 completions_parse로 한 번 더 변환(repair)합니다.
+        """
+        cache = get_llm_response_cache()
+        key = cache.make_key(
+            "PERPLEXITY", model or ChatModel.SONAR_PRO, schema, prompt, str(max_tokens)
+        )
+        return cache.cached(
+            "PERPLEXITY",
+            key,
+            schema,
+            lambda: self._perplexity_completion(
+                prompt, schema, model, max_tokens, structured_output
+            ),
+        )
+
+    def _perplexity_completion(
+        self,
+        prompt: str,
+        schema: Type[T],
+        model: ChatModel | None = None,
+        max_tokens: int | None = 1024,
+        structured_output: bool = True,
     ):
-        client = openai.OpenAI(
+        client = openai_client(
             base_url="https://api.perplexity.ai", api_key=self.perplexity_api_key
         )
 
@@ -110,11 +149,25 @@ class AIService:
         }
         if max_tokens is not None:
             create_kwargs["max_tokens"] = max_tokens
+        if structured_output:
+            create_kwargs["response_format"] = json_schema_response_format(schema)
 
-        response = client.chat.completions.create(**create_kwargs)
+        with track_llm_call("PERPLEXITY", model, "perplexity_completion") as call:
+            response = client.chat.completions.create(**create_kwargs)
+            call.observe(response)
 
         result = response.choices[0].message
 
+        if structured_output:
+            parsed = parse_structured_output(result.content, schema)
+            if parsed is not None:
+                record_structured_output("direct")
+                return parsed
+            record_structured_output("repaired")
+            logger.info(
+                f"Perplexity output failed {schema.__name__} validation, repairing"
+            )
+
         response = self.completions_parse(
             prompt=f"{result.content}\n\nPlease return the result in JSON format.",
             schema=schema,
@@ -133,20 +186,24 @@ class AIService:
         Hyperbolic API를 이용해 시장 분석 후 매매 결정을 받아옵니다.
         결과는 아래 JSON 스키마 형식으로 반환됩니다:
         """
-        client = openai.OpenAI(
+        client = openai_client(
             base_url="https://api.hyperbolic.xyz/v1",
             api_key=self.hyperbolic_api_key,
         )
 
-        response = client.chat.completions.create(
-            model="meta-llama/Meta-Llama-3-70B-Instruct",
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt,
-                },
-            ],
-        )
+        with track_llm_call(
+            "HYPERBOLIC", "meta-llama/Meta-Llama-3-70B-Instruct", "hyperbolic_completion"
+        ) as call:
+            response = client.chat.completions.create(
+                model="meta-llama/Meta-Llama-3-70B-Instruct",
+                messages=[
+                    {
+                        "role": "user",
+                        "content": prompt,
+                    },
+                ],
+            )
+            call.observe(response)
 
         return response.choices[0].message
 
@@ -155,20 +212,24 @@ class AIService:
         Hugging Face API를 이용해 시장 분석 후 매매 결정을 받아옵니다.
         결과는 아래 JSON 스키마 형식으로 반환됩니다:
         """
-        client = openai.OpenAI(
+        client = openai_client(
             base_url="https://router.huggingface.co/hf-inference/models/meta-llama/Llama-3.3-70B-Instruct/v1",
             api_key=self.huggingface_api_key,
         )
 
-        completion = client.chat.completions.create(
-            model="meta-llama/Llama-3.3-70B-Instruct",
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt,
-                },
-            ],
-        )
+        with track_llm_call(
+            "HUGGINGFACE", "meta-llama/Llama-3.3-70B-Instruct", "hugging_face_completion"
+        ) as call:
+            completion = client.chat.completions.create(
+                model="meta-llama/Llama-3.3-70B-Instruct",
+                messages=[
+                    {
+                        "role": "user",
+                        "content": prompt,
+                    },
+                ],
+            )
+            call.observe(completion)
 
         return completion.choices[0].message
 
@@ -182,7 +243,7 @@ class AIService:
     def nova_lite_with_tokens(self, prompt: str, max_tokens: int = 5120):
         """Call AWS Bedrock Nova Lite model with custom max_tokens."""
         try:
-            client = boto3.client(
+            client = boto3_client(
                 service_name="bedrock-runtime",
                 region_name="ap-northeast-2",
             )
@@ -197,27 +258,31 @@ class AIService:
 
             try:
                 # Bedrock 모델 호출
-                response = client.converse(
-                    modelId=model_id,
-                    messages=conversation,
-                    inferenceConfig={
-                        "maxTokens": max_tokens,
-                        "temperature": 0.2,
-                    },
-                )
-            except ClientError as e:
+                with track_llm_call("BEDROCK", model_id, "nova_lite") as call:
+                    response = client.converse(
+                        modelId=model_id,
+                        messages=conversation,
+                        inferenceConfig={
+                            "maxTokens": max_tokens,
+                            "temperature": 0.2,
+                        },
+                    )
+                    call.observe(response)
+            except botocore_exceptions.ClientError as e:
                 error_code = e.response["Error"]["Code"]
                 if error_code == "ValidationException":
                     # 모델 ID가 잘못된 경우 대체 모델 시도
                     try:
-                        response = client.converse(
-                            modelId=model_id,
-                            messages=conversation,
-                            inferenceConfig={
-                                "maxTokens": max_tokens,
-                                "temperature": 0.2,
-                            },
-                        )
+                        with track_llm_call("BEDROCK", model_id, "nova_lite") as call:
+                            response = client.converse(
+                                modelId=model_id,
+                                messages=conversation,
+                                inferenceConfig={
+                                    "maxTokens": max_tokens,
+                                    "temperature": 0.2,
+                                },
+                            )
+                            call.observe(response)
                     except Exception:
                         raise HTTPException(
                             status_code=404,
@@ -257,9 +322,9 @@ class AIService:
         """Call AWS Bedrock Nova Lite model using AWS Boto3 Bedrock client."""
         try:
             # Bedrock Runtime 클라이언트 생성
-            client = boto3.client(
+            client = boto3_client(
                 service_name="bedrock-runtime",
-                region_name="ap-northeast-2",  # AWS 리전을 적절히 설정하세요
+                region_name="ap-northeast-2",
             )
             model_id = "apac.amazon.nova-lite-v1:0"
 
@@ -277,12 +342,16 @@ class AIService:
 
             try:
                 # Bedrock 모델 호출
-                response = client.converse(
-                    modelId=model_id,
-                    messages=conversation,
-                    inferenceConfig={"maxTokens": 8192},
-                )
-            except (ClientError, Exception) as e:
+                with track_llm_call(
+                    "BEDROCK", model_id, "nova_lite_completion"
+                ) as call:
+                    response = client.converse(
+                        modelId=model_id,
+                        messages=conversation,
+                        inferenceConfig={"maxTokens": 8192},
+                    )
+                    call.observe(response)
+            except (botocore_exceptions.ClientError, Exception) as e:
                 raise HTTPException(
                     status_code=404,
                     detail=f"Model not found: {e}",
@@ -319,23 +388,43 @@ class AIService:
         self,
         prompt: str,
         schema: Type[T],
+    ):
+        cache = get_llm_response_cache()
+        key = cache.make_key("GEMINI", GEMINI_SEARCH_MODEL, schema, prompt)
+        return cache.cached(
+            "GEMINI",
+            key,
+            schema,
+            lambda: self._gemini_search_grounding(prompt, schema),
+        )
+
+    def _gemini_search_grounding(
+        self,
+        prompt: str,
+        schema: Type[T],
     ):
         # Get API key from DB or fallback to environment variable
         db_key, key_id = self._get_api_key_from_db("GEMINI")
         api_key = db_key or self.gemini_api_key
 
         try:
-            client = genai.Client(api_key=api_key)
-
-            google_search_tool = Tool(google_search=GoogleSearch())
-            response = client.models.generate_content(
-                model="gemini-2.5-flash-preview-09-2025",
-                contents=prompt,
-                config=GenerateContentConfig(  # type: ignore[call-arg]
-                    tools=[google_search_tool],
-                    response_modalities=["TEXT"],
-                ),
+            client = genai_client(api_key)
+
+            google_search_tool = genai_types.Tool(
+                google_search=genai_types.GoogleSearch()
             )
+            with track_llm_call(
+                "GEMINI", GEMINI_SEARCH_MODEL, "gemini_search_grounding"
+            ) as call:
+                response = client.models.generate_content(
+                    model=GEMINI_SEARCH_MODEL,
+                    contents=prompt,
+                    config=genai_types.GenerateContentConfig(  # type: ignore[call-arg]
+                        tools=[google_search_tool],
+                        response_modalities=["TEXT"],
+                    ),
+                )
+                call.observe(response)
 
             # Track usage on success
             self._track_usage(key_id)
@@ -383,15 +472,19 @@ class AIService:
         api_key = db_key or self.gemini_api_key
 
         try:
-            client = genai.Client(api_key=api_key)
-            response = client.models.generate_content(
-                model="gemini-2.5-flash-preview-09-2025",
-                contents=prompt,
-                config={
-                    "response_mime_type": "application/json",
-                    "response_schema": schema,
-                },
-            )
+            client = genai_client(api_key)
+            with track_llm_call(
+                "GEMINI", "gemini-2.5-flash-preview-09-2025", "gemini_completion"
+            ) as call:
+                response = client.models.generate_content(
+                    model="gemini-2.5-flash-preview-09-2025",
+                    contents=prompt,
+                    config={
+                        "response_mime_type": "application/json",
+                        "response_schema": schema,
+                    },
+                )
+                call.observe(response)
 
             # Track usage on success
             self._track_usage(key_id)
@@ -429,23 +522,23 @@ class AIService:
         2. Also provide risk management note (e.g., possible stop-loss area or caution points).
         """
 
-        client = openai.OpenAI(
-            api_key=self.open_api_key,  # This is the default and can be omitted
-        )
+        client = openai_client(api_key=self.open_api_key)
 
         try:
-            response = client.beta.chat.completions.parse(
-                model="o3-mini",
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    },
-                ],
-                frequency_penalty=0.0,  # 반복 억제 정도
-                presence_penalty=0.0,  # 새로운 주제 도입 억제
-                # response_format=,
-            )
+            with track_llm_call("OPENAI", "o3-mini", "analyze_grid") as call:
+                response = client.beta.chat.completions.parse(
+                    model="o3-mini",
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": prompt,
+                        },
+                    ],
+                    frequency_penalty=0.0,  # 반복 억제 정도
+                    presence_penalty=0.0,  # 새로운 주제 도입 억제
+                    # response_format=,
+                )
+                call.observe(response)
             # response.choices[0].message.content
             content = response.choices[0].message.parsed
 
@@ -494,19 +587,21 @@ class AIService:
         {json.dumps(schema_dict, ensure_ascii=False, indent=2)}
         """
 
-        client = openai.OpenAI(
-            api_key=self.open_api_key,
-        )
+        client = openai_client(api_key=self.open_api_key)
 
-        response = client.beta.chat.completions.parse(
-            model="gpt-5-mini",
-            messages=[{"role": "user", "content": prompt}],
-            response_format=schema,
-            top_p=1.0,
-            max_tokens=1024,
-            frequency_penalty=0.0,
-            presence_penalty=0.0,
-        )
+        with track_llm_call(
+            "OPENAI", "gpt-5-mini", "transform_message_to_schema"
+        ) as call:
+            response = client.beta.chat.completions.parse(
+                model="gpt-5-mini",
+                messages=[{"role": "user", "content": prompt}],
+                response_format=schema,
+                top_p=1.0,
+                max_tokens=1024,
+                frequency_penalty=0.0,
+                presence_penalty=0.0,
+            )
+            call.observe(response)
 
         result_str = response.choices[0].message.parsed
 
@@ -524,35 +619,35 @@ class AIService:
         """ """
         # Pydantic 모델 클래스에서 JSON 스키마 정보를 가져옵니다.
 
-        client = openai.OpenAI(
-            api_key=self.open_api_key,
-        )
+        client = openai_client(api_key=self.open_api_key)
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": prompt,
-                        },
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": image_path,
+        with track_llm_call("OPENAI", "gpt-4o-mini", "analzye_image") as call:
+            response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "user",
+                        "content": [
+                            {
+                                "type": "text",
+                                "text": prompt,
                             },
-                        },
-                    ],
-                }
-            ],
-            temperature=0.2,
-            top_p=1.0,
-            max_tokens=1024,
-            frequency_penalty=0.0,
-            presence_penalty=0.0,
-        )
+                            {
+                                "type": "image_url",
+                                "image_url": {
+                                    "url": image_path,
+                                },
+                            },
+                        ],
+                    }
+                ],
+                temperature=0.2,
+                top_p=1.0,
+                max_tokens=1024,
+                frequency_penalty=0.0,
+                presence_penalty=0.0,
+            )
+            call.observe(response)
 
         result_str = response.choices[0].message.content
 
@@ -573,6 +668,27 @@ class AIService:
         image_url: Optional[str],
         schema: Type[T],
         chat_model: ChatModel = ChatModel.O4_MINI,
+    ) -> T:
+        cache = get_llm_response_cache()
+        key = cache.make_key(
+            "OPENAI", chat_model, schema, system_prompt, prompt, image_url
+        )
+        return cache.cached(
+            "OPENAI",
+            key,
+            schema,
+            lambda: self._completions_parse(
+                system_prompt, prompt, image_url, schema, chat_model
+            ),
+        )
+
+    def _completions_parse(
+        self,
+        system_prompt: str,
+        prompt: str,
+        image_url: Optional[str],
+        schema: Type[T],
+        chat_model: ChatModel = ChatModel.O4_MINI,
     ) -> T:
         """
         Transforms a message from the OpenAI API into an instance of the specified BaseModel schema.
@@ -581,9 +697,7 @@ class AIService:
         db_key, key_id = self._get_api_key_from_db("OPENAI")
         api_key = db_key or self.open_api_key
 
-        client = openai.OpenAI(
-            api_key=api_key,
-        )
+        client = openai_client(api_key=api_key)
 
         user_content: Any = [
             {
@@ -602,19 +716,21 @@ class AIService:
                 },
             )
 
-        response = client.beta.chat.completions.parse(
-            model=chat_model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {
-                    "role": "user",
-                    "content": user_content,
-                },
-            ],
-            response_format=schema,
-            frequency_penalty=0.0,  # 반복 억제 정도
-            presence_penalty=0.0,  # 새로운 주제 도입 억제
-        )
+        with track_llm_call("OPENAI", chat_model, "completions_parse") as call:
+            response = client.beta.chat.completions.parse(
+                model=chat_model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {
+                        "role": "user",
+                        "content": user_content,
+                    },
+                ],
+                response_format=schema,
+                frequency_penalty=0.0,  # 반복 억제 정도
+                presence_penalty=0.0,  # 새로운 주제 도입 억제
+            )
+            call.observe(response)
 
         result_str = response.choices[0].message.parsed
 
@@ -636,25 +752,40 @@ class AIService:
         system_prompt: str,
         prompt: str,
         chat_model: ChatModel = ChatModel.O3_MINI,
+    ):
+        cache = get_llm_response_cache()
+        key = cache.make_key("OPENAI", chat_model, None, system_prompt, prompt)
+        return cache.cached(
+            "OPENAI",
+            key,
+            None,
+            lambda: self._completion(system_prompt, prompt, chat_model),
+        )
+
+    def _completion(
+        self,
+        system_prompt: str,
+        prompt: str,
+        chat_model: ChatModel = ChatModel.O3_MINI,
     ):
         """
         OpenAI API를 이용해 시장 분석 후 매매 결정을 받아옵니다.
         결과는 아래 JSON 스키마 형식으로 반환됩니다:
         """
-        client = openai.OpenAI(
-            api_key=self.open_api_key,  # This is the default and can be omitted
-        )
+        client = openai_client(api_key=self.open_api_key)
 
-        response = client.chat.completions.create(
-            model=chat_model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {
-                    "role": "user",
-                    "content": prompt,
-                },
-            ],
-            top_p=1.0,
-        )
+        with track_llm_call("OPENAI", chat_model, "completion") as call:
+            response = client.chat.completions.create(
+                model=chat_model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {
+                        "role": "user",
+                        "content": prompt,
+                    },
+                ],
+                top_p=1.0,
+            )
+            call.observe(response)
 
         return response.choices[0].message.content
@@ -0,0 +1,317 @@
+# services/async_ai_service.py
+import asyncio
+import logging
+import weakref
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Literal,
+    Optional,
+    Type,
+    TypeVar,
+)
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from myapi.domain.ai.ai_schema import ChatModel
+from myapi.services.ai_service import GEMINI_SEARCH_MODEL, AIService, genai_types
+from myapi.utils.llm_cache import get_llm_response_cache
+from myapi.utils.llm_metrics import track_llm_call
+from myapi.utils.sdk_clients import async_genai_client, async_openai_client
+from myapi.utils.structured_output import (
+    json_schema_response_format,
+    parse_structured_output,
+    record_structured_output,
+)
+
+T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
+
+logger = logging.getLogger(__name__)
+
+Provider = Literal["PERPLEXITY", "GEMINI", "OPENAI"]
+
+# 프로세스 전체에서 공급자별 동시 호출 수 / 호출당 제한 시간(초)
+PROVIDER_CONCURRENCY: Dict[Provider, int] = {
+    "PERPLEXITY": 4,
+    "GEMINI": 4,
+    "OPENAI": 8,
+}
+PROVIDER_TIMEOUT: Dict[Provider, float] = {
+    "PERPLEXITY": 120.0,
+    "GEMINI": 120.0,
+    "OPENAI": 120.0,
+}
+
+# asyncio.Semaphore는 처음 사용한 이벤트 루프에 묶이므로 루프별로 보관
+_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _semaphore(provider: Provider) -> asyncio.Semaphore:
+    per_loop = _semaphores.setdefault(asyncio.get_running_loop(), {})
+    if provider not in per_loop:
+        per_loop[provider] = asyncio.Semaphore(PROVIDER_CONCURRENCY[provider])
+    return per_loop[provider]
+
+
+class AsyncAIService:
+    """
+    AIService의 비동기 버전.
+
+    async 라우터에서 LLM 호출이 이벤트 루프를 막지 않도록 AsyncOpenAI / genai aio 클라이언트를
+    사용하고, 공급자별 세마포어와 타임아웃으로 동시 호출 수와 대기 시간을 제한합니다.
+    API 키 조회와 사용량 기록은 AIService를 그대로 사용합니다.
+    """
+
+    def __init__(self, ai_service: AIService) -> None:
+        self.ai_service = ai_service
+
+    async def _call(
+        self,
+        provider: Provider,
+        model: Any,
+        entry: str,
+        call: Callable[[], Awaitable[R]],
+    ) -> R:
+        timeout = PROVIDER_TIMEOUT[provider]
+        async with _semaphore(provider):
+            try:
+                with track_llm_call(provider, model, entry) as tracked:
+                    response = await asyncio.wait_for(call(), timeout=timeout)
+                    return tracked.observe(response)
+            except asyncio.TimeoutError:
+                logger.warning(f"{provider} call timed out after {timeout}s")
+                raise HTTPException(
+                    status_code=504,
+                    detail=f"{provider} service timed out after {timeout}s",
+                )
+
+    async def perplexity_completion(
+        self,
+        prompt: str,
+        schema: Type[T],
+        model: ChatModel | None = None,
+        max_tokens: int | None = 1024,
+        structured_output: bool = True,
+    ):
+        cache = get_llm_response_cache()
+        key = cache.make_key(
+            "PERPLEXITY", model or ChatModel.SONAR_PRO, schema, prompt, str(max_tokens)
+        )
+        return await cache.acached(
+            "PERPLEXITY",
+            key,
+            schema,
+            lambda: self._perplexity_completion(
+                prompt, schema, model, max_tokens, structured_output
+            ),
+        )
+
+    async def _perplexity_completion(
+        self,
+        prompt: str,
+        schema: Type[T],
+        model: ChatModel | None = None,
+        max_tokens: int | None = 1024,
+        structured_output: bool = True,
+    ):
+        client = async_openai_client(
+            base_url="https://api.perplexity.ai",
+            api_key=self.ai_service.perplexity_api_key,
+        )
+
+        if model is None:
+            model = ChatModel.SONAR_PRO
+
+        create_kwargs: Dict[str, Any] = {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        if max_tokens is not None:
+            create_kwargs["max_tokens"] = max_tokens
+        if structured_output:
+            create_kwargs["response_format"] = json_schema_response_format(schema)
+
+        response = await self._call(
+            "PERPLEXITY",
+            model,
+            "perplexity_completion",
+            lambda: client.chat.completions.create(**create_kwargs),
+        )
+
+        result = response.choices[0].message
+
+        if structured_output:
+            parsed = parse_structured_output(result.content, schema)
+            if parsed is not None:
+                record_structured_output("direct")
+                return parsed
+            record_structured_output("repaired")
+            logger.info(
+                f"Perplexity output failed {schema.__name__} validation, repairing"
+            )
+
+        return await self.completions_parse(
+            prompt=f"{result.content}\n\nPlease return the result in JSON format.",
+            schema=schema,
+            system_prompt="You are a helpful assistant Return the result in JSON format.",
+            chat_model=ChatModel.GPT_5_MINI,
+            image_url=None,
+        )
+
+    async def gemini_search_grounding(
+        self,
+        prompt: str,
+        schema: Type[T],
+    ):
+        cache = get_llm_response_cache()
+        key = cache.make_key("GEMINI", GEMINI_SEARCH_MODEL, schema, prompt)
+        return await cache.acached(
+            "GEMINI",
+            key,
+            schema,
+            lambda: self._gemini_search_grounding(prompt, schema),
+        )
+
+    async def _gemini_search_grounding(
+        self,
+        prompt: str,
+        schema: Type[T],
+    ):
+        db_key, key_id = self.ai_service._get_api_key_from_db("GEMINI")
+        api_key = db_key or self.ai_service.gemini_api_key
+
+        try:
+            client = async_genai_client(api_key)
+
+            google_search_tool = genai_types.Tool(
+                google_search=genai_types.GoogleSearch()
+            )
+            response = await self._call(
+                "GEMINI",
+                GEMINI_SEARCH_MODEL,
+                "gemini_search_grounding",
+                lambda: client.models.generate_content(
+                    model=GEMINI_SEARCH_MODEL,
+                    contents=prompt,
+                    config=genai_types.GenerateContentConfig(  # type: ignore[call-arg]
+                        tools=[google_search_tool],
+                        response_modalities=["TEXT"],
+                    ),
+                ),
+            )
+
+            self.ai_service._track_usage(key_id)
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=503, detail=f"Gemini service error: {e}")
+
+        result = ""
+
+        if (
+            response.candidates
+            and response.candidates[0].content
+            and hasattr(response.candidates[0].content, "parts")
+        ):
+            if response.candidates[0].content.parts:
+                for each in response.candidates[0].content.parts:
+                    if each.text is not None:
+                        result += each.text
+
+        parsed = await self.completions_parse(
+            prompt="" + result + "\n\nPlease return the result in JSON format.",
+            schema=schema,
+            system_prompt="You are a helpful assistant. Return the result in JSON format.",
+            chat_model=ChatModel.GPT_5_MINI,
+            image_url=None,
+        )
+
+        # Return Type Only Schema
+        if not isinstance(parsed, schema):
+            return ""
+
+        return parsed
+
+    async def completions_parse(
+        self,
+        system_prompt: str,
+        prompt: str,
+        image_url: Optional[str],
+        schema: Type[T],
+        chat_model: ChatModel = ChatModel.O4_MINI,
+    ) -> T:
+        cache = get_llm_response_cache()
+        key = cache.make_key(
+            "OPENAI", chat_model, schema, system_prompt, prompt, image_url
+        )
+        return await cache.acached(
+            "OPENAI",
+            key,
+            schema,
+            lambda: self._completions_parse(
+                system_prompt, prompt, image_url, schema, chat_model
+            ),
+        )
+
+    async def _completions_parse(
+        self,
+        system_prompt: str,
+        prompt: str,
+        image_url: Optional[str],
+        schema: Type[T],
+        chat_model: ChatModel = ChatModel.O4_MINI,
+    ) -> T:
+        db_key, key_id = self.ai_service._get_api_key_from_db("OPENAI")
+        api_key = db_key or self.ai_service.open_api_key
+
+        client = async_openai_client(api_key=api_key)
+
+        user_content: Any = [
+            {
+                "type": "text",
+                "text": prompt,
+            }
+        ]
+
+        if image_url:
+            user_content.append(
+                {
+                    "type": "image_url",
+                    "image_url": {
+                        "url": image_url,
+                    },
+                },
+            )
+
+        response = await self._call(
+            "OPENAI",
+            chat_model,
+            "completions_parse",
+            lambda: client.beta.chat.completions.parse(
+                model=chat_model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {
+                        "role": "user",
+                        "content": user_content,
+                    },
+                ],
+                response_format=schema,
+                frequency_penalty=0.0,
+                presence_penalty=0.0,
+            ),
+        )
+
+        parsed = response.choices[0].message.parsed
+
+        if not parsed:
+            raise ValueError("The response is empty. Please provide a valid response.")
+
+        self.ai_service._track_usage(key_id)
+
+        return parsed
@@ -1,16 +1,16 @@
 import os
 from typing import Any, Literal, Optional
 from fastapi import HTTPException
-import boto3
 import json
 
 from myapi.utils.config import Settings
+from myapi.utils.sdk_clients import boto3_client
 from myapi.utils.indicators import plot_with_indicators
 
 # AWS Secrets Manager 설정 (여러분의 환경에 맞게 수정)
 SECRET_NAME = "kakao/tokens"  # 예: "kakao/tokens"
 REGION_NAME = "ap-northeast-2"  # 예: "ap-northeast-2"
-# boto3 클라이언트 생성
+# boto3 클라이언트는 sdk_clients에서 프로세스 단위로 재사용
 
 
 class AwsService:
@@ -25,14 +25,14 @@ class AwsService:
         """
 
         if self.aws_access_key_id and self.aws_secret_access_key:
-            client = boto3.client(
+            client = boto3_client(
                 "secretsmanager",
                 region_name=REGION_NAME,
                 aws_access_key_id=self.aws_access_key_id,
                 aws_secret_access_key=self.aws_secret_access_key,
             )
         else:
-            client = boto3.client(
+            client = boto3_client(
                 "secretsmanager",
                 region_name=REGION_NAME,
             )
@@ -59,14 +59,14 @@ class AwsService:
         try:
 
             if self.aws_access_key_id and self.aws_secret_access_key:
-                client = boto3.client(
+                client = boto3_client(
                     "secretsmanager",
                     region_name=REGION_NAME,
                     aws_access_key_id=self.aws_access_key_id,
                     aws_secret_access_key=self.aws_secret_access_key,
                 )
             else:
-                client = boto3.client(
+                client = boto3_client(
                     "secretsmanager",
                     region_name=REGION_NAME,
                 )
@@ -83,7 +83,7 @@ class AwsService:
     def upload_s3(
         self, bucket_name: str, object_key: str, fileobj: Any, content_type: str
     ):
-        s3 = boto3.client(
+        s3 = boto3_client(
             "s3",
             region_name=REGION_NAME,
             aws_access_key_id=self.aws_access_key_id,
@@ -119,7 +119,7 @@ class AwsService:
             HTTPException: SQS 메시지 전송 중 오류 발생 시
         """
         try:
-            sqs = boto3.client(
+            sqs = boto3_client(
                 "sqs",
                 region_name=REGION_NAME,
                 aws_access_key_id=self.aws_access_key_id,
@@ -168,7 +168,7 @@ class AwsService:
             HTTPException: SQS 메시지 전송 중 오류 발생 시
         """
         try:
-            sqs = boto3.client(
+            sqs = boto3_client(
                 "sqs",
                 region_name=REGION_NAME,
                 aws_access_key_id=self.aws_access_key_id,
@@ -4,6 +4,12 @@ import logging
 from unittest import result
 from fastapi import HTTPException
 
+from myapi.domain.signal.signal_models import SignalOutcome, Signals
+from myapi.domain.ticker.ticker_schema import SignalAccuracySummary
+from myapi.repositories.signal_outcome_repository import (
+    Bar,
+    SignalOutcomeRepository,
+)
 from myapi.repositories.signals_repository import SignalsRepository
 from myapi.domain.signal.signal_schema import (
     GetSignalRequest,
@@ -16,14 +22,66 @@ from myapi.domain.signal.signal_schema import (
 from myapi.services.translate_service import TranslateService
 from myapi.utils.date_utils import get_current_kst_datetime
 
+# 목표가/손절가 도달을 추적하는 최대 거래일 수 (이후에는 결과 확정)
+SIGNAL_OUTCOME_HORIZON = 20
+
+
+def _advance_outcome(outcome: SignalOutcome, signal: Signals, bars: List[Bar]) -> None:
+    """
+    outcome.evaluated_until 이후의 봉으로 시그널 결과를 이어서 갱신합니다.
+    - 첫 봉: 다음 거래일 방향(시가 대비 종가)과 액션 일치 여부
+    - 매 봉: 목표가/손절가 도달 (같은 봉에서 둘 다 닿으면 보수적으로 손절로 간주)
+    """
+    action = (signal.action or "").lower()
+    for day, open_, high, low, close in bars:
+        if outcome.evaluated_until is not None and day <= outcome.evaluated_until:
+            continue
+
+        if not outcome.bars_evaluated:
+            if open_ and close:
+                direction = (
+                    "up" if close > open_ else "down" if close < open_ else "unchanged"
+                )
+                outcome.next_day_direction = direction
+                outcome.next_day_correct = (direction, action) in (
+                    ("up", "buy"),
+                    ("down", "sell"),
+                    ("unchanged", "hold"),
+                )
+
+        outcome.bars_evaluated = (outcome.bars_evaluated or 0) + 1
+        outcome.evaluated_until = day
+
+        if outcome.first_hit is None and action in ("buy", "sell") and high and low:
+            tp, sl = signal.take_profit, signal.stop_loss
+            if action == "buy":
+                hit_tp = tp is not None and high >= tp
+                hit_sl = sl is not None and low <= sl
+            else:
+                hit_tp = tp is not None and low <= tp
+                hit_sl = sl is not None and high >= sl
+            if hit_tp or hit_sl:
+                outcome.hit_take_profit = hit_tp
+                outcome.hit_stop_loss = hit_sl
+                outcome.first_hit = "stop_loss" if hit_sl else "take_profit"
+                outcome.first_hit_date = day
+
+        if outcome.first_hit or outcome.bars_evaluated >= SIGNAL_OUTCOME_HORIZON:
+            outcome.resolved = True
+            break
+
 
 class DBSignalService:
     def __init__(
-        self, repository: SignalsRepository, translate_service: TranslateService
+        self,
+        repository: SignalsRepository,
+        translate_service: TranslateService,
+        outcome_repository: Optional[SignalOutcomeRepository] = None,
     ):
         self.repository = repository
         self.logger = logging.getLogger(__name__)
         self.translate_service = translate_service
+        self.outcome_repository = outcome_repository
 
     async def create_signal(self, signal_data: SignalCreate) -> SignalBaseResponse:
         """
@@ -457,3 +515,118 @@ class DBSignalService:
             raise HTTPException(
                 status_code=500, detail=f"Failed to fetch action counts: {e}"
             )
+
+    def refresh_signal_outcomes(self) -> int:
+        """
+        새로 들어온 거래일 봉만큼 미확정 시그널의 결과를 갱신합니다.
+        이미 최신 봉까지 평가된 시그널은 조회 대상에서 빠지므로 같은 날 재호출은 거의 비용이 없습니다.
+
+        Returns:
+            갱신된 결과 행 수
+        """
+        if self.outcome_repository is None:
+            return 0
+
+        latest_bar_date = self.outcome_repository.get_latest_bar_date()
+        if latest_bar_date is None:
+            return 0
+
+        pending = self.outcome_repository.get_pending(latest_bar_date)
+        if not pending:
+            return 0
+
+        starts: Dict[str, date] = {}
+        for signal, outcome in pending:
+            start = (
+                outcome.evaluated_until + timedelta(days=1)
+                if outcome is not None and outcome.evaluated_until
+                else signal.timestamp.date()
+            )
+            starts[signal.ticker] = min(starts.get(signal.ticker, start), start)
+        bars_by_ticker = self.outcome_repository.get_bars_since(starts)
+
+        changed: List[SignalOutcome] = []
+        for signal, outcome in pending:
+            signal_date = signal.timestamp.date()
+            if outcome is None:
+                outcome = SignalOutcome(
+                    signal_id=signal.id,
+                    ticker=signal.ticker,
+                    strategy=signal.strategy,
+                    ai_model=signal.ai_model,
+                    action=signal.action,
+                    signal_date=signal_date,
+                    next_day_correct=False,
+                    hit_take_profit=False,
+                    hit_stop_loss=False,
+                    bars_evaluated=0,
+                    resolved=False,
+                )
+
+            bars = [
+                bar
+                for bar in bars_by_ticker.get(signal.ticker, [])
+                if bar[0] >= signal_date
+            ]
+            before = (outcome.evaluated_until, outcome.id)
+            _advance_outcome(outcome, signal, bars)
+
+            if (
+                not outcome.bars_evaluated
+                and (latest_bar_date - signal_date).days > SIGNAL_OUTCOME_HORIZON * 2
+            ):
+                # tickers 테이블에 시세가 없는 종목: 더 기다리지 않고 확정
+                outcome.resolved = True
+
+            if (outcome.evaluated_until, outcome.id) != before or outcome.resolved:
+                changed.append(outcome)
+
+        if changed:
+            self.outcome_repository.save_all(changed)
+        self.logger.info(
+            f"Signal outcomes refreshed: {len(changed)} of {len(pending)} pending signals"
+        )
+        return len(changed)
+
+    async def get_signal_accuracy(
+        self,
+        tickers: Optional[List[str]] = None,
+        strategy: Optional[str] = None,
+        ai_model: Optional[str] = None,
+    ) -> List[SignalAccuracySummary]:
+        """
+        signal_outcomes 테이블에서 ticker / strategy / ai_model 별 정확도를 집계합니다.
+        조회 전에 새 거래일 봉이 있으면 미확정 시그널만 증분 평가합니다.
+        """
+        if self.outcome_repository is None:
+            return []
+        try:
+            self.refresh_signal_outcomes()
+            rows = self.outcome_repository.get_accuracy(
+                tickers=tickers, strategy=strategy, ai_model=ai_model
+            )
+        except Exception as e:
+            self.logger.error(f"Error computing signal accuracy: {e}")
+            raise HTTPException(
+                status_code=500, detail=f"Failed to compute signal accuracy: {e}"
+            )
+
+        return [
+            SignalAccuracySummary(
+                ticker=row.ticker,
+                strategy=row.strategy,
+                ai_model=row.ai_model,
+                total_signals=row.total,
+                evaluated_signals=row.evaluated,
+                next_day_accuracy=(
+                    row.next_day_correct / row.evaluated if row.evaluated else None
+                ),
+                take_profit_hits=row.take_profit_hits or 0,
+                stop_loss_hits=row.stop_loss_hits or 0,
+                resolved_signals=row.resolved or 0,
+                take_profit_rate=(
+                    (row.take_profit_hits or 0) / row.resolved if row.resolved else None
+                ),
+            )
+            for row in rows
+        ]
@@ -0,0 +1,142 @@
+import logging
+from datetime import date
+from typing import Iterable, Literal, Optional
+
+import pandas as pd
+
+from myapi.domain.signal.signal_schema import HistoricalContext, IntradayMetrics
+from myapi.services.signal_service import (
+    MARKET_SNAPSHOT_OPTION_SYMBOLS,
+    SignalService,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class MarketDataContext:
+    """
+    스크리닝 파이프라인 1회 실행 동안 시세/지표/시장 스냅샷을 메모이즈합니다.
+
+    - raw: 티커별 일봉 OHLCV (fetch_ohlcv_many로 일괄 선조회)
+    - indicators: add_indicators와 같은 지표, 티커당 1회
+        - "incremental": 저장된 롤링 상태에서 새 봉만 계산
+        - "panel": prefetch 시점에 유니버스 전체를 [ticker, bar] 배열로 한 번에 계산
+    - vix / options: 거래일 단위 시장 스냅샷 (fetch_market_snapshot)
+    - trend / intraday / historical: 지표 프레임 기반 분석 결과
+    """
+
+    def __init__(
+        self,
+        signal_service: SignalService,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        benchmark: str = "SPY",
+        indicator_mode: Literal["incremental", "panel"] = "incremental",
+    ):
+        self.signal_service = signal_service
+        self.start = start
+        self.end = end
+        self.benchmark = benchmark
+        self.indicator_mode = indicator_mode
+
+        self._raw: dict[str, pd.DataFrame] = {}
+        self._indicators: dict[str, pd.DataFrame] = {}
+        self._trend: dict[str, dict] = {}
+        self._intraday: dict[str, IntradayMetrics] = {}
+        self._historical: dict[str, Optional[HistoricalContext]] = {}
+        self._options: dict[str, dict] = {}
+        self._vix: Optional[dict] = None
+
+    def prefetch(self, tickers: Iterable[str]) -> None:
+        """벤치마크와 tickers 중 아직 없는 종목을 한 번의 일괄 다운로드로 채웁니다."""
+        missing = [
+            t for t in dict.fromkeys([self.benchmark, *tickers]) if t not in self._raw
+        ]
+        if not missing:
+            return
+
+        frames = self.signal_service.fetch_ohlcv_many(
+            missing, start=self.start, end=self.end
+        )
+        for ticker in missing:
+            self._raw[ticker] = frames.get(ticker, pd.DataFrame())
+
+        if self.indicator_mode == "panel":
+            pending = {
+                t: self._raw[t]
+                for t in missing
+                if t not in self._indicators and not self._raw[t].empty
+            }
+            if pending:
+                self._indicators.update(
+                    self.signal_service.add_indicators_panel(
+                        pending, self.benchmark_df
+                    )
+                )
+
+    def raw(self, ticker: str) -> pd.DataFrame:
+        if ticker not in self._raw:
+            df = self.signal_service.fetch_ohlcv(ticker, start=self.start, end=self.end)
+            self._raw[ticker] = df if df is not None else pd.DataFrame()
+        return self._raw[ticker]
+
+    @property
+    def benchmark_df(self) -> pd.DataFrame:
+        return self.raw(self.benchmark)
+
+    def indicators(self, ticker: str) -> pd.DataFrame:
+        if ticker not in self._indicators:
+            df = self.raw(ticker)
+            if df.empty:
+                self._indicators[ticker] = df
+            else:
+                self._indicators[ticker] = (
+                    self.signal_service.add_indicators_incremental(
+                        ticker, df, self.benchmark_df
+                    )
+                )
+        return self._indicators[ticker]
+
+    def vix_data(self) -> dict:
+        if self._vix is None:
+            logger.info("Loading VIX market volatility snapshot...")
+            snapshot = self.signal_service.fetch_market_snapshot()
+            self._vix = snapshot["vix"]
+            self._options.update(snapshot["options"])
+        return self._vix
+
+    def options_data(self, symbol: str) -> dict:
+        if symbol not in self._options:
+            logger.info(f"Loading {symbol} options snapshot...")
+            snapshot = self.signal_service.fetch_market_snapshot(
+                symbols=(*MARKET_SNAPSHOT_OPTION_SYMBOLS, symbol)
+            )
+            self._vix = self._vix or snapshot["vix"]
+            self._options.update(snapshot["options"])
+        return self._options[symbol]
+
+    def trend_context(self, ticker: str) -> dict:
+        if ticker not in self._trend:
+            df = self.indicators(ticker)
+            self._trend[ticker] = (
+                self.signal_service.analyze_trend_context(df, self.benchmark_df)
+                if not df.empty
+                else self.signal_service._get_default_trend_context()
+            )
+        return self._trend[ticker]
+
+    def intraday_metrics(self, ticker: str) -> IntradayMetrics:
+        if ticker not in self._intraday:
+            self._intraday[ticker] = self.signal_service.calculate_intraday_metrics(
+                self.indicators(ticker)
+            )
+        return self._intraday[ticker]
+
+    def historical_context(self, ticker: str) -> Optional[HistoricalContext]:
+        if ticker not in self._historical:
+            self._historical[ticker] = (
+                self.signal_service.calculate_historical_context(
+                    self.indicators(ticker)
+                )
+            )
+        return self._historical[ticker]
@@ -18,6 +18,7 @@ from myapi.domain.research.research_schema import (
 )
 from myapi.repositories.web_search_repository import WebSearchResultRepository
 from myapi.services.ai_service import AIService
+from myapi.services.async_ai_service import AsyncAIService
 from myapi.services.translate_service import TranslateService
 from myapi.domain.ai.ai_schema import ChatModel
 
@@ -31,10 +32,12 @@ class ResearchService:
         self,
         websearch_repository: WebSearchResultRepository,
         ai_service: AIService,
+        async_ai_service: AsyncAIService,
         translate_service: TranslateService,
     ):
         self.websearch_repository = websearch_repository
         self.ai_service = ai_service
+        self.async_ai_service = async_ai_service
         self.translate_service = translate_service
 
     def _build_research_prompt(self, request: ResearchRequest) -> str:
@@ -187,7 +190,7 @@ class ResearchService:
         prompt = self._build_research_prompt(request)
 
         try:
-            response = self.ai_service.perplexity_completion(
+            response = await self.async_ai_service.perplexity_completion(
                 prompt=prompt,
                 schema=ResearchResponse,
             )
@@ -208,7 +211,7 @@ class ResearchService:
         prompt = self._build_sector_analysis_prompt(request.news_content)
 
         try:
-            response = self.ai_service.completions_parse(
+            response = await self.async_ai_service.completions_parse(
                 prompt=prompt,
                 schema=SectorAnalysisResponse,
                 system_prompt="You are an expert financial analyst. Analyze sector impacts and return results in JSON format.",
@@ -232,7 +235,7 @@ class ResearchService:
         prompt = self._build_leading_stocks_prompt(request.sectors)
 
         try:
-            response = self.ai_service.perplexity_completion(
+            response = await self.async_ai_service.perplexity_completion(
                 prompt=prompt,
                 schema=LeadingStockResponse,
             )
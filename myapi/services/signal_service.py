@@ -7,14 +7,14 @@ from pathlib import Path
 from io import BytesIO
 import logging
 import re
+import threading
 from tracemalloc import start
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, List, Literal, Optional, Sequence, Union, cast
 import aiohttp
-import cloudscraper
+import numpy as np
 import pandas as pd
-import pdfplumber
-import yfinance as yf
 
 NUMBA_CACHE_DIR = os.environ.setdefault("NUMBA_CACHE_DIR", "/tmp/numba_cache")
 try:
@@ -22,18 +22,33 @@ try:
 except OSError:
     pass
 
-import pandas_ta as ta
 import requests
 import datetime as dt
 
-from pandas_datareader import data as pdr
+from myapi.utils.lazy_import import lazy_import
 
 from myapi.repositories.signals_repository import SignalsRepository
 from myapi.repositories.web_search_repository import WebSearchResultRepository
 from myapi.services.translate_service import TranslateService
 from myapi.utils.config import Settings
+from myapi.utils.date_utils import US_MARKET_TZ, get_latest_market_date
+from myapi.utils.backtest import DEFAULT_HORIZONS, backtest_strategies
+from myapi.utils.disk_cache import JsonDiskCache
+from myapi.utils.incremental_indicators import IncrementalIndicatorEngine
+from myapi.utils.indicator_registry import (
+    compute_indicators,
+    relative_strength,
+    required_columns,
+)
 from myapi.utils.indicators import check_supertrend_signals
-from myapi.utils.yfinance_cache import configure_yfinance_cache, safe_get_ticker_info
+from myapi.utils.ohlcv_store import get_ohlcv_store, slice_by_date
+from myapi.utils.panel_indicators import compute_panel_indicators
+from myapi.utils.signal_history import evaluate_signals_history
+from myapi.utils.yfinance_cache import (
+    configure_yfinance_cache,
+    safe_get_ticker_info,
+    yf,
+)
 from myapi.domain.signal.signal_schema import (
     Article,
     SignalPromptData,
@@ -50,10 +65,30 @@ from myapi.domain.news.news_schema import (
 )
 from myapi.domain.news.news_models import WebSearchResult
 
+# 무거운 모듈은 실제로 쓰는 엔드포인트에서 처음 접근할 때 import (Lambda 콜드 스타트)
+ta = lazy_import("pandas_ta")
+pdfplumber = lazy_import("pdfplumber")
+cloudscraper = lazy_import("cloudscraper")
+pdr = lazy_import("pandas_datareader.data")
+
 logger = logging.getLogger(__name__)
 
 configure_yfinance_cache()
 
+# 펀더멘털은 실적 발표 때만 바뀌므로 다음 실적 발표일 기준으로 캐시
+FUNDAMENTALS_DEFAULT_TTL = timedelta(days=7)
+FUNDAMENTALS_MAX_TTL = timedelta(days=45)
+FUNDAMENTALS_REPORT_GRACE = timedelta(days=3)
+_fundamentals_cache = JsonDiskCache("fundamentals")
+_incremental_engine = IncrementalIndicatorEngine()
+
+# VIX/지수 옵션 스냅샷은 거래일 단위로 공유 (키에 market date 포함)
+MARKET_SNAPSHOT_OPTION_SYMBOLS = ("SPY", "QQQ")
+MARKET_SNAPSHOT_TTL = timedelta(days=4)
+_market_snapshot_cache = JsonDiskCache("market_snapshot")
+_market_snapshot_memo: dict[str, dict] = {}
+_market_snapshot_lock = threading.Lock()
+
 
 def _coerce_to_datetime(value: Any) -> Optional[datetime.datetime]:
     """Best-effort conversion of mixed index values into naive datetimes."""
@@ -133,17 +168,6 @@ def flatten_price_columns(df: pd.DataFrame, ticker: str | None = None) -> pd.Dat
     return df
 
 
-def _flatten_columns(frame: pd.DataFrame) -> pd.DataFrame:
-    """Ensure technical indicator outputs use single-level string column names."""
-    if isinstance(frame.columns, pd.MultiIndex):
-        frame = frame.copy()
-        frame.columns = [
-            "_".join([str(part) for part in parts if part not in (None, "")])
-            for parts in frame.columns.to_list()
-        ]
-    return frame
-
-
 class SignalService:
     @staticmethod
     def _first_present(data: Mapping[str, Any], keys: Sequence[str]) -> Any:
@@ -252,7 +276,7 @@ class SignalService:
             "close_sma20": round(float(last["Close"] / last["SMA20"]), 3) or None,
         }
 
-    def _latest_eps_surprise_pct(self, tk: yf.Ticker) -> float | None:
+    def _latest_eps_surprise_pct(self, hist: Any) -> float | None:
         """
         yfinance ≥0.2.31
         get_earnings_history() → [{'date': '2024-10-24', 'actual': 1.63,
@@ -260,10 +284,9 @@ class SignalService:
                                 'surprisePercent': 11.64}, ...]
         """
         try:
-            if tk.ticker is None or tk.ticker in ["QQQ", "SPY"]:
+            if hist is None:
                 return None
 
-            hist = tk.get_earnings_history()
             if isinstance(hist, pd.DataFrame):
                 if not hist.empty:
                     last = hist.iloc[0].to_dict()
@@ -281,12 +304,12 @@ class SignalService:
             pass
         return None
 
-    def _revenue_yoy_growth(self, tk: yf.Ticker) -> float | None:
+    def _revenue_yoy_growth(self, fin: Any) -> float | None:
         """
         최근 분기 매출(0번) vs 1년 전 동분기(4번) YoY %
+        :param fin: 분기 손익계산서 (get_income_stmt(freq="quarterly"), DataFrame 또는 dict)
         """
         try:
-            fin = tk.get_income_stmt(freq="quarterly")  # Could be DataFrame or dict
 
             # Handle DataFrame case (newer yfinance versions)
             if isinstance(fin, pd.DataFrame):
@@ -412,10 +435,8 @@ class SignalService:
 
         # 추가: ROE 계산
 
-    def _calculate_roe(self, tk: yf.Ticker) -> float | None:
+    def _calculate_roe(self, fin: Any, balance: Any) -> float | None:
         try:
-            fin = tk.get_income_stmt(freq="yearly")
-            balance = tk.get_balance_sheet(freq="yearly")
             if isinstance(fin, pd.DataFrame) and isinstance(balance, pd.DataFrame):
                 net_income = (
                     fin.loc["NetIncome"].iloc[0] if "NetIncome" in fin.index else None
@@ -442,9 +463,8 @@ class SignalService:
         return None
 
     # 추가: Debt-to-Equity Ratio 계산
-    def _calculate_debt_to_equity(self, tk: yf.Ticker) -> float | None:
+    def _calculate_debt_to_equity(self, balance: Any) -> float | None:
         try:
-            balance = tk.get_balance_sheet(freq="yearly")
             if isinstance(balance, pd.DataFrame):
                 total_debt = (
                     balance.loc["TotalDebt"].iloc[0]
@@ -474,11 +494,8 @@ class SignalService:
 
         # 추가: Free Cash Flow Yield 계산
 
-    def _calculate_fcf_yield(self, tk: yf.Ticker) -> float | None:
+    def _calculate_fcf_yield(self, cashflow: Any, market_cap: Any) -> float | None:
         try:
-            cashflow = tk.get_cash_flow(freq="yearly")
-            info = safe_get_ticker_info(tk, ("marketCap",))
-            market_cap = info.get("marketCap")
             if isinstance(cashflow, pd.DataFrame) and market_cap:
                 fcf = (
                     cashflow.loc["FreeCashFlow"].iloc[0]
@@ -531,15 +548,271 @@ class SignalService:
             # Reindex SPY close prices to match df's index
             spy_close = spy_df["Close"].reindex(df.index).ffill()
 
-            for period, col in [(20, "RS_SHORT"), (60, "RS_MID")]:
-                ticker_ret = df["Close"].pct_change(period)
-                spy_ret = spy_close.pct_change(period)
-                df[col] = (ticker_ret - spy_ret) * 100
+            for col, values in relative_strength(df, spy_close).items():
+                df[col] = values
         except Exception as e:
             logger.warning(f"Failed to compute RS data for: {e}")
 
         return df
 
+    def _fetch_ohlcv_stored(
+        self,
+        ticker: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        days_back: int = 365,
+        prefetched: Optional[tuple[pd.DataFrame, date, date]] = None,
+    ) -> Optional[pd.DataFrame]:
+        """
+        로컬 Parquet 저장소에서 히스토리를 읽고, 마지막 저장일 이후 구간만 내려받아 병합합니다.
+        완료된 세션(get_latest_market_date)까지만 저장하며, 진행 중인 세션 봉은 저장하지 않습니다.
+        저장소를 사용할 수 없거나 데이터를 확보하지 못하면 None을 반환합니다.
+        :param prefetched: (데이터프레임, 시작일, 종료일) - 일괄 다운로드로 이미 받은 구간.
+            필요한 구간이 이 범위 안이면 네트워크 호출 없이 사용합니다.
+        """
+        store = get_ohlcv_store()
+        if not store.enabled:
+            return None
+
+        # datetime이 넘어와도 일 단위로 비교
+        if isinstance(start, datetime.datetime):
+            start = start.date()
+        if isinstance(end, datetime.datetime):
+            end = end.date()
+        if start is None:
+            start = date.today() - timedelta(days=days_back)
+        if end is None:
+            # 기존 동작과 동일하게 오늘 봉은 제외
+            end = date.today() - timedelta(days=1)
+        if end < start:
+            return None
+
+        def _download(range_start: date, range_end: date) -> pd.DataFrame:
+            if prefetched is not None:
+                frame, fetched_start, fetched_end = prefetched
+                if fetched_start <= range_start and range_end <= fetched_end:
+                    return slice_by_date(frame, range_start, range_end)
+            return self._download_yfinance(
+                ticker=ticker,
+                start=datetime.datetime.combine(range_start, datetime.time.min),
+                end=datetime.datetime.combine(
+                    range_end + timedelta(days=1), datetime.time.min
+                ),
+            )
+
+        last_session = get_latest_market_date()
+        persist_end = min(end, last_session)
+
+        with store.lock_for(ticker):
+            history = store.read(ticker)
+            coverage = store.coverage_start(history)
+
+            if history.empty or coverage is None or start < coverage:
+                if persist_end >= start:
+                    fetched = _download(start, persist_end)
+                    if fetched.empty:
+                        return None
+                    history, coverage = fetched, start
+                    store.write(ticker, history, coverage_start=coverage)
+            else:
+                last_stored = pd.DatetimeIndex(history.index).date.max()
+                if last_stored < persist_end:
+                    # 마지막 저장 봉을 겹쳐 받아 수정주가(배당/분할) 변동 여부를 확인
+                    delta = _download(last_stored, persist_end)
+                    if delta.empty:
+                        logger.warning(
+                            f"Tail fetch failed for {ticker}; serving stored history up to {last_stored}"
+                        )
+                    else:
+                        delta = store.align_index(delta, history)
+                        overlap = history.index.intersection(delta.index)
+                        drifted = len(overlap) > 0 and not np.allclose(
+                            history.loc[overlap, "Close"].to_numpy(dtype=float),
+                            delta.loc[overlap, "Close"].to_numpy(dtype=float),
+                            rtol=1e-4,
+                            equal_nan=True,
+                        )
+                        if drifted:
+                            logger.info(
+                                f"Adjusted prices changed for {ticker}; refreshing stored history"
+                            )
+                            refreshed = _download(coverage, persist_end)
+                            history = (
+                                refreshed
+                                if not refreshed.empty
+                                else store.merge(history, delta)
+                            )
+                        else:
+                            history = store.merge(history, delta)
+                        store.write(ticker, history, coverage_start=coverage)
+
+        # 아직 마감되지 않은 세션 봉은 저장하지 않고 조회 시에만 덧붙입니다.
+        market_today = datetime.datetime.now(US_MARKET_TZ).date()
+        if end >= market_today > last_session:
+            live = _download(market_today, end)
+            if not live.empty:
+                history = store.merge(history, live)
+
+        result = slice_by_date(history, start, end)
+        return result if not result.empty else None
+
+    def _plan_ohlcv_download(self, ticker: str, start: date, end: date) -> Optional[date]:
+        """
+        저장소 상태를 보고 ticker에 필요한 다운로드 시작일을 계산합니다.
+        추가로 받을 구간이 없으면 None을 반환합니다.
+        """
+        store = get_ohlcv_store()
+        if not store.enabled:
+            return start
+
+        last_session = get_latest_market_date()
+        history = store.read(ticker)
+        coverage = store.coverage_start(history)
+        if history.empty or coverage is None or start < coverage:
+            return start
+
+        last_stored = pd.DatetimeIndex(history.index).date.max()
+        if last_stored < min(end, last_session):
+            return last_stored
+
+        market_today = datetime.datetime.now(US_MARKET_TZ).date()
+        if end >= market_today > last_session:
+            return market_today
+        return None
+
+    def _download_yf_batch(
+        self, tickers: Sequence[str], start: date, end: date
+    ) -> dict[str, pd.DataFrame]:
+        """
+        yf.download 한 번으로 여러 종목의 일봉을 받아 종목별 데이터프레임으로 나눕니다.
+        :param end: 종료 날짜 (포함)
+        """
+        try:
+            raw = yf.download(
+                list(tickers),
+                start=start.isoformat(),
+                end=(end + timedelta(days=1)).isoformat(),
+                auto_adjust=True,
+                actions=False,
+                group_by="ticker",
+                ignore_tz=False,
+                threads=False,
+                progress=False,
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to fetch batch data [Yahoo Finance]: {','.join(tickers)} - {str(e)}"
+            )
+            return {}
+
+        if raw is None or raw.empty:
+            return {}
+
+        frames: dict[str, pd.DataFrame] = {}
+        level_values = (
+            raw.columns.get_level_values(0)
+            if isinstance(raw.columns, pd.MultiIndex)
+            else pd.Index([])
+        )
+        for ticker in tickers:
+            if ticker in level_values:
+                df = raw[ticker]
+            elif len(tickers) == 1:
+                df = flatten_price_columns(raw, ticker)
+            else:
+                continue
+            df = df.dropna(how="all")
+            if df.empty:
+                continue
+            df = df.copy()
+            df.columns.name = None
+            df.index.name = "Date"
+            frames[ticker] = df
+        return frames
+
+    def fetch_ohlcv_many(
+        self,
+        tickers: Sequence[str],
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        days_back: int = 365,
+        chunk_size: int = 20,
+        max_workers: int = 4,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        여러 종목의 일봉 OHLCV를 한 번에 가져옵니다.
+        - 저장소에 최신 데이터가 있는 종목은 다운로드 없이 바로 반환
+        - 나머지는 필요한 시작일별로 묶어 chunk_size 단위 yf.download 호출을 스레드 풀에서 병렬 실행
+        - 일괄 다운로드에 실패한 종목만 fetch_ohlcv로 개별 재시도
+        return: {ticker: flatten_price_columns 처리된 데이터프레임} (데이터가 없는 종목은 제외)
+        """
+        unique_tickers = list(dict.fromkeys(t for t in tickers if t))
+        if not unique_tickers:
+            return {}
+
+        if isinstance(start, datetime.datetime):
+            start = start.date()
+        if isinstance(end, datetime.datetime):
+            end = end.date()
+        if start is None:
+            start = date.today() - timedelta(days=days_back)
+        if end is None:
+            # fetch_ohlcv와 동일하게 오늘 봉은 제외
+            end = date.today() - timedelta(days=1)
+
+        store_enabled = get_ohlcv_store().enabled
+        groups: dict[date, list[str]] = {}
+        fresh: set[str] = set()
+        for ticker in unique_tickers:
+            fetch_start = self._plan_ohlcv_download(ticker, start, end)
+            if fetch_start is None:
+                fresh.add(ticker)
+            else:
+                groups.setdefault(fetch_start, []).append(ticker)
+
+        jobs = [
+            (fetch_start, group[i : i + chunk_size])
+            for fetch_start, group in groups.items()
+            for i in range(0, len(group), chunk_size)
+        ]
+
+        downloaded: dict[str, tuple[pd.DataFrame, date]] = {}
+        if jobs:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs)))) as pool:
+                futures = {
+                    pool.submit(self._download_yf_batch, chunk, fetch_start, end): fetch_start
+                    for fetch_start, chunk in jobs
+                }
+                for future in as_completed(futures):
+                    fetch_start = futures[future]
+                    for ticker, frame in future.result().items():
+                        downloaded[ticker] = (frame, fetch_start)
+
+        results: dict[str, pd.DataFrame] = {}
+        for ticker in unique_tickers:
+            df: Optional[pd.DataFrame] = None
+            if ticker in downloaded or ticker in fresh:
+                if store_enabled:
+                    prefetched = None
+                    if ticker in downloaded:
+                        frame, fetch_start = downloaded[ticker]
+                        prefetched = (frame, fetch_start, end)
+                    df = self._fetch_ohlcv_stored(
+                        ticker, start=start, end=end, prefetched=prefetched
+                    )
+                else:
+                    df = slice_by_date(downloaded[ticker][0], start, end)
+
+            if df is None or df.empty:
+                df = self.fetch_ohlcv(ticker, start=start, end=end)
+            else:
+                df = flatten_price_columns(df, ticker)
+
+            if df is not None and not df.empty:
+                results[ticker] = df
+
+        return results
+
     def fetch_ohlcv(
         self,
         ticker: str,
@@ -548,9 +821,13 @@ class SignalService:
         days_back: int = 365,
     ) -> pd.DataFrame:
         """
-        1) Yahoo Finance → 2) Stooq 순서로 시도
+        1) 로컬 OHLCV 저장소(+누락된 꼬리 구간만 Yahoo Finance) → 2) Yahoo Finance 전체 조회
         return: 일봉 OHLCV (Close 컬럼이 반드시 존재), 실패 시 빈 DataFrame
         """
+        stored = self._fetch_ohlcv_stored(ticker, start=start, end=end, days_back=days_back)
+        if stored is not None and not stored.empty:
+            return flatten_price_columns(stored, ticker)
+
         if start is not None and end is not None:
             # Convert date objects to datetime objects
             start_dt = datetime.datetime.combine(start, datetime.datetime.min.time())
@@ -598,9 +875,34 @@ class SignalService:
             end_date = date.today()
             start_date = end_date - timedelta(days=days_back)
 
-            # Fetch VIX data
-            vix_ticker = yf.Ticker("^VIX")
-            vix_df = vix_ticker.history(start=start_date, end=end_date)
+            # VIX(1년) + VIX9D/VIX3M/VXN(최근 1주)을 동시에 조회
+            recent_start = end_date - timedelta(days=7)
+            requests_by_symbol = {
+                "^VIX": start_date,
+                "^VIX9D": recent_start,
+                "^VIX3M": recent_start,
+                "^VXN": recent_start,
+            }
+            with ThreadPoolExecutor(max_workers=len(requests_by_symbol)) as pool:
+                futures = {
+                    symbol: pool.submit(
+                        lambda sym, st: yf.Ticker(sym).history(start=st, end=end_date),
+                        symbol,
+                        symbol_start,
+                    )
+                    for symbol, symbol_start in requests_by_symbol.items()
+                }
+
+            def _latest_close(symbol: str) -> float | None:
+                try:
+                    frame = futures[symbol].result()
+                    if not frame.empty:
+                        return float(frame["Close"].iloc[-1])
+                except Exception as e:
+                    logger.warning(f"Failed to fetch {symbol.lstrip('^')}: {e}")
+                return None
+
+            vix_df = futures["^VIX"].result()
 
             if vix_df.empty:
                 logger.warning("Failed to fetch VIX data")
@@ -618,41 +920,14 @@ class SignalService:
                 else 50.0
             )
 
-            # Fetch VIX9D (9-day VIX) - short-term volatility expectation
-            vix_9d = None
-            try:
-                vix9d_ticker = yf.Ticker("^VIX9D")
-                vix9d_df = vix9d_ticker.history(
-                    start=end_date - timedelta(days=7), end=end_date
-                )
-                if not vix9d_df.empty:
-                    vix_9d = float(vix9d_df["Close"].iloc[-1])
-            except Exception as e:
-                logger.warning(f"Failed to fetch VIX9D: {e}")
+            # VIX9D (9-day VIX) - short-term volatility expectation
+            vix_9d = _latest_close("^VIX9D")
 
-            # Fetch VIX3M (3-month VIX) - longer-term volatility expectation
-            vix_3m = None
-            try:
-                vix3m_ticker = yf.Ticker("^VIX3M")
-                vix3m_df = vix3m_ticker.history(
-                    start=end_date - timedelta(days=7), end=end_date
-                )
-                if not vix3m_df.empty:
-                    vix_3m = float(vix3m_df["Close"].iloc[-1])
-            except Exception as e:
-                logger.warning(f"Failed to fetch VIX3M: {e}")
+            # VIX3M (3-month VIX) - longer-term volatility expectation
+            vix_3m = _latest_close("^VIX3M")
 
-            # Fetch VXN (Nasdaq 100 Volatility)
-            vxn = None
-            try:
-                vxn_ticker = yf.Ticker("^VXN")
-                vxn_df = vxn_ticker.history(
-                    start=end_date - timedelta(days=7), end=end_date
-                )
-                if not vxn_df.empty:
-                    vxn = float(vxn_df["Close"].iloc[-1])
-            except Exception as e:
-                logger.warning(f"Failed to fetch VXN: {e}")
+            # VXN (Nasdaq 100 Volatility)
+            vxn = _latest_close("^VXN")
 
             # Determine term structure
             term_structure = "flat"
@@ -884,6 +1159,65 @@ class SignalService:
             "unusual_activity": "No data available",
         }
 
+    def fetch_market_snapshot(
+        self,
+        days_back: int = 365,
+        symbols: Sequence[str] = MARKET_SNAPSHOT_OPTION_SYMBOLS,
+    ) -> dict:
+        """
+        거래일(get_latest_market_date) 단위로 VIX 지표와 지수 옵션 지표를 한 번만 조회해 공유합니다.
+        - VIX 계열과 옵션 체인을 스레드 풀에서 동시에 조회
+        - 프로세스 메모리 + 디스크(JsonDiskCache)에 보관, 다음 거래일이 되면 자동으로 새로 조회
+        - 조회 실패(기본값)가 섞인 결과는 디스크에 저장하지 않음
+
+        Returns:
+            {"market_date": "YYYY-MM-DD", "vix": fetch_market_volatility_data 결과,
+             "options": {symbol: fetch_index_options_data 결과}}
+        """
+        market_date = get_latest_market_date()
+        key = f"{market_date.isoformat()}_{days_back}"
+        wanted = list(dict.fromkeys(symbols))
+
+        with _market_snapshot_lock:
+            snapshot = _market_snapshot_memo.get(key) or _market_snapshot_cache.get(key)
+            if snapshot is not None and all(s in snapshot["options"] for s in wanted):
+                _market_snapshot_memo[key] = snapshot
+                return snapshot
+
+            cached_options = dict(snapshot["options"]) if snapshot else {}
+            missing = [s for s in wanted if s not in cached_options]
+            with ThreadPoolExecutor(max_workers=len(missing) + 1) as pool:
+                vix_future = (
+                    pool.submit(self.fetch_market_volatility_data, days_back)
+                    if snapshot is None
+                    else None
+                )
+                option_futures = {
+                    s: pool.submit(self.fetch_index_options_data, s) for s in missing
+                }
+            vix = vix_future.result() if vix_future else snapshot["vix"]
+            cached_options.update({s: f.result() for s, f in option_futures.items()})
+
+            snapshot = {
+                "market_date": market_date.isoformat(),
+                "vix": vix,
+                "options": cached_options,
+            }
+            _market_snapshot_memo.clear()
+            _market_snapshot_memo[key] = snapshot
+
+            is_complete = vix != self._get_default_vix_data() and all(
+                data != self._get_default_options_data()
+                for data in cached_options.values()
+            )
+            if is_complete:
+                _market_snapshot_cache.set(
+                    key,
+                    snapshot,
+                    expires_at=datetime.datetime.now() + MARKET_SNAPSHOT_TTL,
+                )
+            return snapshot
+
     def fetch_market_options_snapshot(self, days_back: int = 100) -> dict:
         """
         Comprehensive snapshot of QQQ/SPY/VIX options market.
@@ -892,23 +1226,22 @@ class SignalService:
         Each containing current options metrics + 100-day underlying OHLCV
         """
         try:
-            from datetime import timedelta
-
             # Calculate date range
-            end_date = datetime.datetime.now()
+            end_date = date.today()
             start_date = end_date - timedelta(days=days_back + 50)
 
-            # Fetch QQQ data
-            qqq_ohlcv = self.fetch_ohlcv("QQQ", start=start_date, end=end_date)
-            qqq_options = self.fetch_index_options_data("QQQ")
-
-            # Fetch SPY data
-            spy_ohlcv = self.fetch_ohlcv("SPY", start=start_date, end=end_date)
-            spy_options = self.fetch_index_options_data("SPY")
+            # VIX/옵션 지표는 거래일 단위 스냅샷에서, 기초자산 시세는 일괄 조회로 가져옴
+            market = self.fetch_market_snapshot(days_back=days_back)
+            qqq_options = market["options"]["QQQ"]
+            spy_options = market["options"]["SPY"]
+            vix_data = market["vix"]
 
-            # Fetch VIX data
-            vix_data = self.fetch_market_volatility_data(days_back=days_back)
-            vix_ohlcv = self.fetch_ohlcv("^VIX", start=start_date, end=end_date)
+            ohlcv = self.fetch_ohlcv_many(
+                ["QQQ", "SPY", "^VIX"], start=start_date, end=end_date
+            )
+            qqq_ohlcv = ohlcv.get("QQQ", pd.DataFrame())
+            spy_ohlcv = ohlcv.get("SPY", pd.DataFrame())
+            vix_ohlcv = ohlcv.get("^VIX", pd.DataFrame())
 
             # Calculate 100-day metrics for each
             qqq_snapshot = self._build_options_snapshot(
@@ -1380,141 +1713,51 @@ Provide analysis in **MarketDirectionAnalysis** schema format:
             "recommended_approach": "trend_following",
         }
 
-    def add_indicators(self, df: pd.DataFrame, spy_df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
-        close_series = cast(pd.Series, df["Close"])
-        high_series = cast(pd.Series, df["High"])
-        low_series = cast(pd.Series, df["Low"])
-        volume_series = cast(pd.Series, df["Volume"])
-
-        # 기존 지표
-        df["SMA5"] = ta.sma(close=close_series, length=5)
-        df["SMA10"] = ta.sma(close=close_series, length=10)
-        df["SMA20"] = ta.sma(close=close_series, length=20)
-        df["SMA50"] = ta.sma(close=close_series, length=50)
-        df["SMA200"] = ta.sma(close=close_series, length=200)  # 추가: 장기 추세
-
-        df["VOL20"] = volume_series.rolling(20).mean()
-        df["VOL_Z"] = (volume_series - df.VOL20) / volume_series.rolling(20).std()
-        df["VOL_PCTL60"] = volume_series.rank(pct=True, method="max")
-        df["VolumeSpike"] = volume_series > df["VOL20"] * 2
-        df["VolumeSpikeStrength"] = volume_series / df["VOL20"]  # 급등 강도
-
-        df["RSI14"] = ta.rsi(close=close_series, length=14)
-        df["ATR14"] = ta.atr(
-            high=high_series, low=low_series, close=close_series, length=14
-        )  # 추가: 변동성
-
-        stoch = ta.stoch(
-            high=high_series, low=low_series, close=close_series, k=14, d=3, smooth_k=3
-        )
-
-        if stoch is not None:
-            stoch = _flatten_columns(stoch)
-            df = pd.concat([df, stoch], axis=1)  # 추가: Stochastic Oscillator
-
-        bb = ta.bbands(close=close_series, length=20, std=cast(Any, 2.0))
-        if bb is not None:
-            bb = _flatten_columns(bb)
-            df = pd.concat([df, bb], axis=1)
-
-        macd = ta.macd(close=close_series, fast=12, slow=26, signal=9)
-        if macd is not None:
-            macd = _flatten_columns(macd)
-            df = pd.concat([df, macd], axis=1)
-
-        # 추가: VWAP와 ROC
-        # df["VWAP"] = ta.vwap(df.High, df.Low, df.Close, df.Volume)
-        df["ROC5"] = ta.roc(close=close_series, length=5)
-
-        # ────────── 신규 ‘추세’ 지표 ──────────
-        # ① ADX(+DI/-DI) – 추세 강도
-        adx = ta.adx(high=high_series, low=low_series, close=close_series, length=14)
-        if adx is not None:
-            adx = _flatten_columns(adx)
-            df = pd.concat([df, adx], axis=1)  # ADX_14, DMP_14, DMN_14
-
-        # ② SuperTrend (ATR 기반 추세 필터) – ta 패키지에 존재
-        supertrend = ta.supertrend(
-            high=high_series,
-            low=low_series,
-            close=close_series,
-            length=10,
-            multiplier=cast(Any, 3.0),
-        )
-        if supertrend is not None:
-            supertrend = _flatten_columns(supertrend)
-            df = pd.concat([df, supertrend], axis=1)
-        # 컬럼: SUPERT_10_3.0, SUPERTd_10_3.0 (direction)
-
-        # ③ Donchian Channel(20) – 추세 돌파용
-        donch = ta.donchian(
-            high=high_series, low=low_series, length=cast(Any, 20)
-        )  # DONCHU_20, DONCHL_20, DONCHM_20
-        if donch is not None:
-            donch = _flatten_columns(donch)
-            df = pd.concat([df, donch], axis=1)
-
-        # ④ 이동평균 기울기(∇) – SMA50 기울기
-        df["SMA50_SLOPE"] = df["SMA50"].diff()
-
-        df["VWAP"] = ta.vwap(
-            high=high_series, low=low_series, close=close_series, volume=volume_series
-        )  # 장중 기준선
-        df["RSI5"] = ta.rsi(close=close_series, length=5)  # 단기 RSI
-        # 볼린저 밴드 폭 (%)
-        upper_col = next(
-            (col for col in df.columns if col.endswith("BBU_20_2.0")), None
-        )
-        lower_col = next(
-            (col for col in df.columns if col.endswith("BBL_20_2.0")), None
-        )
-        if upper_col and lower_col:
-            df["BB_WIDTH"] = (df[upper_col] - df[lower_col]) / df["Close"]
-        else:
-            df["BB_WIDTH"] = pd.Series(index=df.index, dtype=float)
-
-        df["AVG_VOL20"] = df["Volume"].rolling(20).mean()
-        df["LIQUIDITY_FILTER"] = df["AVG_VOL20"] > 500000  # 최소 거래량 기준
-
-        df["ATR_PCT"] = (df["ATR14"] / df["Close"]) * 100  # 변동성 비율
-
-        df["GAP_PCT"] = df["Open"] / df["Close"].shift(1) - 1
-
-        # True-Range Ratio: 오늘 변동성 / 20일 평균 변동성
-        avg_atr20 = df["ATR14"].rolling(20).mean()
-        df["ATR_RATIO"] = df["ATR14"] / avg_atr20
-
-        # 초단기 모멘텀
-        df["ROC1"] = ta.roc(close=close_series, length=1)
-        df["ROC3"] = ta.roc(close=close_series, length=3)
-
-        # ─── 캔들 패턴 예: 상승장악(Engulfing) ────────────
-        df["BULL_ENGULF"] = (
-            (df["Close"].shift(1) < df["Open"].shift(1))  # 전일 음봉
-            & (df["Open"] < df["Close"].shift(1))  # 오늘 시가 < 전일 종가
-            & (df["Close"] > df["Open"].shift(1))  # 오늘 종가 > 전일 시가
-        )
-
-        # (신규) 장기 추세용 SMA150 ─ VCP 필터에서 사용
-        df["SMA150"] = ta.sma(close=close_series, length=150)
-
-        # (신규) VCP 보조지표 -------------------------------
-        long_win, short_win = 20, 5  # ‘긴 변동성’/‘짧은 변동성’ 구간
-        # ­♠ ① 구간별 변동폭(%)
-        df["RANGE_LONG"] = (
-            df["High"].rolling(long_win).max() - df["Low"].rolling(long_win).min()
-        ) / df["Low"].rolling(long_win).min()
-        df["RANGE_SHORT"] = (
-            df["High"].rolling(short_win).max() - df["Low"].rolling(short_win).min()
-        ) / df["Low"].rolling(short_win).min()
-        # ­♠ ② 거래량 드라이-업 지표(당일-vs-20일 평균 비율)
-        df["VCP_VOL_REL"] = df["Volume"] / df["Volume"].rolling(long_win).mean()
+    def add_indicators(
+        self,
+        df: pd.DataFrame,
+        spy_df: pd.DataFrame,
+        strategies: Optional[Sequence[Strategy]] = None,
+    ) -> pd.DataFrame:
+        """
+        기술 지표 컬럼을 추가합니다.
+        strategies를 주면 해당 전략이 evaluate_signals에서 읽는 컬럼과 그 의존 지표만 계산합니다.
+        """
+        columns = required_columns(strategies) if strategies is not None else None
+        return compute_indicators(df, spy_df, columns, rs=self.add_computed_rs_data)
 
-        df = df.dropna(how="all").reset_index(drop=False).set_index("Date")
-        df = self.add_computed_rs_data(df, spy_df)
+    def add_indicators_incremental(
+        self, ticker: str, df: pd.DataFrame, spy_df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        add_indicators와 같은 컬럼을 저장된 롤링 상태에서 새 봉만 계산해 반환합니다.
+        상태를 쓸 수 없거나 계산에 실패하면 add_indicators 전체 재계산으로 대체합니다.
+        """
+        try:
+            return _incremental_engine.indicators_for(ticker, df, spy_df)
+        except Exception as e:
+            logger.warning(
+                f"Incremental indicators failed for {ticker}, recomputing: {e}"
+            )
+            return self.add_indicators(df, spy_df)
 
-        return df
+    def add_indicators_panel(
+        self, frames: Mapping[str, pd.DataFrame], spy_df: pd.DataFrame
+    ) -> dict[str, pd.DataFrame]:
+        """
+        여러 종목의 add_indicators를 [ticker, bar] 배열 한 번의 패스로 계산합니다.
+        반환 프레임은 종목별 add_indicators 결과와 같은 컬럼/인덱스를 가집니다.
+        패널 계산이 실패하면 종목별 add_indicators로 대체합니다.
+        """
+        try:
+            return compute_panel_indicators(frames, spy_df).views()
+        except Exception as e:
+            logger.warning(f"Panel indicators failed, computing per ticker: {e}")
+            return {
+                ticker: self.add_indicators(df, spy_df)
+                for ticker, df in frames.items()
+                if df is not None and not df.empty
+            }
 
     def evaluate_signals(
         self, df: pd.DataFrame, strategies: List[Strategy]
@@ -1544,9 +1787,11 @@ Provide analysis in **MarketDirectionAnalysis** schema format:
         rs_mid_last = df["RS_MID"].iloc[-1] if "RS_MID" in cols else None
 
         # 최신 값 준비
-        gap_pct = df["GAP_PCT"].iloc[-1]
-        roc1, roc3 = df["ROC1"].iloc[-1], df["ROC3"].iloc[-1]
-        atr_ratio = df["ATR_RATIO"].iloc[-1]
+        # 전략별로 필요한 지표만 계산된 프레임(add_indicators(strategies=...))도 받을 수 있도록 존재 여부 확인
+        gap_pct = df["GAP_PCT"].iloc[-1] if "GAP_PCT" in cols else None
+        roc1 = df["ROC1"].iloc[-1] if "ROC1" in cols else None
+        roc3 = df["ROC3"].iloc[-1] if "ROC3" in cols else None
+        atr_ratio = df["ATR_RATIO"].iloc[-1] if "ATR_RATIO" in cols else None
 
         volume_series = cast(pd.Series, df["Volume"])
         current_volume = float(volume_series.iloc[-1])
@@ -1556,7 +1801,7 @@ Provide analysis in **MarketDirectionAnalysis** schema format:
             vol_ratio20 = 0.0
         else:
             vol_ratio20 = current_volume / avg_volume
-        bb_width = df["BB_WIDTH"].iloc[-1]
+        bb_width = df["BB_WIDTH"].iloc[-1] if "BB_WIDTH" in cols else None
 
         # 전일(shift 1) high·volume·close
         prev_high = df["High"].iloc[-2]
@@ -1995,19 +2240,140 @@ Provide analysis in **MarketDirectionAnalysis** schema format:
 
         return out
 
-    def fetch_fundamentals(self, ticker: str) -> FundamentalData:
+    def evaluate_signals_history(
+        self, df: pd.DataFrame, strategies: List[Strategy]
+    ) -> pd.DataFrame:
+        """
+        evaluate_signals의 조건을 전체 기간에 대해 평가해 전략별 bool 컬럼으로 반환합니다.
+        마지막 행은 evaluate_signals(df, strategies)의 triggered와 같습니다.
+        """
+        return evaluate_signals_history(df, strategies)
+
+    def backtest_strategies(
+        self,
+        tickers: List[str],
+        strategies: List[Strategy],
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        horizons: Sequence[int] = DEFAULT_HORIZONS,
+        max_workers: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        tickers 전체 기간에서 전략별 트리거 이후 horizon 거래일 수익률 적중률을 계산합니다.
+        시세는 fetch_ohlcv_many로 일괄 조회하고, 종목별 계산은 프로세스 풀에서 실행합니다.
+        """
+        frames = self.fetch_ohlcv_many(
+            list(dict.fromkeys(["SPY", *tickers])), start=start, end=end
+        )
+        spy_df = frames.get("SPY")
+        universe = {t: frames[t] for t in tickers if t in frames}
+        return backtest_strategies(
+            universe,
+            strategies,
+            spy_df=spy_df,
+            horizons=horizons,
+            max_workers=max_workers,
+        )
+
+    def _load_fundamental_snapshot(self, tk: "yf.Ticker") -> dict[str, Any]:
+        """
+        펀더멘털 계산에 필요한 원천 데이터를 티커당 한 번씩만 조회합니다.
+        (info / 실적 이력 / 분기·연간 손익계산서 / 연간 재무상태표 / 연간 현금흐름표 / 실적 발표 일정)
+        """
+
+        def _safe(label: str, getter):
+            try:
+                return getter()
+            except Exception as e:
+                logger.warning(f"Failed to fetch {label} for {tk.ticker}: {str(e)}")
+                return None
+
+        is_index_fund = tk.ticker is None or tk.ticker in ["QQQ", "SPY"]
+        return {
+            "info": safe_get_ticker_info(tk),
+            "earnings_history": (
+                None if is_index_fund else _safe("earnings history", tk.get_earnings_history)
+            ),
+            "income_quarterly": _safe(
+                "quarterly income statement",
+                lambda: tk.get_income_stmt(freq="quarterly"),
+            ),
+            "income_yearly": _safe(
+                "yearly income statement", lambda: tk.get_income_stmt(freq="yearly")
+            ),
+            "balance_yearly": _safe(
+                "balance sheet", lambda: tk.get_balance_sheet(freq="yearly")
+            ),
+            "cashflow_yearly": _safe(
+                "cash flow", lambda: tk.get_cash_flow(freq="yearly")
+            ),
+            "calendar": None if is_index_fund else _safe("calendar", tk.get_calendar),
+        }
+
+    @staticmethod
+    def _next_earnings_date(calendar: Any) -> Optional[date]:
+        """get_calendar() 결과에서 오늘 이후 가장 가까운 실적 발표일을 추출합니다."""
+        if not isinstance(calendar, Mapping):
+            return None
+        raw = calendar.get("Earnings Date")
+        candidates = raw if isinstance(raw, (list, tuple)) else [raw]
+        today = date.today()
+        upcoming: list[date] = []
+        for value in candidates:
+            if value is None:
+                continue
+            try:
+                parsed = pd.Timestamp(value).date()
+            except (TypeError, ValueError):
+                continue
+            if parsed >= today:
+                upcoming.append(parsed)
+        return min(upcoming) if upcoming else None
+
+    def _fundamentals_expiry(self, calendar: Any) -> datetime.datetime:
+        """
+        캐시 만료 시각: 다음 실적 발표 + 유예기간(재무제표 반영 지연)까지 유지하되,
+        최대 FUNDAMENTALS_MAX_TTL을 넘지 않음. 일정이 없으면 FUNDAMENTALS_DEFAULT_TTL.
+        """
+        now = datetime.datetime.now()
+        next_earnings = self._next_earnings_date(calendar)
+        if next_earnings is None:
+            return now + FUNDAMENTALS_DEFAULT_TTL
+
+        expires_at = datetime.datetime.combine(
+            next_earnings + FUNDAMENTALS_REPORT_GRACE, datetime.time.min
+        )
+        return min(expires_at, now + FUNDAMENTALS_MAX_TTL)
+
+    def fetch_fundamentals(self, ticker: str, use_cache: bool = True) -> FundamentalData:
+        cache_key = ticker.upper()
+        if use_cache:
+            cached = _fundamentals_cache.get(cache_key)
+            if cached is not None:
+                try:
+                    return FundamentalData.model_validate(cached)
+                except Exception as e:
+                    logger.warning(f"Ignoring invalid fundamentals cache for {ticker}: {e}")
+
         tk = yf.Ticker(ticker)
-        info = safe_get_ticker_info(tk)
+        snapshot = self._load_fundamental_snapshot(tk)
+        info = snapshot["info"]
         trailing_pe = self._first_present(
             info,
             ("peTrailing", "trailingPE", "peRatio", "trailingPe"),
         )
-        eps_surprise_pct = self._latest_eps_surprise_pct(tk)
-        revenue_growth = self._revenue_yoy_growth(tk)
-        roe = self._calculate_roe(tk)  # 추가
-        debt_to_equity = self._calculate_debt_to_equity(tk)  # 추가
-        fcf_yield = self._calculate_fcf_yield(tk)  # 추가
-        return FundamentalData(
+        eps_surprise_pct = self._latest_eps_surprise_pct(snapshot["earnings_history"])
+        revenue_growth = self._revenue_yoy_growth(snapshot["income_quarterly"])
+        roe = self._calculate_roe(
+            snapshot["income_yearly"], snapshot["balance_yearly"]
+        )  # 추가
+        debt_to_equity = self._calculate_debt_to_equity(
+            snapshot["balance_yearly"]
+        )  # 추가
+        fcf_yield = self._calculate_fcf_yield(
+            snapshot["cashflow_yearly"], info.get("marketCap")
+        )  # 추가
+        fundamentals = FundamentalData(
             trailing_pe=trailing_pe,
             eps_surprise_pct=eps_surprise_pct,
             revenue_growth=revenue_growth,
@@ -2016,6 +2382,14 @@ Provide analysis in **MarketDirectionAnalysis** schema format:
             fcf_yield=fcf_yield,
         )
 
+        if use_cache:
+            _fundamentals_cache.set(
+                cache_key,
+                fundamentals.model_dump(mode="json"),
+                expires_at=self._fundamentals_expiry(snapshot["calendar"]),
+            )
+        return fundamentals
+
     def fetch_news(
         self, ticker: str, days_back: int = 5, max_items: int = 5
     ) -> List[NewsHeadline]:
@@ -2227,7 +2601,8 @@ Provide analysis in **MarketDirectionAnalysis** schema format:
         ### 🚀 Intraday Momentum (Short-term):
         {data.intraday_metrics.model_dump_json() if data.intraday_metrics else "N/A"}
 
-        - Stock's OHLCV DataFrame (Last 100 days - Analyze Step By Step): {data.dataframe}
+        - Stock's OHLCV + Indicator Table (Last 100 days, encoding described in its first line - Analyze Step By Step):
+        {data.dataframe}
         ```
         """
 
@@ -1,8 +1,12 @@
+import contextvars
 import datetime
 import json
+import os
 import re
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Any, Optional, TypeVar, Union, Iterable
-import boto3
 import logging
 from pydantic import BaseModel
 
@@ -16,6 +20,18 @@ from myapi.repositories.signals_repository import SignalsRepository
 from myapi.repositories.web_search_repository import WebSearchResultRepository
 from myapi.services.ai_service import AIService
 from myapi.utils.config import Settings
+from myapi.utils.sdk_clients import boto3_client
+from myapi.utils.llm_metrics import usage_scope
+from myapi.utils.prompt_encoding import estimate_tokens
+from myapi.utils.repetition import collapse_repeated_phrases, collapse_repeated_words
+from myapi.utils.translation_memory import get_translation_memory
+from myapi.utils.translation_routing import (
+    MT_PRICE_PER_CHAR,
+    Tier,
+    build_machine_translator,
+    choose_tier,
+    translation_tier_stats,
+)
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -23,6 +39,19 @@ logger = logging.getLogger(__name__)
 # TypeVar for generic schema translation
 T = TypeVar("T", bound=BaseModel)
 
+SIGNAL_TRANSLATE_PATHS = {
+    "result_description",
+    "report_summary",
+    "senario",
+    "good_things",
+    "bad_things",
+    "chart_pattern.description",
+}
+
+# translate_by_date 배치 번역: 배치당 입력 토큰 추정치 상한 / 동시 실행 배치 수
+TRANSLATION_BATCH_TOKENS = int(os.environ.get("TRANSLATION_BATCH_TOKENS", 3000))
+TRANSLATION_BATCH_WORKERS = 4
+
 
 class TranslateService:
     def __init__(
@@ -35,10 +64,11 @@ class TranslateService:
         self.signals_repository = signals_repository
         self.analysis_repository = analysis_repository
         self.ai_service = ai_service
+        self.translation_memory = get_translation_memory()
 
         # AWS Translate 클라이언트 초기화
         try:
-            self.translate_client = boto3.client(
+            self.translate_client = boto3_client(
                 "translate",
                 region_name="ap-northeast-2",  # 또는 원하는 리전
                 aws_access_key_id=settings.AWS_S3_ACCESS_KEY_ID,
@@ -48,6 +78,9 @@ class TranslateService:
             logger.warning(f"AWS Translate 클라이언트 초기화 실패: {e}")
             self.translate_client = None
 
+        # 짧은 문자열은 기계 번역(MT), 긴 분석 본문은 LLM으로 라우팅
+        self.machine_translator = build_machine_translator(self.translate_client)
+
     def _to_markdown(self, signals: List[SignalBaseResponse]) -> str:
         lines = []
         for s in signals:
@@ -206,14 +239,14 @@ class TranslateService:
             cleaned += "."
 
         # 단어 반복 패턴 제거 (예: "매우 매우 매우 좋은" -> "매우 좋은")
-        cleaned = re.sub(r"\b(\w+)\s+\1\s+\1+", r"\1", cleaned)
+        cleaned = collapse_repeated_words(cleaned)
 
-        # 구절 반복 패턴 제거
-        cleaned = re.sub(r"(.{10,}?)\s*\1+", r"\1", cleaned)
+        # 구절 반복 패턴 제거 (backtracking regex 대신 선형 시간 구현)
+        cleaned = collapse_repeated_phrases(cleaned)
 
         return cleaned.strip()
 
-    def _translate_text_with_aws(self, text: str) -> str:
+    def _translate_text_with_aws(self, text: str, path: str = "") -> str:
         if not text or not text.strip():
             return text
 
@@ -221,6 +254,62 @@ class TranslateService:
         if len(text) < 5 or re.search(r"[가-힣]", text):
             return text
 
+        # 번역 메모리에 없는 문장만 tier별 번역기로 전송
+        if self._translation_tier(path, text) == "MT":
+            return self.translation_memory.translate(
+                text, self._translate_with_mt, "MT"
+            )
+        return self.translation_memory.translate(text, self._translate_sentences)
+
+    def _translation_tier(self, path: str, text: str) -> Tier:
+        if self.machine_translator is None:
+            return "LLM"
+        return choose_tier(path, text)
+
+    def _translate_with_mt(self, sentences: dict[str, str]) -> dict[str, str]:
+        """AWS Translate로 문장별 번역. 실패한 문장은 LLM으로 넘깁니다."""
+        if self.machine_translator is None:
+            return self._translate_sentences(sentences)
+        translations: dict[str, str] = {}
+        failed: dict[str, str] = {}
+        for key, sentence in sentences.items():
+            started = time.perf_counter()
+            try:
+                translations[key] = self.machine_translator.translate(sentence)
+            except Exception as e:
+                logger.warning(f"AWS Translate 실패, LLM으로 폴백: {e}")
+                failed[key] = sentence
+            translation_tier_stats.record(
+                "MT",
+                chars=len(sentence),
+                latency=time.perf_counter() - started,
+                cost_usd=len(sentence) * MT_PRICE_PER_CHAR,
+                error=key in failed,
+            )
+        if failed:
+            translations.update(self._translate_sentences(failed))
+        return translations
+
+    def _translate_sentences(self, sentences: dict[str, str]) -> dict[str, str]:
+        """번역 메모리 miss 문장들: 1개면 단건 번역, 여러 개면 JSON 배치 번역."""
+        started = time.perf_counter()
+        with usage_scope() as usage:
+            if len(sentences) == 1:
+                translations = {
+                    k: self._translate_text_llm(v) for k, v in sentences.items()
+                }
+            else:
+                translations = self._translate_batch_llm(sentences)
+        translation_tier_stats.record(
+            "LLM",
+            chars=sum(len(v) for v in sentences.values()),
+            latency=time.perf_counter() - started,
+            cost_usd=usage.cost_usd,
+            error=bool(usage.errors),
+        )
+        return translations
+
+    def _translate_text_llm(self, text: str) -> str:
         try:
             # 개선된 번역 프롬프트
             prompt = f"""
@@ -295,29 +384,92 @@ class TranslateService:
             return text
 
     def _translate_signal(self, signal: SignalValueObject) -> SignalValueObject:
-        include_paths = {
-            "result_description",
-            "report_summary",
-            "senario",
-            "good_things",
-            "bad_things",
-            "chart_pattern.description",
-        }
-
         translated_signal = self.translate_schema(
             signal,
             use_batch=True,
-            include_paths=include_paths,
+            include_paths=SIGNAL_TRANSLATE_PATHS,
         )
+        self._restore_signal_structure(signal, translated_signal)
+        return translated_signal
 
+    def _restore_signal_structure(
+        self, original: SignalValueObject, translated: SignalValueObject
+    ) -> None:
         # chart_pattern의 구조적 필드는 원본 값을 유지
-        if signal.chart_pattern and translated_signal.chart_pattern:
-            translated_signal.chart_pattern.name = signal.chart_pattern.name
-            translated_signal.chart_pattern.pattern_type = (
-                signal.chart_pattern.pattern_type
+        if original.chart_pattern and translated.chart_pattern:
+            translated.chart_pattern.name = original.chart_pattern.name
+            translated.chart_pattern.pattern_type = original.chart_pattern.pattern_type
+
+    def _translate_signals(
+        self, signals: List[SignalValueObject]
+    ) -> List[SignalValueObject]:
+        """
+        여러 시그널의 번역 대상 필드를 한 번에 모아 토큰 단위 배치로 나누고,
+        배치들을 병렬로 번역한 뒤 각 시그널에 다시 적용합니다.
+        """
+        translated = [s.model_copy(deep=True) for s in signals]
+
+        texts: dict[str, str] = {}
+        for idx, signal in enumerate(translated):
+            collected = self._collect_translatable_strings(
+                signal, include_paths=SIGNAL_TRANSLATE_PATHS
             )
+            for path, text in collected.items():
+                texts[f"{idx}.{path}"] = text
 
-        return translated_signal
+        per_signal: dict[int, dict[str, str]] = defaultdict(dict)
+        for key, value in self._translate_batches_concurrently(texts).items():
+            idx, path = key.split(".", 1)
+            per_signal[int(idx)][path] = value
+
+        for idx, (original, signal) in enumerate(zip(signals, translated)):
+            self._apply_translations(
+                signal, per_signal.get(idx, {}), include_paths=SIGNAL_TRANSLATE_PATHS
+            )
+            self._restore_signal_structure(original, signal)
+        return translated
+
+    def _pack_batches(
+        self, texts: dict[str, str], token_budget: int
+    ) -> List[dict[str, str]]:
+        """입력 순서를 유지하며 추정 토큰 합이 token_budget을 넘지 않도록 나눕니다."""
+        batches: List[dict[str, str]] = []
+        current: dict[str, str] = {}
+        used = 0
+        for key, text in texts.items():
+            tokens = estimate_tokens(text)
+            if current and used + tokens > token_budget:
+                batches.append(current)
+                current, used = {}, 0
+            current[key] = text
+            used += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def _translate_batches_concurrently(self, texts: dict[str, str]) -> dict[str, str]:
+        batches = self._pack_batches(texts, TRANSLATION_BATCH_TOKENS)
+        if len(batches) <= 1:
+            return self._translate_batch(texts)
+
+        logger.info(f"번역 배치 {len(batches)}개 병렬 실행 ({len(texts)}개 텍스트)")
+        translations: dict[str, str] = {}
+        workers = min(len(batches), TRANSLATION_BATCH_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # 요청 단위 LLM 사용량 집계(contextvars)가 워커 스레드에도 이어지도록 복사
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run, self._translate_batch, batch
+                )
+                for batch in batches
+            ]
+            for future in futures:
+                try:
+                    translations.update(future.result())
+                except Exception as e:
+                    # 실패한 배치의 텍스트는 원문 유지
+                    logger.error(f"번역 배치 실패: {e}")
+        return translations
 
     def _translate_json_recursive(self, data: Any) -> Any:
         if isinstance(data, dict):
@@ -335,29 +487,27 @@ class TranslateService:
         target_date: datetime.date,
     ) -> None:
         """
-        번역된 시그널들을 signals 테이블에 개별적으로 저장합니다.
-        기존에 동일한 ticker + timestamp 조합이 있으면 덮어쓰기합니다.
+        번역된 시그널들을 ai_analysis 테이블(name="signals")에 한 번에 저장합니다.
 
         Args:
             translated_signals: 번역된 시그널 리스트
         """
         try:
-            # SignalBaseResponse를 SignalValueObject로 변환
-            for signal in translated_signals:
-                # datetime 객체를 문자열로 변환하여 JSON 직렬화 가능하게 만듦
-                signal_str = signal.model_dump_json(exclude={"id"})
-                signal_dict = json.loads(signal_str)
-
-                self.analysis_repository.create_analysis(
-                    name="signals",
-                    analysis=signal_dict,
-                    analysis_date=target_date,
-                )
+            # datetime 객체를 문자열로 변환하여 JSON 직렬화 가능하게 만듦
+            analyses = [
+                json.loads(signal.model_dump_json(exclude={"id"}))
+                for signal in translated_signals
+            ]
+            self.analysis_repository.create_analyses(
+                name="signals",
+                analyses=analyses,
+                analysis_date=target_date,
+            )
 
-            logger.info(f"번역된 시그널 {len(translated_signals)}개 개별 저장 완료")
+            logger.info(f"번역된 시그널 {len(translated_signals)}개 일괄 저장 완료")
 
         except Exception as e:
-            logger.error(f"번역된 시그널 개별 저장 중 오류 발생: {e}")
+            logger.error(f"번역된 시그널 일괄 저장 중 오류 발생: {e}")
             raise
 
     def translate_by_date(
@@ -394,54 +544,40 @@ class TranslateService:
         )
 
         try:
-            signals = self.signals_repository.get_signals(request)
-
-            # 3. 각 시그널에 대해 번역 처리
+            signals = [
+                s
+                for s in self.signals_repository.get_signals(request)
+                # 특정 티커 / 요청한 AI 모델의 시그널만 번역
+                if (not tickers or s.ticker in tickers) and s.ai_model == models
+            ]
+
+            # 3. 같은 (ticker, strategy) 시그널은 한 번만 번역
+            unique: dict[tuple[str, Optional[str]], SignalValueObject] = {}
             for s in signals:
-                # 특정 티커만 처리하도록 필터링
-                if tickers and s.ticker not in tickers:
-                    logger.debug(f"티커 {s.ticker} 필터링됨, 건너뛰기")
-                    continue
+                unique.setdefault((s.ticker, s.strategy), s)
 
-                # 개별 티커의 번역된 시그널이 이미 있는지 확인
-                existing_ticker_signal = self.get_translated_by_ticker(
-                    target_date, s.ticker, ai_model=models
+            # 4. 날짜 전체를 토큰 단위 배치로 병렬 번역 (실패한 필드는 원문 유지)
+            translated = dict(
+                zip(unique.keys(), self._translate_signals(list(unique.values())))
+            )
+            all_translated_signals = [
+                translated[(s.ticker, s.strategy)] for s in signals
+            ]
+
+            # 5. 번역 중 다른 요청이 저장한 시그널을 제외하고 한 번의 bulk insert로 저장
+            saved = {
+                (t.ticker, t.strategy)
+                for t in self.get_translated(
+                    target_date=target_date, tickers=tickers, models=models
                 )
-
-                if s.ai_model != models:
-                    logger.debug(
-                        f"티커 {s.ticker}의 AI 모델이 {models}가 아님, 번역 수행"
-                    )
-                    continue
-
-                if existing_ticker_signal:
-                    logger.debug(f"티커 {s.ticker}의 번역된 시그널이 이미 존재함")
-                    all_translated_signals.append(existing_ticker_signal)
-                    continue
-
-                # 4. 번역 수행
-                try:
-                    logger.debug(f"티커 {s.ticker} 번역 시작")
-                    translated_signal = self._translate_signal(s)
-                    all_translated_signals.append(translated_signal)
-
-                    # 5. 개별 저장 (즉시 저장으로 중복 방지)
-                    try:
-                        self._save_translated_signals([translated_signal], target_date)
-                        logger.debug(f"티커 {s.ticker} 번역 및 저장 완료")
-                    except Exception as save_error:
-                        logger.error(f"티커 {s.ticker} 저장 중 오류: {save_error}")
-
-                except Exception as translate_error:
-                    logger.error(f"티커 {s.ticker} 번역 중 오류: {translate_error}")
-                    # 번역 실패 시 원본 시그널을 SignalValueObject로 변환하여 저장
-                    signal_vo = SignalValueObject(**s.model_dump(exclude_unset=True))
-                    all_translated_signals.append(signal_vo)
-                    try:
-                        self._save_translated_signals([signal_vo], target_date)
-                        logger.debug(f"티커 {s.ticker} 원본 시그널 저장 완료")
-                    except Exception as save_error:
-                        logger.error(f"티커 {s.ticker} 원본 저장 중 오류: {save_error}")
+            }
+            try:
+                self._save_translated_signals(
+                    [t for key, t in translated.items() if key not in saved],
+                    target_date,
+                )
+            except Exception as save_error:
+                logger.error(f"{target_date} 번역 시그널 저장 중 오류: {save_error}")
 
         except Exception as e:
             logger.error(f"{target_date} 날짜 시그널 조회 중 오류 발생: {e}")
@@ -738,6 +874,7 @@ class TranslateService:
     def _translate_batch(self, texts: dict[str, str]) -> dict[str, str]:
         """
         여러 텍스트를 한 번의 API 호출로 배치 번역합니다.
+        번역 메모리에 없는 문장만 모아 보내고, 나머지는 저장된 번역으로 채웁니다.
 
         Args:
             texts: {path: text} 딕셔너리
@@ -748,6 +885,30 @@ class TranslateService:
         if not texts:
             return {}
 
+        by_tier: dict[Tier, dict[str, str]] = {"MT": {}, "LLM": {}}
+        for path, text in texts.items():
+            by_tier[self._translation_tier(path, text)][path] = text
+        logger.info(
+            f"번역 tier 분배: MT {len(by_tier['MT'])}개, LLM {len(by_tier['LLM'])}개"
+        )
+
+        translations: dict[str, str] = {}
+        if by_tier["MT"]:
+            translations.update(
+                self.translation_memory.translate_many(
+                    by_tier["MT"], self._translate_with_mt, "MT"
+                )
+            )
+        if by_tier["LLM"]:
+            translations.update(
+                self.translation_memory.translate_many(
+                    by_tier["LLM"], self._translate_sentences
+                )
+            )
+        return translations
+
+    def _translate_batch_llm(self, texts: dict[str, str]) -> dict[str, str]:
+        """{key: text}를 JSON으로 묶어 한 번의 LLM 호출로 번역합니다."""
         logger.info(f"배치 번역 시작: {len(texts)}개 텍스트")
 
         # JSON 형태로 모든 텍스트를 묶어서 한 번에 번역
@@ -803,8 +964,7 @@ Translated JSON:"""
             logger.error(f"배치 번역 실패, 개별 번역으로 폴백: {e}")
             # 실패시 개별 번역으로 폴백
             return {
-                path: self._translate_text_with_aws(text)
-                for path, text in texts.items()
+                path: self._translate_text_llm(text) for path, text in texts.items()
             }
 
     def _apply_translations(
@@ -966,7 +1126,9 @@ Translated JSON:"""
                             )
                         ):
                             continue
-                        translated_value = self._translate_text_with_aws(field_value)
+                        translated_value = self._translate_text_with_aws(
+                            field_value, current_path
+                        )
                         setattr(translated_data, field_name, translated_value)
 
                     elif hasattr(field_value, "model_fields") and isinstance(
@@ -1033,7 +1195,9 @@ Translated JSON:"""
                                     translated_list.append(item)
                                 else:
                                     translated_list.append(
-                                        self._translate_text_with_aws(item)
+                                        self._translate_text_with_aws(
+                                            item, item_path
+                                        )
                                     )
                             else:
                                 translated_list.append(item)
@@ -1,9 +1,11 @@
 from datetime import date, timedelta
-from typing import Literal, Optional, List, Tuple, Any, Type
+from typing import Awaitable, Callable, Literal, Optional, List, Tuple, Any, Type
 from fastapi import HTTPException
+import asyncio
 import logging
 import hashlib
 import json
+import time
 
 from myapi.services.translate_service import TranslateService
 
@@ -47,6 +49,8 @@ from myapi.domain.news.news_schema import (
 )
 from myapi.repositories.web_search_repository import WebSearchResultRepository
 from myapi.services.ai_service import AIService
+from myapi.services.async_ai_service import AsyncAIService
+from myapi.utils.provider_health import get_provider_health
 
 
 class WebSearchService:
@@ -54,10 +58,12 @@ class WebSearchService:
         self,
         websearch_repository: WebSearchResultRepository,
         ai_service: AIService,
+        async_ai_service: AsyncAIService,
         translate_service: TranslateService,
     ):
         self.websearch_repository = websearch_repository
         self.ai_service = ai_service
+        self.async_ai_service = async_ai_service
         self.translate_service = translate_service
 
     def _hash_prompt(self, prompt: str) -> str:
@@ -73,7 +79,7 @@ class WebSearchService:
             paired.append((r, m))
         return paired
 
-    def run_llm(
+    async def run_llm(
         self,
         policy: Literal[
             "AUTO", "GEMINI", "PERPLEXITY", "BOTH", "FALLBACK", "HYBRID"
@@ -90,75 +96,144 @@ class WebSearchService:
 
         prompt_hash = self._hash_prompt(prompt)
 
-        def call_perplexity() -> Any:
+        def record(model: str, r: Any) -> None:
+            provenance.append(
+                {"model": model, "prompt_hash": prompt_hash, "used": r is not None}
+            )
+
+        async def call_perplexity() -> Any:
             if schema is None:
                 raise ValueError("schema is required for perplexity_completion")
-            r = self.ai_service.perplexity_completion(prompt=prompt, schema=schema)
-            provenance.append(
-                {
-                    "model": "PERPLEXITY",
-                    "prompt_hash": prompt_hash,
-                    "used": r is not None,
-                }
+            return await self._guarded(
+                "PERPLEXITY",
+                schema,
+                lambda: self.async_ai_service.perplexity_completion(
+                    prompt=prompt, schema=schema
+                ),
             )
-            return r
 
-        def call_gemini() -> Any:
+        async def call_gemini() -> Any:
             if schema is None:
                 raise ValueError("schema is required for gemini_search_grounding")
-            r = self.ai_service.gemini_search_grounding(prompt=prompt, schema=schema)
-            provenance.append(
-                {"model": "GEMINI", "prompt_hash": prompt_hash, "used": r is not None}
+            return await self._guarded(
+                "GEMINI",
+                schema,
+                lambda: self.async_ai_service.gemini_search_grounding(
+                    prompt=prompt, schema=schema
+                ),
             )
-            return r
 
         try:
             if resolved == "GEMINI":
-                r = call_gemini()
+                r = await call_gemini()
+                record("GEMINI", r)
                 if r is not None:
                     results.append(r)
             elif resolved == "PERPLEXITY":
-                r = call_perplexity()
+                r = await call_perplexity()
+                record("PERPLEXITY", r)
                 if r is not None:
                     results.append(r)
-            elif resolved == "BOTH":
-                r1 = call_perplexity()
-                r2 = call_gemini()
-                if r1 is not None:
-                    results.append(r1)
-                if r2 is not None:
-                    results.append(r2)
-            elif resolved == "FALLBACK":
-                try:
-                    r = call_perplexity()
+            elif resolved in ("BOTH", "HYBRID"):
+                # 두 공급자를 동시에 호출하고, provenance/results는 PERPLEXITY → GEMINI 순서 유지
+                outcomes = await asyncio.gather(
+                    call_perplexity(), call_gemini(), return_exceptions=True
+                )
+                for model, r in zip(("PERPLEXITY", "GEMINI"), outcomes):
+                    if isinstance(r, BaseException):
+                        if resolved == "BOTH":
+                            raise r
+                        continue
+                    record(model, r)
                     if r is not None:
                         results.append(r)
-                    else:
-                        raise ValueError("Empty response")
-                except Exception:
-                    r2 = call_gemini()
-                    if r2 is not None:
-                        results.append(r2)
-            elif resolved == "HYBRID":
-                r1 = None
-                try:
-                    r1 = call_perplexity()
-                except Exception:
-                    pass
-                r2 = None
-                try:
-                    r2 = call_gemini()
-                except Exception:
-                    pass
-                if r1 is not None:
-                    results.append(r1)
-                if r2 is not None:
-                    results.append(r2)
+            elif resolved == "FALLBACK":
+                model, r = await self._run_hedged(
+                    [("PERPLEXITY", call_perplexity), ("GEMINI", call_gemini)]
+                )
+                record(model, r)
+                results.append(r)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"LLM invocation failed: {e}")
 
         return results, resolved, provenance
 
+    async def _guarded(
+        self,
+        provider: str,
+        schema: Type[Any],
+        call: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        공급자 호출 결과를 circuit breaker / 지연 통계에 기록합니다.
+        schema 검증을 통과하지 못한 응답("" 등)은 실패로 보고 ValueError를 올립니다.
+        """
+        health = get_provider_health(provider)
+        started = time.perf_counter()
+        try:
+            r = await call()
+        except asyncio.CancelledError:
+            health.release()
+            raise
+        except Exception:
+            health.record_failure()
+            raise
+        if not isinstance(r, schema):
+            health.record_failure()
+            raise ValueError(f"{provider} returned no valid {schema.__name__}")
+        health.record_success(time.perf_counter() - started)
+        return r
+
+    async def _run_hedged(
+        self, calls: List[Tuple[str, Callable[[], Awaitable[Any]]]]
+    ) -> Tuple[str, Any]:
+        """
+        FALLBACK: 첫 공급자가 최근 p95 지연 안에 응답하지 않거나 실패하면 다음 공급자를
+        함께 시작하고, 먼저 검증을 통과한 결과를 사용합니다 (나머지 호출은 취소).
+        circuit이 열린 공급자는 건너뛰되, 모두 열려 있으면 원래 순서대로 시도합니다.
+        """
+        allowed = [c for c in calls if get_provider_health(c[0]).allow()]
+        queue = allowed or list(calls)
+        running: dict[asyncio.Task, str] = {}
+        errors: List[str] = []
+
+        def launch() -> None:
+            provider, call = queue.pop(0)
+            running[asyncio.ensure_future(call())] = provider
+
+        try:
+            launch()
+            while running:
+                delay = None
+                if queue:
+                    primary = next(iter(running.values()))
+                    delay = get_provider_health(primary).hedge_delay()
+                done, _ = await asyncio.wait(
+                    running, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    logger.info(
+                        f"{list(running.values())} slower than {delay:.1f}s, "
+                        f"hedging with {queue[0][0]}"
+                    )
+                    launch()
+                    continue
+                for task in done:
+                    provider = running.pop(task)
+                    if task.exception() is None:
+                        return provider, task.result()
+                    errors.append(f"{provider}: {task.exception()}")
+                if queue and not running:
+                    launch()
+        finally:
+            for task in running:
+                task.cancel()
+            # 시작하지 않은 공급자의 half-open 시험 슬롯 반납
+            for provider, _ in queue:
+                get_provider_health(provider).release()
+
+        raise ValueError("All providers failed: " + "; ".join(errors))
+
     def _merge_results(self, schema: Any, results: List[Any]) -> Any:
         if not results:
             return None
@@ -299,7 +374,7 @@ class WebSearchService:
 
             prompt = self._build_prompt(end_date, source)
 
-            response = self.ai_service.perplexity_completion(
+            response = await self.async_ai_service.perplexity_completion(
                 prompt=prompt,
                 schema=MarketForecastResponse,
             )
@@ -566,7 +641,7 @@ class WebSearchService:
 
         prompt = self.generate_mahaney_prompt(tickers, target_date.strftime("%Y-%m-%d"))
 
-        response = self.ai_service.gemini_search_grounding(
+        response = await self.async_ai_service.gemini_search_grounding(
             prompt=prompt,
             schema=MahaneyAnalysisResponse,
         )
@@ -755,7 +830,7 @@ class WebSearchService:
             etf_tickers, target_date.strftime("%Y-%m-%d")
         )
 
-        response = self.ai_service.perplexity_completion(
+        response = await self.async_ai_service.perplexity_completion(
             prompt=prompt,
             schema=ETFAnalysisResponse,
         )
@@ -805,7 +880,7 @@ class WebSearchService:
         prompt = self.generate_insider_trend_prompt(
             tickers, target_date.strftime("%Y-%m-%d")
         )
-        results, resolved_policy, provenance = self.run_llm(
+        results, resolved_policy, provenance = await self.run_llm(
             llm_policy, prompt, InsiderTrendResponse
         )
 
@@ -853,11 +928,8 @@ class WebSearchService:
                 "ai_model": (
                     "HYBRID"
                     if llm_policy == "HYBRID" and len(results) > 1
-                    else (
-                        "PERPLEXITY"
-                        if resolved_policy in ("PERPLEXITY", "FALLBACK")
-                        else "GEMINI"
-                    )
+                    # FALLBACK은 hedging으로 어느 공급자든 응답할 수 있으므로 provenance 기준
+                    else self._pair_results_with_models(results, provenance)[0][1]
                 ),
                 "llm_policy": resolved_policy,
                 "prompt_hash": self._hash_prompt(prompt),
@@ -973,7 +1045,7 @@ class WebSearchService:
         prompt = self.generate_analyst_pt_prompt(
             tickers, target_date.strftime("%Y-%m-%d")
         )
-        results, resolved_policy, provenance = self.run_llm(
+        results, resolved_policy, provenance = await self.run_llm(
             llm_policy, prompt, AnalystPTResponse
         )
 
@@ -1019,11 +1091,8 @@ class WebSearchService:
                 "ai_model": (
                     "HYBRID"
                     if llm_policy == "HYBRID" and len(results) > 1
-                    else (
-                        "PERPLEXITY"
-                        if resolved_policy in ("PERPLEXITY", "FALLBACK")
-                        else "GEMINI"
-                    )
+                    # FALLBACK은 hedging으로 어느 공급자든 응답할 수 있으므로 provenance 기준
+                    else self._pair_results_with_models(results, provenance)[0][1]
                 ),
                 "llm_policy": resolved_policy,
                 "prompt_hash": self._hash_prompt(prompt),
@@ -1272,7 +1341,7 @@ class WebSearchService:
         prompt = self.generate_etf_weekly_flows_prompt(
             universe, target_date.strftime("%Y-%m-%d")
         )
-        results, resolved_policy, provenance = self.run_llm(
+        results, resolved_policy, provenance = await self.run_llm(
             llm_policy, prompt, ETFWeeklyFlowResponse
         )
 
@@ -1318,11 +1387,8 @@ class WebSearchService:
                 "ai_model": (
                     "HYBRID"
                     if len(results) > 1 and llm_policy in ("BOTH", "HYBRID")
-                    else (
-                        "PERPLEXITY"
-                        if resolved_policy in ("PERPLEXITY", "FALLBACK")
-                        else "GEMINI"
-                    )
+                    # FALLBACK은 hedging으로 어느 공급자든 응답할 수 있으므로 provenance 기준
+                    else self._pair_results_with_models(results, provenance)[0][1]
                 ),
                 "llm_policy": resolved_policy,
                 "prompt_hash": self._hash_prompt(prompt),
@@ -1569,7 +1635,7 @@ class WebSearchService:
         )
 
         # Use Perplexity for research-backed analysis with structured schema
-        response = self.ai_service.perplexity_completion(
+        response = await self.async_ai_service.perplexity_completion(
             prompt=prompt,
             schema=ETFAnalystSummaryResponse,
         )
@@ -1696,7 +1762,7 @@ OUTPUT: Return JSON matching FundamentalAnalysisResponse schema with ALL fields
 
         try:
             # Use OpenAI for analysis (can also use Perplexity for research-backed analysis)
-            response = self.ai_service.perplexity_completion(
+            response = await self.async_ai_service.perplexity_completion(
                 prompt=prompt,
                 schema=FundamentalAnalysisResponse,
             )
@@ -0,0 +1,184 @@
+"""Process-local API key pool with batched usage accounting.
+
+``AIService`` used to run the key-selection join plus a Fernet decrypt before
+every Gemini/OpenAI call and a SELECT + UPDATE/INSERT + commit after it. The
+pool instead keeps the active keys (decrypted once) and today's request
+counts in memory, counts usage locally and flushes the increments in one
+``INSERT ... ON CONFLICT DO UPDATE SET request_count = request_count + n``.
+
+Quota is still enforced across workers: each flush returns the database
+totals (which include other workers' flushes) and the key list is reloaded
+periodically, so a worker can overshoot ``quota_limit`` by at most the
+requests it has not flushed yet (``FLUSH_EVERY``).
+"""
+
+import atexit
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+from myapi.repositories.api_key_repository import ApiKeyRepository
+
+_logger = logging.getLogger(__name__)
+
+Provider = Literal["GEMINI", "OPENAI"]
+
+REFRESH_INTERVAL = 300.0  # 키 목록/DB 사용량 재조회 주기(초)
+FLUSH_EVERY = 10  # 미반영 요청이 이만큼 쌓이면 flush
+FLUSH_INTERVAL = 30.0  # 마지막 flush 후 이 시간이 지나면 flush(초)
+
+
+@dataclass
+class _PooledKey:
+    id: int
+    api_key: str
+    api_key_hash: str
+    quota_limit: int
+    priority: int
+    flushed_count: int  # DB에 반영된 오늘 사용량 (다른 워커 포함)
+    pending: int = 0  # 아직 flush하지 않은 이 프로세스의 사용량
+
+    @property
+    def used(self) -> int:
+        return self.flushed_count + self.pending
+
+
+class ApiKeyPool:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._keys: Dict[Provider, List[_PooledKey]] = {}
+        self._loaded_at: Dict[Provider, float] = {}
+        self._by_id: Dict[int, _PooledKey] = {}
+        self._usage_date = date.today()
+        self._last_flush = time.monotonic()
+
+    def _reload(
+        self, provider: Provider, repository: ApiKeyRepository, encryption: Any
+    ) -> None:
+        rows = repository.get_active_keys_with_usage(provider, self._usage_date)
+        keys: List[_PooledKey] = []
+        for record, count in rows:
+            key_id = int(record.id)
+            cached = self._by_id.get(key_id)
+            if cached is not None and cached.api_key_hash == record.api_key_hash:
+                api_key = cached.api_key
+                pending = cached.pending
+            else:
+                api_key = encryption.decrypt(str(record.api_key_encrypted))
+                pending = 0
+            keys.append(
+                _PooledKey(
+                    id=key_id,
+                    api_key=api_key,
+                    api_key_hash=str(record.api_key_hash),
+                    quota_limit=int(record.quota_limit),
+                    priority=int(record.priority or 0),
+                    flushed_count=count,
+                    pending=pending,
+                )
+            )
+        # 비활성화된 키의 미반영 사용량은 다음 flush까지 유지
+        for old in self._keys.get(provider, []):
+            if old.pending and all(k.id != old.id for k in keys):
+                self._by_id[old.id] = old
+        self._keys[provider] = keys
+        self._by_id.update({k.id: k for k in keys})
+        self._loaded_at[provider] = time.monotonic()
+
+    def _roll_day(self) -> None:
+        today = date.today()
+        if today != self._usage_date:
+            # 날짜가 바뀌면 오늘 사용량을 다시 읽도록 전체 재조회
+            self._usage_date = today
+            self._loaded_at.clear()
+            for key in self._by_id.values():
+                key.flushed_count = 0
+
+    def acquire(
+        self, provider: Provider, repository: ApiKeyRepository, encryption: Any
+    ) -> Tuple[Optional[str], Optional[int]]:
+        """
+        quota가 남은 키 중 priority가 가장 높고 사용량이 가장 적은 키를 반환합니다.
+        모두 소진되면 (None, None).
+        """
+        with self._lock:
+            self._roll_day()
+            loaded_at = self._loaded_at.get(provider)
+            if loaded_at is None or time.monotonic() - loaded_at > REFRESH_INTERVAL:
+                self._reload(provider, repository, encryption)
+
+            available = [
+                k for k in self._keys.get(provider, []) if k.used < k.quota_limit
+            ]
+            if not available:
+                _logger.warning(f"No available {provider} keys found")
+                return (None, None)
+            key = min(available, key=lambda k: (k.priority, k.used))
+            return (key.api_key, key.id)
+
+    @property
+    def has_pending(self) -> bool:
+        with self._lock:
+            return any(k.pending for k in self._by_id.values())
+
+    def record_usage(self, key_id: int, repository: ApiKeyRepository) -> None:
+        with self._lock:
+            key = self._by_id.get(key_id)
+            if key is None:
+                return
+            key.pending += 1
+            pending = sum(k.pending for k in self._by_id.values())
+            due = time.monotonic() - self._last_flush >= FLUSH_INTERVAL
+        if pending >= FLUSH_EVERY or due:
+            self.flush(repository)
+
+    def flush(self, repository: ApiKeyRepository) -> None:
+        """미반영 사용량을 한 번의 upsert로 DB에 더하고 DB 합계로 동기화합니다."""
+        with self._lock:
+            counts = {k.id: k.pending for k in self._by_id.values() if k.pending}
+            usage_date = self._usage_date
+            for key_id in counts:
+                self._by_id[key_id].pending = 0
+            self._last_flush = time.monotonic()
+        if not counts:
+            return
+
+        try:
+            totals = repository.add_usage(counts, usage_date)
+        except Exception as e:
+            _logger.error(f"Failed to flush API key usage {counts}: {e}")
+            with self._lock:
+                for key_id, n in counts.items():
+                    if key_id in self._by_id:
+                        self._by_id[key_id].pending += n
+            return
+
+        with self._lock:
+            for key_id, total in totals.items():
+                key = self._by_id.get(key_id)
+                if key is not None and usage_date == self._usage_date:
+                    key.flushed_count = total
+        _logger.debug(f"Flushed API key usage: {counts}")
+
+
+def _flush_on_exit(pool: ApiKeyPool) -> None:
+    if not pool.has_pending:
+        return
+    from myapi.database import get_db_contextlib
+
+    try:
+        with get_db_contextlib() as db:
+            pool.flush(ApiKeyRepository(db))
+    except Exception as e:
+        _logger.warning(f"Failed to flush API key usage on exit: {e}")
+
+
+@lru_cache(maxsize=1)
+def get_api_key_pool() -> ApiKeyPool:
+    pool = ApiKeyPool()
+    atexit.register(_flush_on_exit, pool)
+    return pool
@@ -0,0 +1,135 @@
+"""
+전략별 과거 트리거의 선행 수익률 적중률 백테스트.
+
+종목별로 add_indicators와 같은 지표를 계산하고 evaluate_signals_history로 전체 기간 트리거를 구한 뒤,
+트리거 다음 horizon 거래일 수익률을 집계합니다. 종목 단위 작업은 프로세스 풀에서 병렬로 실행됩니다.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from myapi.domain.signal.signal_schema import Strategy
+from myapi.utils.indicator_registry import (
+    compute_indicators,
+    relative_strength,
+    required_columns,
+)
+from myapi.utils.signal_history import evaluate_signals_history
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HORIZONS: tuple[int, ...] = (1, 5, 20)
+
+# 하락 신호는 선행 수익률이 음수일 때 적중으로 봅니다.
+BEARISH_STRATEGIES: frozenset[str] = frozenset({"TREND_DOWN", "SUPERTREND_SELL"})
+
+
+def _with_rs(df: pd.DataFrame, spy_df: Optional[pd.DataFrame]) -> pd.DataFrame:
+    if spy_df is None or spy_df.empty:
+        return df
+    spy_close = spy_df["Close"].reindex(df.index).ffill()
+    for col, values in relative_strength(df, spy_close).items():
+        df[col] = values
+    return df
+
+
+BacktestJob = tuple[
+    str, pd.DataFrame, Optional[pd.DataFrame], tuple[Strategy, ...], tuple[int, ...]
+]
+TickerStats = dict[tuple[str, int], tuple[int, int, float]]
+
+
+def _ticker_stats(job: BacktestJob) -> TickerStats:
+    """한 종목의 (strategy, horizon) -> (신호 수, 적중 수, 선행 수익률 합)."""
+    ticker, ohlcv, spy_df, strategies, horizons = job
+    stats: TickerStats = {}
+    try:
+        df = compute_indicators(
+            ohlcv, spy_df, required_columns(strategies), rs=_with_rs
+        )
+        triggers = evaluate_signals_history(df, strategies)
+    except Exception as e:
+        logger.warning(f"Backtest skipped {ticker}: {e}")
+        return stats
+
+    close = df["Close"].to_numpy(dtype=float)
+    for horizon in horizons:
+        forward = np.full(len(close), np.nan)
+        if horizon < len(close):
+            forward[:-horizon] = close[horizon:] / close[:-horizon] - 1
+        has_forward = ~np.isnan(forward)
+        for strategy in strategies:
+            mask = triggers[strategy].to_numpy() & has_forward
+            returns = forward[mask]
+            hits = returns < 0 if strategy in BEARISH_STRATEGIES else returns > 0
+            stats[(strategy, horizon)] = (
+                int(mask.sum()),
+                int(hits.sum()),
+                float(returns.sum()),
+            )
+    return stats
+
+
+def backtest_strategies(
+    frames: Mapping[str, pd.DataFrame],
+    strategies: Sequence[Strategy],
+    spy_df: Optional[pd.DataFrame] = None,
+    horizons: Iterable[int] = DEFAULT_HORIZONS,
+    max_workers: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    유니버스 전체에서 전략별 선행 수익률 적중률을 계산합니다.
+
+    :param frames: 티커별 일봉 OHLCV
+    :param max_workers: 프로세스 수 (1이면 현재 프로세스에서 순차 실행)
+    :return: strategy, horizon, signals, hits, hit_rate, avg_return_pct 컬럼의 DataFrame
+    """
+    strategies = tuple(dict.fromkeys(strategies))
+    horizons = tuple(sorted(set(horizons)))
+    jobs: list[BacktestJob] = [
+        (ticker, df, spy_df, strategies, horizons)
+        for ticker, df in frames.items()
+        if df is not None and not df.empty
+    ]
+
+    results: list[TickerStats] = []
+    if max_workers != 1 and len(jobs) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(_ticker_stats, jobs, chunksize=4))
+        except (OSError, NotImplementedError) as e:
+            # AWS Lambda처럼 /dev/shm이 없어 프로세스 풀을 만들 수 없는 환경
+            logger.warning(
+                f"Process pool unavailable, running backtest in-process: {e}"
+            )
+            results = []
+    if not results:
+        results = [_ticker_stats(job) for job in jobs]
+
+    rows = []
+    for strategy in strategies:
+        for horizon in horizons:
+            signals = hits = 0
+            total_return = 0.0
+            for stats in results:
+                n, h, r = stats.get((strategy, horizon), (0, 0, 0.0))
+                signals += n
+                hits += h
+                total_return += r
+            rows.append(
+                {
+                    "strategy": strategy,
+                    "horizon": horizon,
+                    "signals": signals,
+                    "hits": hits,
+                    "hit_rate": hits / signals if signals else None,
+                    "avg_return_pct": (
+                        total_return / signals * 100 if signals else None
+                    ),
+                }
+            )
+    return pd.DataFrame(rows)
@@ -1,14 +1,22 @@
 from datetime import date, datetime, time, timedelta, timezone, tzinfo
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 from zoneinfo import ZoneInfo
 
-import pandas_market_calendars as mcal
 from fastapi import HTTPException
 
 US_MARKET_TZ = ZoneInfo("America/New_York")
 KST = ZoneInfo("Asia/Seoul")
 US_MARKET_CLOSE = time(16, 0)
-US_MARKET_CALENDAR = mcal.get_calendar("XNYS")
+
+
+@lru_cache(maxsize=1)
+def get_us_market_calendar() -> Any:
+    """Return the NYSE calendar, importing pandas_market_calendars on first use."""
+
+    import pandas_market_calendars as mcal
+
+    return mcal.get_calendar("XNYS")
 
 
 def get_current_kst_datetime() -> datetime:
@@ -63,7 +71,7 @@ def get_latest_market_date(reference_dt: Optional[datetime] = None) -> date:
     lookback_start = current_ny.date() - timedelta(days=10)
     lookahead_end = current_ny.date() + timedelta(days=1)
 
-    schedule = US_MARKET_CALENDAR.schedule(
+    schedule = get_us_market_calendar().schedule(
         start_date=lookback_start, end_date=lookahead_end
     )
 
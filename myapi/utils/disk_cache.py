@@ -0,0 +1,117 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from myapi.utils.yfinance_cache import configure_yfinance_cache
+
+_logger = logging.getLogger(__name__)
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+
+class JsonDiskCache:
+    """JSON entries with a per-entry expiry, stored under the yfinance cache dir.
+
+    Each key is a single file ``<root>/<namespace>/<key>.json`` holding the
+    payload and its absolute expiry timestamp, so entries survive process
+    restarts (Lambda cold starts share the same ``/tmp`` while warm).
+    """
+
+    def __init__(self, namespace: str, root: Optional[Path | str] = None):
+        base = Path(root).expanduser() if root else configure_yfinance_cache()
+        self.namespace = namespace
+        self.root: Optional[Path] = None
+        if base is None:
+            return
+
+        target = base / _UNSAFE_CHARS.sub("_", namespace)
+        try:
+            target.mkdir(parents=True, exist_ok=True)
+        except OSError as exc:
+            _logger.warning("Could not create cache directory %s: %s", target, exc)
+            return
+        self.root = target
+
+    @property
+    def enabled(self) -> bool:
+        return self.root is not None
+
+    def _path(self, key: str) -> Optional[Path]:
+        if self.root is None:
+            return None
+        return self.root / f"{_UNSAFE_CHARS.sub('_', key)}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value or None when missing, expired or unreadable."""
+        path = self._path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            with path.open("r", encoding="utf-8") as fh:
+                entry = json.load(fh)
+        except (OSError, ValueError) as exc:
+            _logger.debug("Discarding unreadable cache entry %s: %s", path, exc)
+            self.delete(key)
+            return None
+
+        if float(entry.get("expires_at", 0)) <= time.time():
+            self.delete(key)
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value: Any, expires_at: datetime) -> None:
+        """Persist ``value`` until ``expires_at`` (aware or local naive datetime)."""
+        path = self._path(key)
+        if path is None:
+            return
+
+        entry = {"expires_at": expires_at.timestamp(), "value": value}
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with tmp_path.open("w", encoding="utf-8") as fh:
+                json.dump(entry, fh, ensure_ascii=False, default=str)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as exc:
+            _logger.warning("Failed to write cache entry %s: %s", path, exc)
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def delete(self, key: str) -> None:
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def prune(self, max_entries: int) -> int:
+        """Delete the oldest entries (by write time) beyond ``max_entries``."""
+        if self.root is None:
+            return 0
+        entries = []
+        for path in self.root.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue  # removed concurrently by another process
+
+        excess = len(entries) - max_entries
+        if excess <= 0:
+            return 0
+        entries.sort()
+        removed = 0
+        for _, path in entries[:excess]:
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
@@ -0,0 +1,102 @@
+"""Import-time report and budget check for Lambda cold starts.
+
+Runs ``python -X importtime -c "import myapi.main"`` in a fresh interpreter,
+aggregates the cumulative time per top-level package and fails when the total
+exceeds the budget or when a module that should be deferred via
+:func:`myapi.utils.lazy_import.lazy_import` was imported eagerly::
+
+    python -m myapi.utils.import_report --budget 4.0
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from typing import Iterable, Optional
+
+# 첫 사용 시점까지 import를 미뤄야 하는 모듈 (myapi.main import 시 로드되면 실패)
+DEFERRED_MODULES: tuple[str, ...] = (
+    "pandas_ta",
+    "matplotlib",
+    "mplfinance",
+    "yfinance",
+    "pdfplumber",
+    "cloudscraper",
+    "google.genai",
+    "openai",
+    "boto3",
+    "pandas_datareader",
+    "pandas_market_calendars",
+)
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def measure(target: str = "myapi.main") -> list[tuple[str, int, int]]:
+    """Return ``(module, self_us, depth)`` for every module imported by ``target``."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {target} failed:\n{proc.stderr[-2000:]}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, _, indent, module = match.groups()
+            rows.append((module, int(self_us), len(indent) // 2))
+    return rows
+
+
+def by_package(rows: Iterable[tuple[str, int, int]]) -> dict[str, float]:
+    """Seconds of self time per top-level package."""
+    totals: dict[str, float] = {}
+    for module, self_us, _ in rows:
+        top = module.split(".", 1)[0]
+        totals[top] = totals.get(top, 0.0) + self_us / 1e6
+    return totals
+
+
+def eager_deferred(modules: Iterable[str]) -> list[str]:
+    """Deferred modules (or their submodules) that showed up in the import log."""
+    loaded = set(modules)
+    return [
+        name
+        for name in DEFERRED_MODULES
+        if name in loaded or any(m.startswith(name + ".") for m in loaded)
+    ]
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target", default="myapi.main")
+    parser.add_argument(
+        "--budget", type=float, default=None, help="허용 import 시간 (초)"
+    )
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    rows = measure(args.target)
+    totals = by_package(rows)
+    total = sum(totals.values())
+
+    print(f"import {args.target}: {total:.3f}s ({len(rows)} modules)")
+    for package, seconds in sorted(totals.items(), key=lambda x: -x[1])[: args.top]:
+        print(f"  {seconds:8.3f}s  {package}")
+
+    failed = False
+    eager = eager_deferred(module for module, _, _ in rows)
+    if eager:
+        print(f"Deferred modules imported eagerly: {', '.join(eager)}")
+        failed = True
+    if args.budget is not None and total > args.budget:
+        print(f"Import time {total:.3f}s exceeds budget {args.budget:.3f}s")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,726 @@
+"""
+SignalService.add_indicators 지표를 봉 단위로 누적 계산하는 스트리밍 엔진.
+
+각 지표의 롤링 상태(EMA/RMA 누산기, 윈도 합계 링버퍼, 단조 덱)를 티커별로 보관하고
+새 봉이 들어오면 지표당 O(1)로 한 행을 계산합니다. 정의는 pandas_ta 0.4.x(talib 미사용)와 같으며,
+전체 재계산 결과와 꼬리 구간에서 일치합니다(EMA 계열의 시작값 차이는 수백 봉 뒤 수치오차 수준으로 수렴).
+
+예외: VOL_PCTL60은 add_indicators가 조회 구간 전체에 대한 순위를 쓰므로,
+여기서는 최근 rank_window 봉의 링버퍼 기준 순위로 계산합니다(O(rank_window)).
+"""
+
+import json
+import logging
+import math
+from collections import deque
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from myapi.utils.ohlcv_store import OhlcvStore
+
+logger = logging.getLogger(__name__)
+
+NAN = float("nan")
+STATE_VERSION = 1
+_STATE_ATTR = "indicator_state"
+
+INDICATOR_COLUMNS = [
+    "Open",
+    "High",
+    "Low",
+    "Close",
+    "Volume",
+    "SMA5",
+    "SMA10",
+    "SMA20",
+    "SMA50",
+    "SMA200",
+    "VOL20",
+    "VOL_Z",
+    "VOL_PCTL60",
+    "VolumeSpike",
+    "VolumeSpikeStrength",
+    "RSI14",
+    "ATR14",
+    "STOCHk_14_3_3",
+    "STOCHd_14_3_3",
+    "STOCHh_14_3_3",
+    "BBL_20_2.0_2.0",
+    "BBM_20_2.0_2.0",
+    "BBU_20_2.0_2.0",
+    "BBB_20_2.0_2.0",
+    "BBP_20_2.0_2.0",
+    "MACD_12_26_9",
+    "MACDh_12_26_9",
+    "MACDs_12_26_9",
+    "ROC5",
+    "ADX_14",
+    "ADXR_14_2",
+    "DMP_14",
+    "DMN_14",
+    "SUPERT_10_3.0",
+    "SUPERTd_10_3.0",
+    "SUPERTl_10_3.0",
+    "SUPERTs_10_3.0",
+    "DCL_20_20",
+    "DCM_20_20",
+    "DCU_20_20",
+    "SMA50_SLOPE",
+    "VWAP",
+    "RSI5",
+    "BB_WIDTH",
+    "AVG_VOL20",
+    "LIQUIDITY_FILTER",
+    "ATR_PCT",
+    "GAP_PCT",
+    "ATR_RATIO",
+    "ROC1",
+    "ROC3",
+    "BULL_ENGULF",
+    "SMA150",
+    "RANGE_LONG",
+    "RANGE_SHORT",
+    "VCP_VOL_REL",
+    "RS_SHORT",
+    "RS_MID",
+]
+BOOL_COLUMNS = ("VolumeSpike", "LIQUIDITY_FILTER", "BULL_ENGULF")
+
+
+def _isnan(value: float) -> bool:
+    return value != value
+
+
+def _div(numerator: float, denominator: float) -> float:
+    """pandas와 같은 나눗셈 의미(0으로 나누면 ±inf, 0/0은 NaN)."""
+    if _isnan(numerator) or _isnan(denominator):
+        return NAN
+    if denominator == 0:
+        if numerator == 0:
+            return NAN
+        return math.copysign(math.inf, numerator)
+    return numerator / denominator
+
+
+class _Window:
+    """고정 길이 링버퍼 + 누적합/제곱합 (rolling mean/std, min_periods=length)."""
+
+    def __init__(self, length: int):
+        self.length = length
+        self.values: deque = deque(maxlen=length)
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.nan_count = 0
+        self.since_resum = 0
+
+    def push(self, value: float) -> None:
+        if len(self.values) == self.length:
+            old = self.values[0]
+            if _isnan(old):
+                self.nan_count -= 1
+            else:
+                self.total -= old
+                self.total_sq -= old * old
+        self.values.append(value)
+        if _isnan(value):
+            self.nan_count += 1
+        else:
+            self.total += value
+            self.total_sq += value * value
+
+        # 누적 오차 방지를 위해 윈도 길이마다 합계를 다시 계산 (분할상환 O(1))
+        self.since_resum += 1
+        if self.since_resum >= self.length:
+            valid = [v for v in self.values if not _isnan(v)]
+            self.total = math.fsum(valid)
+            self.total_sq = math.fsum(v * v for v in valid)
+            self.since_resum = 0
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.length and self.nan_count == 0
+
+    def mean(self) -> float:
+        return self.total / self.length if self.full else NAN
+
+    def std(self, ddof: int = 1) -> float:
+        if not self.full or self.length - ddof <= 0:
+            return NAN
+        mean = self.total / self.length
+        var = (self.total_sq - self.length * mean * mean) / (self.length - ddof)
+        return math.sqrt(var) if var > 0 else 0.0
+
+    def ago(self, periods: int) -> float:
+        """periods 봉 전 값 (없으면 NaN)."""
+        if periods >= len(self.values):
+            return NAN
+        return self.values[-1 - periods]
+
+    def to_dict(self) -> dict:
+        return {
+            "length": self.length,
+            "values": list(self.values),
+            "total": self.total,
+            "total_sq": self.total_sq,
+            "nan_count": self.nan_count,
+            "since_resum": self.since_resum,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "_Window":
+        window = cls(int(data["length"]))
+        window.values = deque(data["values"], maxlen=window.length)
+        window.total = float(data["total"])
+        window.total_sq = float(data["total_sq"])
+        window.nan_count = int(data["nan_count"])
+        window.since_resum = int(data["since_resum"])
+        return window
+
+
+class _Extreme:
+    """단조 덱 기반 rolling max/min (min_periods=length)."""
+
+    def __init__(self, length: int, mode: str):
+        self.length = length
+        self.mode = mode
+        self.items: deque = deque()
+        self.count = 0
+
+    def push(self, value: float) -> float:
+        index = self.count
+        self.count += 1
+        if self.mode == "max":
+            while self.items and self.items[-1][1] <= value:
+                self.items.pop()
+        else:
+            while self.items and self.items[-1][1] >= value:
+                self.items.pop()
+        self.items.append((index, value))
+        while self.items[0][0] <= index - self.length:
+            self.items.popleft()
+        return self.items[0][1] if self.count >= self.length else NAN
+
+    def to_dict(self) -> dict:
+        return {
+            "length": self.length,
+            "mode": self.mode,
+            "items": [list(item) for item in self.items],
+            "count": self.count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "_Extreme":
+        extreme = cls(int(data["length"]), data["mode"])
+        extreme.items = deque((int(i), float(v)) for i, v in data["items"])
+        extreme.count = int(data["count"])
+        return extreme
+
+
+class _Ewm:
+    """
+    ewm(alpha, adjust=False) 누산기.
+    seed_length가 있으면 처음 seed_length개 입력의 평균(NaN 제외)을 시작값으로 사용(pandas_ta presma),
+    없으면 첫 유효값부터 시작합니다.
+    """
+
+    def __init__(self, alpha: float, seed_length: Optional[int] = None):
+        self.alpha = alpha
+        self.seed_length = seed_length
+        self.seed: list = []
+        self.value: Optional[float] = None
+
+    def push(self, x: float) -> float:
+        if self.value is None:
+            if self.seed_length is None:
+                if _isnan(x):
+                    return NAN
+                self.value = x
+                return x
+            self.seed.append(x)
+            if len(self.seed) < self.seed_length:
+                return NAN
+            valid = [v for v in self.seed if not _isnan(v)]
+            self.value = sum(valid) / len(valid) if valid else NAN
+            self.seed = []
+            return self.value
+        if not _isnan(x):
+            self.value = (1 - self.alpha) * self.value + self.alpha * x
+        return self.value
+
+    def to_dict(self) -> dict:
+        return {
+            "alpha": self.alpha,
+            "seed_length": self.seed_length,
+            "seed": self.seed,
+            "value": self.value,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "_Ewm":
+        ewm = cls(float(data["alpha"]), data["seed_length"])
+        ewm.seed = list(data["seed"])
+        ewm.value = data["value"]
+        return ewm
+
+
+def _rma(length: int, presma: bool = False) -> _Ewm:
+    return _Ewm(1.0 / length, length if presma else None)
+
+
+def _ema(length: int) -> _Ewm:
+    return _Ewm(2.0 / (length + 1), length)
+
+
+class _Atr:
+    """pandas_ta atr(mamode="rma", presma=True). prenan=True면 첫 봉 TR을 NaN으로 둡니다."""
+
+    def __init__(self, length: int, prenan: bool = False):
+        self.prenan = prenan
+        self.rma = _rma(length, presma=True)
+        self.count = 0
+
+    def push(self, high: float, low: float, prev_close: float) -> float:
+        if _isnan(prev_close):
+            tr = NAN if self.prenan and self.count == 0 else high - low
+        else:
+            tr = max(abs(high - low), abs(high - prev_close), abs(prev_close - low))
+        self.count += 1
+        return self.rma.push(tr)
+
+    def to_dict(self) -> dict:
+        return {"prenan": self.prenan, "rma": self.rma.to_dict(), "count": self.count}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "_Atr":
+        atr = cls(1, bool(data["prenan"]))
+        atr.rma = _Ewm.from_dict(data["rma"])
+        atr.count = int(data["count"])
+        return atr
+
+
+class IndicatorState:
+    """한 티커의 모든 지표 롤링 상태. to_dict()/from_dict()로 JSON 직렬화됩니다."""
+
+    def __init__(self, rank_window: int = 260):
+        self.version = STATE_VERSION
+        self.last_date: Optional[str] = None
+        self.last_close: Optional[float] = None
+        self.count = 0
+        self.rank_window = rank_window
+
+        self.prev: dict[str, float] = {
+            "open": NAN,
+            "high": NAN,
+            "low": NAN,
+            "close": NAN,
+            "sma50": NAN,
+            "spy_close": NAN,
+        }
+
+        self.windows: dict[str, _Window] = {
+            "close5": _Window(5),
+            "close10": _Window(10),
+            "close20": _Window(20),
+            "close50": _Window(50),
+            "close150": _Window(150),
+            "close200": _Window(200),
+            "close_hist": _Window(61),
+            "spy_hist": _Window(61),
+            "volume20": _Window(20),
+            "volume_rank": _Window(rank_window),
+            "atr20": _Window(20),
+            "stoch_raw": _Window(3),
+            "stoch_k": _Window(3),
+            "adx_hist": _Window(3),
+        }
+        self.extremes: dict[str, _Extreme] = {
+            "high14": _Extreme(14, "max"),
+            "low14": _Extreme(14, "min"),
+            "high20": _Extreme(20, "max"),
+            "low20": _Extreme(20, "min"),
+            "high5": _Extreme(5, "max"),
+            "low5": _Extreme(5, "min"),
+        }
+        self.ewms: dict[str, _Ewm] = {
+            "rsi14_pos": _rma(14),
+            "rsi14_neg": _rma(14),
+            "rsi5_pos": _rma(5),
+            "rsi5_neg": _rma(5),
+            "ema12": _ema(12),
+            "ema26": _ema(26),
+            "macd_signal": _ema(9),
+            "dm_pos": _rma(14),
+            "dm_neg": _rma(14),
+            "adx": _rma(14),
+        }
+        self.atrs: dict[str, _Atr] = {
+            "atr14": _Atr(14),
+            "adx_atr14": _Atr(14, prenan=True),
+            "st_atr10": _Atr(10),
+        }
+        self.supertrend: dict[str, float] = {"ub": NAN, "lb": NAN, "dir": 1.0}
+
+    def to_dict(self) -> dict:
+        return {
+            "version": self.version,
+            "last_date": self.last_date,
+            "last_close": self.last_close,
+            "count": self.count,
+            "rank_window": self.rank_window,
+            "prev": self.prev,
+            "windows": {k: v.to_dict() for k, v in self.windows.items()},
+            "extremes": {k: v.to_dict() for k, v in self.extremes.items()},
+            "ewms": {k: v.to_dict() for k, v in self.ewms.items()},
+            "atrs": {k: v.to_dict() for k, v in self.atrs.items()},
+            "supertrend": self.supertrend,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "IndicatorState":
+        if data.get("version") != STATE_VERSION:
+            raise ValueError("Unsupported indicator state version")
+        state = cls(int(data["rank_window"]))
+        state.last_date = data["last_date"]
+        state.last_close = data["last_close"]
+        state.count = int(data["count"])
+        state.prev = {k: float(v) for k, v in data["prev"].items()}
+        state.windows = {k: _Window.from_dict(v) for k, v in data["windows"].items()}
+        state.extremes = {
+            k: _Extreme.from_dict(v) for k, v in data["extremes"].items()
+        }
+        state.ewms = {k: _Ewm.from_dict(v) for k, v in data["ewms"].items()}
+        state.atrs = {k: _Atr.from_dict(v) for k, v in data["atrs"].items()}
+        state.supertrend = {k: float(v) for k, v in data["supertrend"].items()}
+        return state
+
+
+def _json_safe(value: Any) -> Any:
+    """NaN/inf를 포함한 상태를 표준 JSON으로 저장하기 위한 변환."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return repr(value)
+    if isinstance(value, dict):
+        return {k: _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    return value
+
+
+def _json_restore(value: Any) -> Any:
+    if value in ("nan", "inf", "-inf"):
+        return float(value)
+    if isinstance(value, dict):
+        return {k: _json_restore(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_json_restore(v) for v in value]
+    return value
+
+
+def update(state: IndicatorState, bar: dict, spy_close: float = NAN) -> dict:
+    """
+    새 일봉 하나를 반영하고 해당 행의 지표 값을 반환합니다.
+    :param bar: Open/High/Low/Close/Volume 키를 가진 dict
+    :param spy_close: 같은 날짜의 SPY 종가 (없으면 직전 값을 유지, ffill)
+    """
+    o = float(bar["Open"])
+    h = float(bar["High"])
+    l = float(bar["Low"])
+    c = float(bar["Close"])
+    v = float(bar["Volume"])
+    prev = state.prev
+    w = state.windows
+    x = state.extremes
+    e = state.ewms
+    row: dict[str, Any] = {"Open": o, "High": h, "Low": l, "Close": c, "Volume": v}
+
+    # 이동평균
+    for length in (5, 10, 20, 50, 150, 200):
+        w[f"close{length}"].push(c)
+    sma = {n: w[f"close{n}"].mean() for n in (5, 10, 20, 50, 150, 200)}
+    row.update({f"SMA{n}": sma[n] for n in (5, 10, 20, 50, 200)})
+
+    # 거래량
+    w["volume20"].push(v)
+    vol20 = w["volume20"].mean()
+    row["VOL20"] = vol20
+    row["VOL_Z"] = _div(v - vol20, w["volume20"].std())
+    w["volume_rank"].push(v)
+    ranked = np.fromiter(w["volume_rank"].values, dtype=float)
+    row["VOL_PCTL60"] = float((ranked <= v).sum()) / len(ranked)
+    row["VolumeSpike"] = bool(v > vol20 * 2)
+    row["VolumeSpikeStrength"] = _div(v, vol20)
+
+    # RSI (rma)
+    diff = c - prev["close"]
+    for length in (14, 5):
+        pos_avg = e[f"rsi{length}_pos"].push(diff if _isnan(diff) else max(diff, 0.0))
+        neg_avg = e[f"rsi{length}_neg"].push(diff if _isnan(diff) else min(diff, 0.0))
+        row[f"RSI{length}"] = 100 * _div(pos_avg, pos_avg + abs(neg_avg))
+
+    # ATR
+    atr14 = state.atrs["atr14"].push(h, l, prev["close"])
+    row["ATR14"] = atr14
+
+    # Stochastic (14, 3, 3)
+    hh14 = x["high14"].push(h)
+    ll14 = x["low14"].push(l)
+    raw_k = 100 * _div(c - ll14, hh14 - ll14)
+    stoch_k = stoch_d = NAN
+    if not _isnan(raw_k):
+        w["stoch_raw"].push(raw_k)
+        stoch_k = w["stoch_raw"].mean()
+        if not _isnan(stoch_k):
+            w["stoch_k"].push(stoch_k)
+            stoch_d = w["stoch_k"].mean()
+    row["STOCHk_14_3_3"] = stoch_k
+    row["STOCHd_14_3_3"] = stoch_d
+    row["STOCHh_14_3_3"] = stoch_k - stoch_d
+
+    # Bollinger Bands (20, 2.0, ddof=1)
+    mid = sma[20]
+    std20 = w["close20"].std(ddof=1)
+    lower = mid - 2.0 * std20
+    upper = mid + 2.0 * std20
+    row["BBL_20_2.0_2.0"] = lower
+    row["BBM_20_2.0_2.0"] = mid
+    row["BBU_20_2.0_2.0"] = upper
+    row["BBB_20_2.0_2.0"] = 100 * _div(upper - lower, mid)
+    row["BBP_20_2.0_2.0"] = _div(c - lower, upper - lower)
+
+    # MACD (12, 26, 9)
+    macd = e["ema12"].push(c) - e["ema26"].push(c)
+    signal = e["macd_signal"].push(macd) if not _isnan(macd) else NAN
+    row["MACD_12_26_9"] = macd
+    row["MACDh_12_26_9"] = macd - signal
+    row["MACDs_12_26_9"] = signal
+
+    # ROC
+    w["close_hist"].push(c)
+    for length in (5, 1, 3):
+        past = w["close_hist"].ago(length)
+        row[f"ROC{length}"] = 100 * _div(c - past, past)
+
+    # ADX (14)
+    adx_atr = state.atrs["adx_atr14"].push(h, l, prev["close"])
+    up = h - prev["high"]
+    dn = prev["low"] - l
+    if _isnan(up) or _isnan(dn):
+        pos_dm = neg_dm = NAN
+    else:
+        pos_dm = up if (up > dn and up > 0) else 0.0
+        neg_dm = dn if (dn > up and dn > 0) else 0.0
+        pos_dm = 0.0 if abs(pos_dm) < np.finfo(float).eps else pos_dm
+        neg_dm = 0.0 if abs(neg_dm) < np.finfo(float).eps else neg_dm
+    k = _div(100.0, adx_atr)
+    dmp = k * e["dm_pos"].push(pos_dm)
+    dmn = k * e["dm_neg"].push(neg_dm)
+    dx = 100 * _div(abs(dmp - dmn), dmp + dmn)
+    adx = e["adx"].push(dx)
+    w["adx_hist"].push(adx)
+    row["ADX_14"] = adx
+    row["ADXR_14_2"] = 0.5 * (adx + w["adx_hist"].ago(2))
+    row["DMP_14"] = dmp
+    row["DMN_14"] = dmn
+
+    # SuperTrend (10, 3.0)
+    st = state.supertrend
+    st_atr = state.atrs["st_atr10"].push(h, l, prev["close"])
+    hl2 = (h + l) / 2
+    lb = hl2 - 3.0 * st_atr
+    ub = hl2 + 3.0 * st_atr
+    if state.count == 0:
+        direction = 1.0
+        trend = long_ = short = NAN
+    else:
+        if c > st["ub"]:
+            direction = 1.0
+        elif c < st["lb"]:
+            direction = -1.0
+        else:
+            direction = st["dir"]
+            if direction > 0 and lb < st["lb"]:
+                lb = st["lb"]
+            if direction < 0 and ub > st["ub"]:
+                ub = st["ub"]
+        if direction > 0:
+            trend, long_, short = lb, lb, NAN
+        else:
+            trend, long_, short = ub, NAN, ub
+    st.update({"ub": ub, "lb": lb, "dir": direction})
+    row["SUPERT_10_3.0"] = trend
+    row["SUPERTd_10_3.0"] = direction if state.count >= 10 else NAN
+    row["SUPERTl_10_3.0"] = long_
+    row["SUPERTs_10_3.0"] = short
+
+    # Donchian (20)
+    dcu = x["high20"].push(h)
+    dcl = x["low20"].push(l)
+    row["DCL_20_20"] = dcl
+    row["DCM_20_20"] = 0.5 * (dcl + dcu)
+    row["DCU_20_20"] = dcu
+
+    row["SMA50_SLOPE"] = sma[50] - prev["sma50"]
+    # 일봉에서 일 단위 앵커 VWAP = 당일 대표가격(hlc3)
+    row["VWAP"] = _div((h + l + c) / 3 * v, v)
+    # add_indicators의 BB_WIDTH는 BBU/BBL 컬럼명을 찾지 못해 항상 NaN (동일하게 유지)
+    row["BB_WIDTH"] = NAN
+    row["AVG_VOL20"] = vol20
+    row["LIQUIDITY_FILTER"] = bool(vol20 > 500000)
+    row["ATR_PCT"] = _div(atr14, c) * 100
+    row["GAP_PCT"] = _div(o, prev["close"]) - 1
+
+    w["atr20"].push(atr14)
+    row["ATR_RATIO"] = _div(atr14, w["atr20"].mean())
+
+    row["BULL_ENGULF"] = bool(
+        prev["close"] < prev["open"] and o < prev["close"] and c > prev["open"]
+    )
+    row["SMA150"] = sma[150]
+
+    high5 = x["high5"].push(h)
+    low5 = x["low5"].push(l)
+    row["RANGE_LONG"] = _div(dcu - dcl, dcl)
+    row["RANGE_SHORT"] = _div(high5 - low5, low5)
+    row["VCP_VOL_REL"] = _div(v, vol20)
+
+    # 상대강도 (SPY 대비 20/60일 수익률 차)
+    spy = spy_close if not _isnan(spy_close) else prev["spy_close"]
+    w["spy_hist"].push(spy)
+    for length, col in ((20, "RS_SHORT"), (60, "RS_MID")):
+        past = w["close_hist"].ago(length)
+        spy_past = w["spy_hist"].ago(length)
+        ticker_ret = _div(c - past, past)
+        spy_ret = _div(spy - spy_past, spy_past)
+        row[col] = (ticker_ret - spy_ret) * 100
+
+    prev.update(
+        {
+            "open": o,
+            "high": h,
+            "low": l,
+            "close": c,
+            "sma50": sma[50],
+            "spy_close": spy,
+        }
+    )
+    state.count += 1
+    state.last_close = c
+    return row
+
+
+class IncrementalIndicatorEngine:
+    """
+    티커별 지표 프레임과 롤링 상태를 OHLCV 저장소와 같은 Parquet 디렉터리(indicators/)에 보관하고,
+    새로 들어온 봉만 update()로 이어 붙입니다.
+    """
+
+    def __init__(self, max_rows: int = 600, store: Optional[OhlcvStore] = None):
+        self.max_rows = max_rows
+        self.store = store or OhlcvStore(subdir="indicators")
+
+    @staticmethod
+    def _spy_closes(index: pd.Index, spy_df: Optional[pd.DataFrame]) -> np.ndarray:
+        if spy_df is None or spy_df.empty or "Close" not in spy_df.columns:
+            return np.full(len(index), NAN)
+        return spy_df["Close"].reindex(index).to_numpy(dtype=float)
+
+    def _run(
+        self,
+        state: IndicatorState,
+        bars: pd.DataFrame,
+        spy_df: Optional[pd.DataFrame],
+    ) -> pd.DataFrame:
+        spy_closes = self._spy_closes(bars.index, spy_df)
+        records = bars[["Open", "High", "Low", "Close", "Volume"]].to_dict("records")
+        rows = [
+            update(state, record, spy_closes[i]) for i, record in enumerate(records)
+        ]
+        if len(bars):
+            state.last_date = pd.Timestamp(bars.index[-1]).isoformat()
+        frame = pd.DataFrame(rows, index=bars.index, columns=INDICATOR_COLUMNS)
+        for col in BOOL_COLUMNS:
+            frame[col] = frame[col].astype(bool)
+        frame.index.name = "Date"
+        return frame
+
+    def replay(
+        self,
+        df: pd.DataFrame,
+        spy_df: Optional[pd.DataFrame] = None,
+        rank_window: Optional[int] = None,
+    ) -> tuple[pd.DataFrame, IndicatorState]:
+        """전체 히스토리로 상태를 새로 만들고 지표 프레임을 반환합니다."""
+        state = IndicatorState(rank_window=rank_window or max(len(df), 1))
+        return self._run(state, df, spy_df), state
+
+    def extend(
+        self,
+        state: IndicatorState,
+        frame: pd.DataFrame,
+        new_bars: pd.DataFrame,
+        spy_df: Optional[pd.DataFrame] = None,
+    ) -> pd.DataFrame:
+        """저장된 지표 프레임 뒤에 new_bars 행을 O(1)/봉으로 이어 붙입니다."""
+        if new_bars.empty:
+            return frame
+        appended = self._run(state, new_bars, spy_df)
+        return pd.concat([frame, OhlcvStore.align_index(appended, frame)])
+
+    def _load(self, ticker: str) -> tuple[pd.DataFrame, Optional[IndicatorState]]:
+        frame = self.store.read(ticker)
+        raw = frame.attrs.get(_STATE_ATTR)
+        if frame.empty or not raw:
+            return frame, None
+        try:
+            return frame, IndicatorState.from_dict(_json_restore(json.loads(raw)))
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Discarding indicator state for {ticker}: {e}")
+            return pd.DataFrame(), None
+
+    def _save(self, ticker: str, frame: pd.DataFrame, state: IndicatorState) -> None:
+        payload = json.dumps(_json_safe(state.to_dict()))
+        self.store.write(
+            ticker, frame.tail(self.max_rows), attrs={_STATE_ATTR: payload}
+        )
+
+    def indicators_for(
+        self, ticker: str, df: pd.DataFrame, spy_df: Optional[pd.DataFrame] = None
+    ) -> pd.DataFrame:
+        """
+        df(OHLCV)에 대한 지표 프레임을 반환합니다.
+        저장된 상태의 마지막 봉이 df 안에 있고 종가가 같으면 그 이후 봉만 계산하고,
+        아니면(최초 실행, 수정주가 변경, 공백 등) 전체를 다시 계산해 상태를 갱신합니다.
+        """
+        if df.empty:
+            return df
+
+        with self.store.lock_for(ticker):
+            frame, state = self._load(ticker)
+            new_bars: Optional[pd.DataFrame] = None
+            if state is not None and state.last_date is not None:
+                last_ts = pd.Timestamp(state.last_date)
+                aligned = OhlcvStore.align_index(df, frame)
+                if last_ts in aligned.index and np.isclose(
+                    float(aligned.loc[last_ts, "Close"]),
+                    float(state.last_close or NAN),
+                    rtol=1e-9,
+                ):
+                    new_bars = df.loc[aligned.index > last_ts]
+
+            if state is None or new_bars is None:
+                frame, state = self.replay(df, spy_df)
+            elif not new_bars.empty:
+                frame = self.extend(state, frame, new_bars, spy_df)
+            else:
+                return self._slice(frame, df)
+
+            if self.store.enabled:
+                self._save(ticker, frame, state)
+
+        return self._slice(frame, df)
+
+    @staticmethod
+    def _slice(frame: pd.DataFrame, df: pd.DataFrame) -> pd.DataFrame:
+        aligned = OhlcvStore.align_index(frame, df)
+        return aligned.reindex(df.index).dropna(how="all")
@@ -0,0 +1,321 @@
+"""
+add_indicators 지표 레지스트리.
+
+지표 그룹마다 만들어 내는 컬럼과 계산에 필요한 선행 컬럼을 선언하고, 전략(Strategy)별로
+evaluate_signals가 읽는 컬럼을 선언합니다. 요청된 전략의 컬럼에서 의존성을 따라간 그룹만 계산하므로,
+좁은 전략 집합으로 스크리닝할 때 나머지 pandas_ta 계산과 컬럼 메모리를 건너뜁니다.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional, cast
+
+import pandas as pd
+
+from myapi.domain.signal.signal_schema import Strategy
+from myapi.utils.lazy_import import lazy_import
+
+logger = logging.getLogger(__name__)
+
+ta = lazy_import("pandas_ta")
+
+Compute = Callable[[pd.DataFrame], "pd.DataFrame | dict[str, pd.Series]"]
+
+
+@dataclass(frozen=True)
+class IndicatorGroup:
+    """한 번의 계산으로 함께 만들어지는 컬럼 묶음."""
+
+    name: str
+    columns: tuple[str, ...]
+    compute: Compute
+    depends_on: tuple[str, ...] = ()
+
+
+def _flatten_columns(frame: pd.DataFrame) -> pd.DataFrame:
+    """Ensure technical indicator outputs use single-level string column names."""
+    if isinstance(frame.columns, pd.MultiIndex):
+        frame = frame.copy()
+        frame.columns = [
+            "_".join([str(part) for part in parts if part not in (None, "")])
+            for parts in frame.columns.to_list()
+        ]
+    return frame
+
+
+def _ohlcv(df: pd.DataFrame) -> tuple[pd.Series, pd.Series, pd.Series, pd.Series]:
+    return (
+        cast(pd.Series, df["High"]),
+        cast(pd.Series, df["Low"]),
+        cast(pd.Series, df["Close"]),
+        cast(pd.Series, df["Volume"]),
+    )
+
+
+def _sma(length: int) -> Compute:
+    return lambda df: {f"SMA{length}": ta.sma(close=df["Close"], length=length)}
+
+
+def _frame(result: Optional[pd.DataFrame]) -> pd.DataFrame:
+    return _flatten_columns(result) if result is not None else pd.DataFrame()
+
+
+def _stoch(df: pd.DataFrame) -> pd.DataFrame:
+    high, low, close, _ = _ohlcv(df)
+    return _frame(ta.stoch(high=high, low=low, close=close, k=14, d=3, smooth_k=3))
+
+
+def _bbands(df: pd.DataFrame) -> pd.DataFrame:
+    return _frame(ta.bbands(close=df["Close"], length=20, std=cast(Any, 2.0)))
+
+
+def _macd(df: pd.DataFrame) -> pd.DataFrame:
+    return _frame(ta.macd(close=df["Close"], fast=12, slow=26, signal=9))
+
+
+def _adx(df: pd.DataFrame) -> pd.DataFrame:
+    high, low, close, _ = _ohlcv(df)
+    return _frame(ta.adx(high=high, low=low, close=close, length=14))
+
+
+def _supertrend(df: pd.DataFrame) -> pd.DataFrame:
+    high, low, close, _ = _ohlcv(df)
+    return _frame(
+        ta.supertrend(
+            high=high, low=low, close=close, length=10, multiplier=cast(Any, 3.0)
+        )
+    )
+
+
+def _donchian(df: pd.DataFrame) -> pd.DataFrame:
+    high, low, _, _ = _ohlcv(df)
+    return _frame(ta.donchian(high=high, low=low, length=cast(Any, 20)))
+
+
+def _bb_width(df: pd.DataFrame) -> dict[str, pd.Series]:
+    # 볼린저 밴드 폭 (%)
+    upper_col = next((col for col in df.columns if col.endswith("BBU_20_2.0")), None)
+    lower_col = next((col for col in df.columns if col.endswith("BBL_20_2.0")), None)
+    if upper_col and lower_col:
+        return {"BB_WIDTH": (df[upper_col] - df[lower_col]) / df["Close"]}
+    return {"BB_WIDTH": pd.Series(index=df.index, dtype=float)}
+
+
+def _vcp(df: pd.DataFrame) -> dict[str, pd.Series]:
+    long_win, short_win = 20, 5  # ‘긴 변동성’/‘짧은 변동성’ 구간
+    return {
+        "RANGE_LONG": (
+            df["High"].rolling(long_win).max() - df["Low"].rolling(long_win).min()
+        )
+        / df["Low"].rolling(long_win).min(),
+        "RANGE_SHORT": (
+            df["High"].rolling(short_win).max() - df["Low"].rolling(short_win).min()
+        )
+        / df["Low"].rolling(short_win).min(),
+        # 거래량 드라이-업 지표(당일-vs-20일 평균 비율)
+        "VCP_VOL_REL": df["Volume"] / df["Volume"].rolling(long_win).mean(),
+    }
+
+
+def relative_strength(df: pd.DataFrame, spy_close: pd.Series) -> dict[str, pd.Series]:
+    """SPY 대비 20/60일 상대 수익률(%) - spy_close는 df 인덱스에 맞춰 정렬된 종가."""
+    out = {}
+    for period, col in [(20, "RS_SHORT"), (60, "RS_MID")]:
+        ticker_ret = df["Close"].pct_change(period)
+        spy_ret = spy_close.pct_change(period)
+        out[col] = (ticker_ret - spy_ret) * 100
+    return out
+
+
+# add_indicators 컬럼 순서대로 선언 (RS는 SPY가 필요해 compute_indicators에서 별도 처리)
+INDICATOR_GROUPS: tuple[IndicatorGroup, ...] = (
+    *(IndicatorGroup(f"SMA{n}", (f"SMA{n}",), _sma(n)) for n in (5, 10, 20, 50, 200)),
+    IndicatorGroup("VOL20", ("VOL20",), lambda df: {"VOL20": df["Volume"].rolling(20).mean()}),
+    IndicatorGroup(
+        "VOL_Z",
+        ("VOL_Z",),
+        lambda df: {"VOL_Z": (df["Volume"] - df["VOL20"]) / df["Volume"].rolling(20).std()},
+        depends_on=("VOL20",),
+    ),
+    IndicatorGroup(
+        "VOL_PCTL60",
+        ("VOL_PCTL60",),
+        lambda df: {"VOL_PCTL60": df["Volume"].rank(pct=True, method="max")},
+    ),
+    IndicatorGroup(
+        "VolumeSpike",
+        ("VolumeSpike", "VolumeSpikeStrength"),
+        lambda df: {
+            "VolumeSpike": df["Volume"] > df["VOL20"] * 2,
+            "VolumeSpikeStrength": df["Volume"] / df["VOL20"],  # 급등 강도
+        },
+        depends_on=("VOL20",),
+    ),
+    IndicatorGroup("RSI14", ("RSI14",), lambda df: {"RSI14": ta.rsi(close=df["Close"], length=14)}),
+    IndicatorGroup(
+        "ATR14",
+        ("ATR14",),
+        lambda df: {
+            "ATR14": ta.atr(high=df["High"], low=df["Low"], close=df["Close"], length=14)
+        },
+    ),
+    IndicatorGroup("STOCH", ("STOCHk_14_3_3", "STOCHd_14_3_3", "STOCHh_14_3_3"), _stoch),
+    IndicatorGroup(
+        "BBANDS",
+        (
+            "BBL_20_2.0_2.0",
+            "BBM_20_2.0_2.0",
+            "BBU_20_2.0_2.0",
+            "BBB_20_2.0_2.0",
+            "BBP_20_2.0_2.0",
+        ),
+        _bbands,
+    ),
+    IndicatorGroup("MACD", ("MACD_12_26_9", "MACDh_12_26_9", "MACDs_12_26_9"), _macd),
+    IndicatorGroup("ROC5", ("ROC5",), lambda df: {"ROC5": ta.roc(close=df["Close"], length=5)}),
+    IndicatorGroup("ADX", ("ADX_14", "ADXR_14_2", "DMP_14", "DMN_14"), _adx),
+    IndicatorGroup(
+        "SUPERTREND",
+        ("SUPERT_10_3.0", "SUPERTd_10_3.0", "SUPERTl_10_3.0", "SUPERTs_10_3.0"),
+        _supertrend,
+    ),
+    IndicatorGroup("DONCHIAN", ("DCL_20_20", "DCM_20_20", "DCU_20_20"), _donchian),
+    IndicatorGroup(
+        "SMA50_SLOPE",
+        ("SMA50_SLOPE",),
+        lambda df: {"SMA50_SLOPE": df["SMA50"].diff()},
+        depends_on=("SMA50",),
+    ),
+    IndicatorGroup(
+        "VWAP",
+        ("VWAP",),
+        lambda df: {
+            "VWAP": ta.vwap(
+                high=df["High"], low=df["Low"], close=df["Close"], volume=df["Volume"]
+            )
+        },
+    ),
+    IndicatorGroup("RSI5", ("RSI5",), lambda df: {"RSI5": ta.rsi(close=df["Close"], length=5)}),
+    IndicatorGroup("BB_WIDTH", ("BB_WIDTH",), _bb_width, depends_on=("BBL_20_2.0_2.0",)),
+    IndicatorGroup(
+        "AVG_VOL20", ("AVG_VOL20",), lambda df: {"AVG_VOL20": df["Volume"].rolling(20).mean()}
+    ),
+    IndicatorGroup(
+        "LIQUIDITY_FILTER",
+        ("LIQUIDITY_FILTER",),
+        lambda df: {"LIQUIDITY_FILTER": df["AVG_VOL20"] > 500000},  # 최소 거래량 기준
+        depends_on=("AVG_VOL20",),
+    ),
+    IndicatorGroup(
+        "ATR_PCT",
+        ("ATR_PCT",),
+        lambda df: {"ATR_PCT": (df["ATR14"] / df["Close"]) * 100},
+        depends_on=("ATR14",),
+    ),
+    IndicatorGroup(
+        "GAP_PCT",
+        ("GAP_PCT",),
+        lambda df: {"GAP_PCT": df["Open"] / df["Close"].shift(1) - 1},
+    ),
+    IndicatorGroup(
+        "ATR_RATIO",
+        ("ATR_RATIO",),
+        # True-Range Ratio: 오늘 변동성 / 20일 평균 변동성
+        lambda df: {"ATR_RATIO": df["ATR14"] / df["ATR14"].rolling(20).mean()},
+        depends_on=("ATR14",),
+    ),
+    IndicatorGroup("ROC1", ("ROC1",), lambda df: {"ROC1": ta.roc(close=df["Close"], length=1)}),
+    IndicatorGroup("ROC3", ("ROC3",), lambda df: {"ROC3": ta.roc(close=df["Close"], length=3)}),
+    IndicatorGroup(
+        "BULL_ENGULF",
+        ("BULL_ENGULF",),
+        lambda df: {
+            "BULL_ENGULF": (
+                (df["Close"].shift(1) < df["Open"].shift(1))  # 전일 음봉
+                & (df["Open"] < df["Close"].shift(1))  # 오늘 시가 < 전일 종가
+                & (df["Close"] > df["Open"].shift(1))  # 오늘 종가 > 전일 시가
+            )
+        },
+    ),
+    IndicatorGroup("SMA150", ("SMA150",), _sma(150)),
+    IndicatorGroup("VCP", ("RANGE_LONG", "RANGE_SHORT", "VCP_VOL_REL"), _vcp),
+)
+
+RS_COLUMNS: tuple[str, ...] = ("RS_SHORT", "RS_MID")
+
+COLUMN_GROUPS: dict[str, IndicatorGroup] = {
+    col: group for group in INDICATOR_GROUPS for col in group.columns
+}
+
+# evaluate_signals가 전략별로 읽는 지표 컬럼 (OHLCV 원본 컬럼은 항상 존재)
+STRATEGY_COLUMNS: dict[Strategy, tuple[str, ...]] = {
+    "PULLBACK": ("SMA10", "SMA50"),
+    "OVERSOLD": ("RSI14", "BBL_20_2.0_2.0", "STOCHk_14_3_3"),
+    "MACD_LONG": ("MACD_12_26_9", "MACDh_12_26_9", "MACDs_12_26_9"),
+    "GAPPER": (),
+    "VOL_DRY_BOUNCE": ("VOL_Z", "SMA5", "SMA20", "VOL_PCTL60"),
+    "GOLDEN_CROSS": ("SMA50", "SMA200", "VOL_Z"),
+    "MEAN_REVERSION": ("SMA20",),
+    "BREAKOUT": ("RSI14",),
+    "GAP_UP": ("VOL_Z",),
+    "VWAP_BOUNCE": (),
+    "MOMENTUM_SURGE": (),
+    "VOLUME_SPIKE": ("VolumeSpike", "VOL20"),
+    "TREND_UP": ("ADX_14", "DMP_14", "DMN_14", "SUPERTd_10_3.0", "SMA50", "SMA200", "SMA50_SLOPE"),
+    "TREND_DOWN": ("ADX_14", "DMP_14", "DMN_14", "SUPERTd_10_3.0", "SMA50", "SMA200", "SMA50_SLOPE"),
+    "DONCHIAN_BREAKOUT": ("DCU_20_20", "ADX_14", "VOL_Z"),
+    "VOLUME_EXPANSION": ("ROC1",),
+    "QUIET_PULLBACK": ("SMA10", "ATR_RATIO"),
+    "VOLATILITY_COMPRESSION": ("BB_WIDTH",),
+    "VCP_DAILY": ("SMA50", "SMA150", "SMA200", "RANGE_LONG", "RANGE_SHORT", "VCP_VOL_REL"),
+    "RS_SHORT": ("RS_SHORT",),
+    "RS_MID": ("RS_MID",),
+    "SUPERTREND_BUY": (),
+    "SUPERTREND_SELL": (),
+}
+
+
+def required_columns(strategies: Iterable[Strategy]) -> set[str]:
+    """전략들이 읽는 컬럼에 의존성을 따라간 전체 컬럼 집합 (transitive closure)."""
+    pending = [col for s in strategies for col in STRATEGY_COLUMNS.get(s, ())]
+    needed: set[str] = set()
+    while pending:
+        col = pending.pop()
+        if col in needed:
+            continue
+        needed.add(col)
+        group = COLUMN_GROUPS.get(col)
+        if group is not None:
+            pending.extend(group.columns)
+            pending.extend(group.depends_on)
+    return needed
+
+
+def compute_indicators(
+    df: pd.DataFrame,
+    spy_df: Optional[pd.DataFrame],
+    columns: Optional[set[str]] = None,
+    rs: Optional[Callable[[pd.DataFrame, Optional[pd.DataFrame]], pd.DataFrame]] = None,
+) -> pd.DataFrame:
+    """
+    columns에 속한 그룹만 선언 순서대로 계산합니다. columns가 None이면 전체 지표를 계산합니다.
+    rs는 RS 컬럼을 붙이는 함수(df, spy_df) -> df 입니다.
+    """
+    df = df.copy()
+    for group in INDICATOR_GROUPS:
+        if columns is not None and not columns.intersection(group.columns):
+            continue
+        result = group.compute(df)
+        for col in group.columns:
+            if col in result:
+                df[col] = result[col]
+        if isinstance(result, pd.DataFrame):
+            # pandas_ta 버전에 따라 선언되지 않은 부가 컬럼이 있을 수 있음
+            for col in result.columns:
+                if col not in df.columns:
+                    df[col] = result[col]
+
+    df = df.dropna(how="all").reset_index(drop=False).set_index("Date")
+    if rs is not None and (columns is None or columns.intersection(RS_COLUMNS)):
+        df = rs(df, spy_df)
+    return df
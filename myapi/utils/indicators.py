@@ -1,14 +1,16 @@
 import io
-import matplotlib
-from matplotlib import pyplot as plt
+import os
 import pandas as pd
 import numpy as np
 
+from myapi.utils.lazy_import import lazy_import
 
-matplotlib.use(
-    "Agg", force=True
-)  # GUI 백엔드 대신 Agg 사용 (반드시 import plt 전에 호출)
-import mplfinance as mpf
+# GUI 백엔드 대신 Agg 사용 (matplotlib이 처음 import될 때 적용되므로 import 전에 설정)
+os.environ["MPLBACKEND"] = "Agg"
+
+# 차트 렌더링에서만 쓰므로 첫 사용 시 import (Lambda 콜드 스타트)
+plt = lazy_import("matplotlib.pyplot")
+mpf = lazy_import("mplfinance")
 
 
 def calculate_moving_average(df: pd.DataFrame, window: int):
@@ -51,6 +53,98 @@ def calculate_atr(df: pd.DataFrame, window=14):
     return atr
 
 
+def _true_range_array(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray
+) -> np.ndarray:
+    """True Range (마지막 축 = 시간). 첫 봉은 전일 종가가 없으므로 High - Low."""
+    prev_close = np.empty_like(close)
+    prev_close[..., 0] = np.nan
+    prev_close[..., 1:] = close[..., :-1]
+    ranges = np.stack(
+        [high - low, np.abs(high - prev_close), np.abs(low - prev_close)]
+    )
+    return np.fmax(np.fmax(ranges[0], ranges[1]), ranges[2])
+
+
+def _rolling_mean_min1(values: np.ndarray, window: int) -> np.ndarray:
+    """rolling(window, min_periods=1).mean()과 동일 (마지막 축 = 시간, NaN 없음 가정)."""
+    csum = np.cumsum(values, axis=-1)
+    out = np.empty_like(csum)
+    n = values.shape[-1]
+    head = min(window, n)
+    out[..., :head] = csum[..., :head] / np.arange(1, head + 1)
+    if n > window:
+        out[..., window:] = (csum[..., window:] - csum[..., :-window]) / window
+    return out
+
+
+def supertrend_arrays(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    atr_length: int = 10,
+    multiplier: float = 3.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    numpy 배열 기반 슈퍼트렌드 커널.
+
+    1D (dates) 또는 2D (tickers × dates) 배열을 받아 밴드 재귀를 날짜 축으로 한 번만 순회하며,
+    2D 입력은 각 시점에서 모든 종목을 벡터 연산으로 동시에 갱신합니다.
+    calculate_supertrend와 같은 규칙(ATR = TR 단순이동평균, min_periods=1)을 따릅니다.
+
+    Returns:
+        tuple: (supertrend, trend) - 입력과 같은 shape, trend는 1(상승) / -1(하락)
+    """
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+    close = np.asarray(close, dtype=float)
+    is_1d = close.ndim == 1
+    if is_1d:
+        high, low, close = high[None, :], low[None, :], close[None, :]
+
+    n = close.shape[-1]
+    supertrend = np.full(close.shape, np.nan)
+    trend = np.full(close.shape, np.nan)
+    if n == 0:
+        return (supertrend[0], trend[0]) if is_1d else (supertrend, trend)
+
+    hl2 = (high + low) / 2
+    atr = _rolling_mean_min1(_true_range_array(high, low, close), atr_length)
+    basic_upper = hl2 + multiplier * atr
+    basic_lower = hl2 - multiplier * atr
+
+    upper = basic_upper[:, 0].copy()
+    lower = basic_lower[:, 0].copy()
+    st_prev = upper.copy()
+    trend[:, 0] = -1.0
+    supertrend[:, 0] = st_prev
+
+    for i in range(1, n):
+        prev_close = close[:, i - 1]
+        was_upper = st_prev == upper
+
+        upper = np.where(
+            (basic_upper[:, i] < upper) | (prev_close > upper), basic_upper[:, i], upper
+        )
+        lower = np.where(
+            (basic_lower[:, i] > lower) | (prev_close < lower), basic_lower[:, i], lower
+        )
+
+        cur_close = close[:, i]
+        cur_trend = np.where(
+            was_upper,
+            np.where(cur_close > upper, 1.0, -1.0),
+            np.where(cur_close < lower, -1.0, 1.0),
+        )
+        st_prev = np.where(cur_trend == 1.0, lower, upper)
+        trend[:, i] = cur_trend
+        supertrend[:, i] = st_prev
+
+    if is_1d:
+        return supertrend[0], trend[0]
+    return supertrend, trend
+
+
 def calculate_supertrend(df: pd.DataFrame, atr_length=10, multiplier=3.0):
     """
     슈퍼트렌드 지표를 계산합니다.
@@ -63,59 +157,17 @@ def calculate_supertrend(df: pd.DataFrame, atr_length=10, multiplier=3.0):
     Returns:
         tuple: (supertrend, trend) - 슈퍼트렌드 값과 추세 방향 (1: 상승, -1: 하락)
     """
-    # hl2 계산 (High + Low) / 2
-    hl2 = (df["High"] + df["Low"]) / 2
-
-    # ATR 계산
-    atr = calculate_atr(df, atr_length)
-
-    # 기본 상하단 밴드 계산
-    basic_upper_band = hl2 + (multiplier * atr)
-    basic_lower_band = hl2 - (multiplier * atr)
-
-    # 최종 밴드 계산을 위한 초기화
-    upper_band = pd.Series(index=df.index, dtype=float)
-    lower_band = pd.Series(index=df.index, dtype=float)
-    supertrend = pd.Series(index=df.index, dtype=float)
-    trend = pd.Series(index=df.index, dtype=int)
-
-    # 첫 번째 값 설정
-    upper_band.iloc[0] = basic_upper_band.iloc[0]
-    lower_band.iloc[0] = basic_lower_band.iloc[0]
-    trend.iloc[0] = -1
-    supertrend.iloc[0] = upper_band.iloc[0]
-
-    # 각 시점별로 계산
-    for i in range(1, len(df)):
-        # 최종 밴드 계산
-        if (
-            basic_upper_band.iloc[i] < upper_band.iloc[i - 1]
-            or df["Close"].iloc[i - 1] > upper_band.iloc[i - 1]
-        ):
-            upper_band.iloc[i] = basic_upper_band.iloc[i]
-        else:
-            upper_band.iloc[i] = upper_band.iloc[i - 1]
-
-        if (
-            basic_lower_band.iloc[i] > lower_band.iloc[i - 1]
-            or df["Close"].iloc[i - 1] < lower_band.iloc[i - 1]
-        ):
-            lower_band.iloc[i] = basic_lower_band.iloc[i]
-        else:
-            lower_band.iloc[i] = lower_band.iloc[i - 1]
-
-        # 추세 결정
-        if supertrend.iloc[i - 1] == upper_band.iloc[i - 1]:
-            trend.iloc[i] = 1 if df["Close"].iloc[i] > upper_band.iloc[i] else -1
-        else:
-            trend.iloc[i] = -1 if df["Close"].iloc[i] < lower_band.iloc[i] else 1
-
-        # 슈퍼트렌드 값 설정
-        supertrend.iloc[i] = (
-            lower_band.iloc[i] if trend.iloc[i] == 1 else upper_band.iloc[i]
-        )
-
-    return supertrend, trend
+    supertrend, trend = supertrend_arrays(
+        df["High"].to_numpy(dtype=float),
+        df["Low"].to_numpy(dtype=float),
+        df["Close"].to_numpy(dtype=float),
+        atr_length=atr_length,
+        multiplier=multiplier,
+    )
+    return (
+        pd.Series(supertrend, index=df.index, dtype=float),
+        pd.Series(trend, index=df.index, dtype=float),
+    )
 
 
 def check_supertrend_signals(df: pd.DataFrame, atr_length=10, multiplier=3.0):
@@ -0,0 +1,88 @@
+"""Deferred imports for heavy third-party modules.
+
+Lambda cold starts import ``myapi.main`` (and therefore every router and
+service) before the first request. Modules such as ``google.genai``,
+``openai``, ``pandas_ta`` or ``matplotlib`` cost hundreds of milliseconds each
+but are only needed by a few endpoints, so services bind them through
+:func:`lazy_import` and the real import happens on first attribute access.
+"""
+
+import importlib
+import logging
+import threading
+import time
+import types
+from typing import Any, Callable, Optional
+
+_logger = logging.getLogger(__name__)
+_lock = threading.RLock()
+_load_times: dict[str, float] = {}
+_proxies: dict[str, "LazyModule"] = {}
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports ``name`` the first time an attribute is read."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+        self.__dict__["_lazy_on_load"] = []
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is not None:
+            return module
+        with _lock:
+            module = self.__dict__["_lazy_module"]
+            if module is None:
+                started = time.perf_counter()
+                module = importlib.import_module(self.__name__)
+                self.__dict__["_lazy_module"] = module
+                for hook in self.__dict__["_lazy_on_load"]:
+                    hook(module)
+                elapsed = time.perf_counter() - started
+                _load_times[self.__name__] = elapsed
+                _logger.debug("Lazy-loaded %s in %.3fs", self.__name__, elapsed)
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "deferred"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(
+    name: str, on_load: Optional[Callable[[types.ModuleType], None]] = None
+) -> Any:
+    """Return the shared proxy for ``name``.
+
+    ``on_load`` runs once right after the real import, whichever caller
+    triggers it (or immediately if the module is already loaded).
+    """
+    with _lock:
+        proxy = _proxies.get(name)
+        if proxy is None:
+            proxy = _proxies[name] = LazyModule(name)
+        if on_load is not None:
+            if proxy.__dict__["_lazy_module"] is not None:
+                on_load(proxy.__dict__["_lazy_module"])
+            else:
+                proxy.__dict__["_lazy_on_load"].append(on_load)
+    return proxy
+
+
+def is_loaded(module: Any) -> bool:
+    """True when ``module`` is a real module or a lazy proxy that was imported."""
+    if isinstance(module, LazyModule):
+        return module.__dict__["_lazy_module"] is not None
+    return isinstance(module, types.ModuleType)
+
+
+def lazy_load_times() -> dict[str, float]:
+    """Seconds spent importing each lazy module so far (for the import report)."""
+    return dict(_load_times)
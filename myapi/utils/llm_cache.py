@@ -0,0 +1,148 @@
+"""Content-addressed cache for LLM responses.
+
+Entries are keyed by ``(provider, model, schema name, sha256(prompt parts))``
+so an identical request - an SQS redelivery, a ``force_refresh`` retry or the
+same prompt arriving through another queue path - is answered from disk
+instead of paying the provider again. Entries expire after a TTL and the
+cache is pruned to a bounded number of files.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from myapi.utils.disk_cache import JsonDiskCache
+
+_logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+# LLM_CACHE_TTL_SECONDS=0 이면 캐시 비활성화
+LLM_CACHE_TTL = timedelta(
+    seconds=int(os.environ.get("LLM_CACHE_TTL_SECONDS", 6 * 3600))
+)
+LLM_CACHE_MAX_ENTRIES = 5000
+_PRUNE_EVERY = 100
+
+
+class LLMResponseCache:
+    """JsonDiskCache 위의 LLM 응답 캐시 (공급자별 hit/miss 카운터 포함)."""
+
+    def __init__(
+        self,
+        namespace: str = "llm_responses",
+        ttl: timedelta = LLM_CACHE_TTL,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+        root: Optional[str] = None,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._store = JsonDiskCache(namespace, root)
+        self._lock = threading.Lock()
+        self._hits: Counter[str] = Counter()
+        self._misses: Counter[str] = Counter()
+        self._writes = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._store.enabled and self.ttl.total_seconds() > 0
+
+    @staticmethod
+    def make_key(
+        provider: str, model: Any, schema: Optional[type], *parts: Optional[str]
+    ) -> str:
+        digest = hashlib.sha256(
+            "\x1f".join(part or "" for part in parts).encode("utf-8")
+        ).hexdigest()
+        schema_name = schema.__name__ if schema is not None else "text"
+        return f"{provider}-{getattr(model, 'value', model)}-{schema_name}-{digest}"
+
+    def get(self, provider: str, key: str, schema: Optional[type] = None) -> Any:
+        """캐시된 응답 (schema가 있으면 모델로 복원) 또는 None."""
+        if not self.enabled:
+            return None
+        value = self._store.get(key)
+        if value is not None and schema is not None:
+            try:
+                value = schema.model_validate(value)  # type: ignore[attr-defined]
+            except Exception as e:
+                _logger.debug("Discarding stale LLM cache entry %s: %s", key, e)
+                self._store.delete(key)
+                value = None
+        with self._lock:
+            if value is None:
+                self._misses[provider] += 1
+            else:
+                self._hits[provider] += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        if not self.enabled or value is None or value == "":
+            return
+        if isinstance(value, BaseModel):
+            value = value.model_dump(mode="json")
+        self._store.set(key, value, datetime.now() + self.ttl)
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % _PRUNE_EVERY == 1
+        if prune:
+            self._store.prune(self.max_entries)
+
+    def cached(
+        self,
+        provider: str,
+        key: str,
+        schema: Optional[type],
+        call: Callable[[], R],
+    ) -> R:
+        hit = self.get(provider, key, schema)
+        if hit is not None:
+            return hit
+        result = call()
+        self.set(key, result)
+        return result
+
+    async def acached(
+        self,
+        provider: str,
+        key: str,
+        schema: Optional[type],
+        call: Callable[[], Awaitable[R]],
+    ) -> R:
+        hit = self.get(provider, key, schema)
+        if hit is not None:
+            return hit
+        result = await call()
+        self.set(key, result)
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            providers = sorted(set(self._hits) | set(self._misses))
+            per_provider = {
+                p: _rate(self._hits[p], self._misses[p]) for p in providers
+            }
+            total = _rate(sum(self._hits.values()), sum(self._misses.values()))
+        return {"enabled": self.enabled, **total, "providers": per_provider}
+
+
+def _rate(hits: int, misses: int) -> dict[str, Any]:
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / lookups if lookups else None,
+    }
+
+
+@lru_cache(maxsize=1)
+def get_llm_response_cache() -> LLMResponseCache:
+    """프로세스 단위 LLM 응답 캐시 (AIService / AsyncAIService 공용)."""
+    return LLMResponseCache()
@@ -0,0 +1,221 @@
+"""Per-provider latency, token and cost instrumentation for LLM calls.
+
+Every SDK call made by ``AIService`` / ``AsyncAIService`` runs inside
+:func:`track_llm_call`, which records latency, prompt/completion tokens from
+the response usage fields, HTTP retries and the error class per
+``(provider, model)``. Totals and latency histograms are served by the
+metrics endpoint, and :func:`job_scope` logs a per-request summary so each
+SQS batch job reports what its LLM calls cost.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+_logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS: tuple[float, ...] = (0.5, 1, 2, 5, 10, 20, 30, 60, 120, math.inf)
+
+# USD per 1M tokens (input, output). 목록 가격 기준 추정치 - 모델 비교용
+MODEL_PRICES: dict[str, tuple[float, float]] = {
+    "sonar": (1.0, 1.0),
+    "sonar-pro": (3.0, 15.0),
+    "gpt-5-mini": (0.25, 2.0),
+    "gpt-4o-mini": (0.15, 0.6),
+    "o3-mini": (1.1, 4.4),
+    "o4-mini-2025-04-16": (1.1, 4.4),
+    "gemini-2.5-flash-preview-09-2025": (0.3, 2.5),
+    "apac.amazon.nova-lite-v1:0": (0.06, 0.24),
+}
+
+
+@dataclass
+class _Series:
+    calls: int = 0
+    retries: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost_usd: float = 0.0
+    latency_sum: float = 0.0
+    errors: Counter = field(default_factory=Counter)
+    entries: Counter = field(default_factory=Counter)
+    buckets: list[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+
+    def add(self, call: "LLMCall") -> None:
+        self.calls += 1
+        self.retries += call.retries
+        self.prompt_tokens += call.prompt_tokens
+        self.completion_tokens += call.completion_tokens
+        self.cost_usd += call.cost_usd
+        self.latency_sum += call.latency
+        self.entries[call.entry] += 1
+        if call.error:
+            self.errors[call.error] += 1
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if call.latency <= bound:
+                self.buckets[i] += 1
+                break
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "entries": dict(self.entries),
+            "errors": dict(self.errors),
+            "retries": self.retries,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cost_usd": round(self.cost_usd, 6),
+            "latency_avg": self.latency_sum / self.calls if self.calls else None,
+            "latency_histogram": {
+                ("+Inf" if math.isinf(b) else str(b)): n
+                for b, n in zip(LATENCY_BUCKETS, self.buckets)
+            },
+        }
+
+
+@dataclass
+class LLMCall:
+    provider: str
+    model: str
+    entry: str
+    attempts: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    sdk_retries: int = 0
+    latency: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def retries(self) -> int:
+        return max(self.attempts - 1, 0) + self.sdk_retries
+
+    @property
+    def cost_usd(self) -> float:
+        price_in, price_out = MODEL_PRICES.get(self.model, (0.0, 0.0))
+        tokens_cost = (
+            self.prompt_tokens * price_in + self.completion_tokens * price_out
+        )
+        return tokens_cost / 1e6
+
+    def observe(self, response: Any) -> Any:
+        """OpenAI / Gemini / Bedrock 응답의 usage 필드에서 토큰 수를 읽습니다."""
+        usage = getattr(response, "usage", None)
+        if usage is not None and hasattr(usage, "prompt_tokens"):
+            self.prompt_tokens += usage.prompt_tokens or 0
+            self.completion_tokens += usage.completion_tokens or 0
+            return response
+        usage_metadata = getattr(response, "usage_metadata", None)
+        if usage_metadata is not None:
+            self.prompt_tokens += usage_metadata.prompt_token_count or 0
+            self.completion_tokens += usage_metadata.candidates_token_count or 0
+            return response
+        if isinstance(response, dict):
+            bedrock_usage = response.get("usage") or {}
+            self.prompt_tokens += bedrock_usage.get("inputTokens", 0)
+            self.completion_tokens += bedrock_usage.get("outputTokens", 0)
+            metadata = response.get("ResponseMetadata") or {}
+            self.sdk_retries += metadata.get("RetryAttempts", 0)
+        return response
+
+
+class LLMMetrics:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._series: dict[tuple[str, str], _Series] = {}
+
+    def record(self, call: LLMCall, scopes: tuple[_Series, ...] = ()) -> None:
+        with self._lock:
+            key = (call.provider, call.model)
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series()
+            series.add(call)
+            for scope in scopes:
+                scope.add(call)
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return [
+                {"provider": provider, "model": model, **series.as_dict()}
+                for (provider, model), series in sorted(self._series.items())
+            ]
+
+
+llm_metrics = LLMMetrics()
+
+_current_call: ContextVar[Optional[LLMCall]] = ContextVar("llm_call", default=None)
+# 현재 열려 있는 usage_scope 집계들 (중첩 가능: 요청 단위 + 번역 tier 단위 등)
+_scopes: ContextVar[tuple[_Series, ...]] = ContextVar("llm_scopes", default=())
+
+
+@contextmanager
+def track_llm_call(provider: str, model: Any, entry: str) -> Iterator[LLMCall]:
+    """SDK 호출 하나를 측정합니다. 블록 안에서 call.observe(response)로 토큰 수를 기록."""
+    call = LLMCall(
+        provider=provider, model=str(getattr(model, "value", model)), entry=entry
+    )
+    token = _current_call.set(call)
+    started = time.perf_counter()
+    try:
+        yield call
+    except BaseException as e:
+        call.error = type(e).__name__
+        raise
+    finally:
+        call.latency = time.perf_counter() - started
+        _current_call.reset(token)
+        llm_metrics.record(call, _scopes.get())
+
+
+def on_http_request(request: Any) -> None:
+    """httpx request hook: SDK 내부 재시도를 포함한 HTTP 시도 횟수를 셉니다."""
+    call = _current_call.get()
+    if call is not None:
+        call.attempts += 1
+
+
+async def aon_http_request(request: Any) -> None:
+    on_http_request(request)
+
+
+@contextmanager
+def usage_scope() -> Iterator[_Series]:
+    """블록 안에서 일어난 LLM 호출만 따로 집계합니다 (바깥 scope 집계에도 그대로 반영)."""
+    series = _Series()
+    token = _scopes.set(_scopes.get() + (series,))
+    try:
+        yield series
+    finally:
+        _scopes.reset(token)
+
+
+@contextmanager
+def job_scope(name: str) -> Iterator[None]:
+    """요청(배치 작업) 단위로 LLM 호출을 집계해 끝날 때 요약을 로그로 남깁니다."""
+    with usage_scope() as series:
+        try:
+            yield
+        finally:
+            _log_job(name, series)
+
+
+def _log_job(name: str, series: _Series) -> None:
+    if series.calls:
+        _logger.info(
+            "LLM usage for %s: calls=%d errors=%d retries=%d tokens=%d/%d "
+            "cost=$%.4f latency=%.1fs",
+            name,
+            series.calls,
+            sum(series.errors.values()),
+            series.retries,
+            series.prompt_tokens,
+            series.completion_tokens,
+            series.cost_usd,
+            series.latency_sum,
+        )
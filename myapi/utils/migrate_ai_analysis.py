@@ -0,0 +1,141 @@
+"""One-off migration of ``crypto.ai_analysis.value`` from JSON to JSONB.
+
+Analysis reads filter on ``name``/``date`` and on ``value->>'ticker'``,
+``value->>'etf_ticker'`` and ``value->>'ai_model'``; without indexes every
+read is a sequential scan, and a plain ``json`` column re-parses each row's
+text for every ``->>``. The upgrade:
+
+1. converts the column with ``ALTER TABLE ... TYPE jsonb`` (rewrites the
+   table under an exclusive lock; skipped when it is already ``jsonb``),
+2. creates the indexes declared on ``AiAnalysisModel`` with
+   ``CREATE INDEX CONCURRENTLY`` so reads and writes continue meanwhile
+   (an index left INVALID by an interrupted run is dropped and rebuilt),
+3. runs ``ANALYZE`` so the planner picks them up.
+
+Every step is idempotent, so the script can be re-run::
+
+    python -m myapi.utils.migrate_ai_analysis --dry-run
+    python -m myapi.utils.migrate_ai_analysis
+    python -m myapi.utils.migrate_ai_analysis --downgrade
+"""
+
+import argparse
+import logging
+import sys
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+_logger = logging.getLogger(__name__)
+
+SCHEMA = "crypto"
+TABLE = "ai_analysis"
+
+# AiAnalysisModel.__table_args__ 의 인덱스와 이름/표현식이 같아야 합니다.
+INDEXES: dict[str, str] = {
+    "ix_ai_analysis_name_date": "(name, date)",
+    "ix_ai_analysis_ticker": "((value ->> 'ticker'))",
+    "ix_ai_analysis_etf_ticker": "((value ->> 'etf_ticker'))",
+    "ix_ai_analysis_ai_model": "((value ->> 'ai_model'))",
+}
+
+# 테이블 재작성 중 다른 트랜잭션을 오래 막지 않도록 잠금 대기 시간을 제한
+LOCK_TIMEOUT = "10s"
+
+
+def _column_type(conn: Connection) -> Optional[str]:
+    return conn.execute(
+        text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_schema = :schema AND table_name = :table "
+            "AND column_name = 'value'"
+        ),
+        {"schema": SCHEMA, "table": TABLE},
+    ).scalar()
+
+
+def _index_state(conn: Connection, name: str) -> Optional[bool]:
+    """인덱스가 없으면 None, 있으면 유효(valid) 여부."""
+    return conn.execute(
+        text(
+            "SELECT i.indisvalid FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = :schema AND c.relname = :name"
+        ),
+        {"schema": SCHEMA, "name": name},
+    ).scalar()
+
+
+def upgrade_statements(conn: Connection) -> list[str]:
+    """현재 DB 상태에서 업그레이드에 필요한 SQL 목록."""
+    statements: list[str] = []
+    if _column_type(conn) == "json":
+        statements.append(f"SET lock_timeout = '{LOCK_TIMEOUT}'")
+        statements.append(
+            f"ALTER TABLE {SCHEMA}.{TABLE} "
+            "ALTER COLUMN value TYPE jsonb USING value::jsonb"
+        )
+        statements.append("RESET lock_timeout")
+    for name, columns in INDEXES.items():
+        state = _index_state(conn, name)
+        if state:
+            continue
+        if state is False:
+            statements.append(f"DROP INDEX CONCURRENTLY IF EXISTS {SCHEMA}.{name}")
+        statements.append(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+            f"ON {SCHEMA}.{TABLE} {columns}"
+        )
+    if statements:
+        statements.append(f"ANALYZE {SCHEMA}.{TABLE}")
+    return statements
+
+
+def downgrade_statements(conn: Connection) -> list[str]:
+    statements = [
+        f"DROP INDEX CONCURRENTLY IF EXISTS {SCHEMA}.{name}" for name in INDEXES
+    ]
+    if _column_type(conn) == "jsonb":
+        statements.append(f"SET lock_timeout = '{LOCK_TIMEOUT}'")
+        statements.append(
+            f"ALTER TABLE {SCHEMA}.{TABLE} "
+            "ALTER COLUMN value TYPE json USING value::json"
+        )
+        statements.append("RESET lock_timeout")
+    return statements
+
+
+def run(engine: Engine, downgrade: bool = False, dry_run: bool = False) -> list[str]:
+    # CREATE/DROP INDEX CONCURRENTLY는 트랜잭션 밖에서만 실행 가능 → autocommit
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        statements = (
+            downgrade_statements(conn) if downgrade else upgrade_statements(conn)
+        )
+        for statement in statements:
+            _logger.info("%s%s", "[dry-run] " if dry_run else "", statement)
+            if not dry_run:
+                conn.execute(text(statement))
+    return statements
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--downgrade", action="store_true")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="실행하지 않고 SQL만 출력"
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    from myapi.database import engine
+
+    statements = run(engine, downgrade=args.downgrade, dry_run=args.dry_run)
+    if not statements:
+        _logger.info("Nothing to do: %s.%s is already migrated", SCHEMA, TABLE)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
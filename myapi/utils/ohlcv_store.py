@@ -0,0 +1,187 @@
+import logging
+import os
+import re
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from myapi.utils.yfinance_cache import configure_yfinance_cache
+
+try:
+    import pyarrow  # noqa: F401  # Parquet engine used by pandas
+except ImportError:  # pragma: no cover - optional dependency guard
+    pyarrow = None  # type: ignore[assignment]
+
+_logger = logging.getLogger(__name__)
+_STORE_SUBDIR = "ohlcv"
+_COVERAGE_ATTR = "coverage_start"
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+
+def _index_dates(df: pd.DataFrame) -> pd.Index:
+    """Return the calendar date of each bar regardless of index timezone."""
+    return pd.Index(pd.DatetimeIndex(df.index).date)
+
+
+def slice_by_date(
+    df: pd.DataFrame, start: Optional[date] = None, end: Optional[date] = None
+) -> pd.DataFrame:
+    """Select bars whose session date falls within ``[start, end]``."""
+    if df.empty:
+        return df
+    dates = _index_dates(df)
+    mask = pd.Series(True, index=df.index)
+    if start is not None:
+        mask &= dates >= start
+    if end is not None:
+        mask &= dates <= end
+    return df.loc[mask.to_numpy()]
+
+
+class OhlcvStore:
+    """Per-ticker daily OHLCV bars persisted as Parquet under the yfinance cache dir.
+
+    Each ticker lives in its own file so that a daily run only rewrites the
+    tickers that actually received new bars. Reads are memory-mapped, which
+    keeps repeated lookups of the same history close to free.
+    """
+
+    def __init__(
+        self, root: Optional[Path | str] = None, subdir: str = _STORE_SUBDIR
+    ):
+        base = Path(root).expanduser() if root else configure_yfinance_cache()
+        self.root: Optional[Path] = None
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+        if pyarrow is None:
+            _logger.debug("pyarrow not installed; OHLCV store disabled")
+            return
+        if base is None:
+            return
+
+        target = base / subdir
+        try:
+            target.mkdir(parents=True, exist_ok=True)
+        except OSError as exc:
+            _logger.warning("Could not create OHLCV store directory %s: %s", target, exc)
+            return
+        self.root = target
+
+    @property
+    def enabled(self) -> bool:
+        return self.root is not None
+
+    def lock_for(self, ticker: str) -> threading.Lock:
+        """Serialize read-modify-write cycles for one ticker within the process."""
+        key = ticker.upper()
+        with self._locks_guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.Lock()
+            return lock
+
+    def path_for(self, ticker: str) -> Optional[Path]:
+        if self.root is None:
+            return None
+        return self.root / f"{_UNSAFE_CHARS.sub('_', ticker.upper())}.parquet"
+
+    def read(self, ticker: str) -> pd.DataFrame:
+        """Return the stored history for ``ticker`` or an empty frame."""
+        path = self.path_for(ticker)
+        if path is None or not path.exists():
+            return pd.DataFrame()
+        try:
+            return pd.read_parquet(path, memory_map=True)
+        except Exception as exc:
+            _logger.warning("Discarding unreadable OHLCV store file %s: %s", path, exc)
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return pd.DataFrame()
+
+    def coverage_start(self, df: pd.DataFrame) -> Optional[date]:
+        """First date the stored history was requested from (IPO-aware)."""
+        raw = df.attrs.get(_COVERAGE_ATTR)
+        if raw:
+            try:
+                return date.fromisoformat(str(raw))
+            except ValueError:
+                pass
+        if df.empty:
+            return None
+        return _index_dates(df).min()
+
+    def write(
+        self,
+        ticker: str,
+        df: pd.DataFrame,
+        coverage_start: Optional[date] = None,
+        attrs: Optional[dict[str, str]] = None,
+    ) -> None:
+        """Atomically replace the stored history for ``ticker``.
+
+        ``attrs`` are extra string metadata saved alongside the frame.
+        """
+        path = self.path_for(ticker)
+        if path is None or df.empty:
+            return
+
+        frame = df[~df.index.duplicated(keep="last")].sort_index()
+        frame.index.name = "Date"
+        frame.attrs = dict(attrs or {})
+        if coverage_start is not None:
+            frame.attrs[_COVERAGE_ATTR] = coverage_start.isoformat()
+
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            frame.to_parquet(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as exc:
+            _logger.warning("Failed to persist OHLCV history for %s: %s", ticker, exc)
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    @staticmethod
+    def align_index(frame: pd.DataFrame, like: pd.DataFrame) -> pd.DataFrame:
+        """Localize/convert ``frame``'s index to the timezone of ``like``'s index."""
+        if frame.empty or like.empty or frame.index.dtype == like.index.dtype:
+            return frame
+        target_tz = pd.DatetimeIndex(like.index).tz
+        index = pd.DatetimeIndex(frame.index)
+        if index.tz is None:
+            index = index.tz_localize(target_tz)
+        else:
+            index = index.tz_convert(target_tz)
+        return frame.set_axis(index.rename(like.index.name))
+
+    @staticmethod
+    def merge(history: pd.DataFrame, delta: pd.DataFrame) -> pd.DataFrame:
+        """Append ``delta`` to ``history``; newer rows win on overlapping dates."""
+        if history.empty:
+            return delta.sort_index()
+        if delta.empty:
+            return history
+        delta = OhlcvStore.align_index(delta, history)
+        columns = [c for c in history.columns if c in delta.columns]
+        combined = pd.concat([history[columns], delta[columns]])
+        return combined[~combined.index.duplicated(keep="last")].sort_index()
+
+
+_default_store: Optional[OhlcvStore] = None
+_default_store_guard = threading.Lock()
+
+
+def get_ohlcv_store() -> OhlcvStore:
+    """Process-wide store instance (services are built per request)."""
+    global _default_store
+    with _default_store_guard:
+        if _default_store is None:
+            _default_store = OhlcvStore()
+        return _default_store
@@ -0,0 +1,347 @@
+"""
+유니버스 전체를 [ticker, bar] 2차원 배열로 정렬해 add_indicators 지표를 한 번에 계산하는 패널 모드.
+
+각 종목의 봉을 오른쪽(최신 봉) 기준으로 정렬하고 앞부분은 NaN으로 채우므로,
+롤링/재귀 계산이 종목별 add_indicators와 같은 구간에서 시작합니다. 미국 종목처럼 거래일이 같으면
+열(column)이 곧 같은 날짜입니다. 재귀 지표(EMA/RMA, SuperTrend)는 봉 축으로 한 번 순회하면서
+모든 종목을 벡터 연산으로 갱신하므로, 파이썬 루프 횟수는 종목 수와 무관합니다.
+"""
+
+import logging
+from typing import Mapping, Optional
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from myapi.utils.incremental_indicators import BOOL_COLUMNS, INDICATOR_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+_EPS = np.finfo(float).eps
+
+
+def _shift(x: np.ndarray, periods: int) -> np.ndarray:
+    out = np.full_like(x, np.nan)
+    if periods < x.shape[1]:
+        out[:, periods:] = x[:, : x.shape[1] - periods]
+    return out
+
+
+def _divide(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return a / b
+
+
+def _rolling_mean(x: np.ndarray, length: int) -> np.ndarray:
+    """rolling(length).mean() - 윈도 안에 NaN이 있으면 NaN."""
+    valid = ~np.isnan(x)
+    csum = np.cumsum(np.where(valid, x, 0.0), axis=1)
+    ccount = np.cumsum(valid, axis=1)
+    out = np.full_like(x, np.nan)
+    if x.shape[1] < length:
+        return out
+    window_sum = csum[:, length - 1 :] - np.pad(csum, ((0, 0), (1, 0)))[:, : -length]
+    window_count = (
+        ccount[:, length - 1 :] - np.pad(ccount, ((0, 0), (1, 0)))[:, : -length]
+    )
+    out[:, length - 1 :] = np.where(window_count == length, window_sum / length, np.nan)
+    return out
+
+
+def _rolling_reduce(x: np.ndarray, length: int, func) -> np.ndarray:
+    """짧은 윈도용 rolling max/min/std (NaN 전파 = min_periods=length)."""
+    out = np.full_like(x, np.nan)
+    if x.shape[1] < length:
+        return out
+    out[:, length - 1 :] = func(sliding_window_view(x, length, axis=1), axis=-1)
+    return out
+
+
+def _first_valid(x: np.ndarray) -> np.ndarray:
+    valid = ~np.isnan(x)
+    return np.where(valid.any(axis=1), valid.argmax(axis=1), x.shape[1])
+
+
+def _ewm(
+    x: np.ndarray, alpha: float, seed_length: Optional[int] = None,
+    start: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    행별 ewm(alpha, adjust=False).
+    seed_length가 있으면 start부터 seed_length개 값의 평균(NaN 제외)을 시작값으로 사용(pandas_ta presma),
+    없으면 첫 유효값부터 시작합니다.
+    """
+    k, n = x.shape
+    out = np.full_like(x, np.nan)
+    if start is None:
+        start = _first_valid(x)
+    rows = np.arange(k)
+
+    if seed_length is None:
+        seed_at = start
+        seed_value = x[rows, np.minimum(start, n - 1)]
+    else:
+        seed_at = start + seed_length - 1
+        seed_value = np.full(k, np.nan)
+        for_seed = seed_at < n
+        if for_seed.any():
+            cols = np.arange(n)
+            in_seed = (cols >= start[:, None]) & (cols <= seed_at[:, None])
+            with np.errstate(invalid="ignore"):
+                seed_value = np.where(
+                    for_seed,
+                    np.nanmean(np.where(in_seed, x, np.nan), axis=1),
+                    np.nan,
+                )
+
+    value = np.full(k, np.nan)
+    for t in range(n):
+        xt = x[:, t]
+        updated = np.where(np.isnan(xt), value, (1 - alpha) * value + alpha * xt)
+        value = np.where(t == seed_at, seed_value, np.where(t > seed_at, updated, np.nan))
+        out[:, t] = value
+    return out
+
+
+def _atr(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, length: int,
+    start: np.ndarray, prenan: bool = False,
+) -> np.ndarray:
+    prev_close = _shift(close, 1)
+    tr = np.fmax(
+        np.fmax(np.abs(high - low), np.abs(high - prev_close)),
+        np.abs(prev_close - low),
+    )
+    if prenan:
+        tr[np.arange(tr.shape[0]), np.minimum(start, tr.shape[1] - 1)] = np.nan
+    return _ewm(tr, 1.0 / length, seed_length=length, start=start)
+
+
+def _rank_max_pct(x: np.ndarray) -> np.ndarray:
+    """행별 rank(pct=True, method="max")."""
+    out = np.full_like(x, np.nan)
+    for r in range(x.shape[0]):
+        row = x[r]
+        valid = ~np.isnan(row)
+        if not valid.any():
+            continue
+        ordered = np.sort(row[valid])
+        out[r, valid] = np.searchsorted(ordered, row[valid], side="right") / len(ordered)
+    return out
+
+
+def _supertrend(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, start: np.ndarray,
+    length: int = 10, multiplier: float = 3.0,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    k, n = close.shape
+    matr = multiplier * _atr(high, low, close, length, start)
+    hl2 = (high + low) / 2
+    lb_all = hl2 - matr
+    ub_all = hl2 + matr
+
+    trend = np.full_like(close, np.nan)
+    direction = np.full_like(close, np.nan)
+    long_ = np.full_like(close, np.nan)
+    short = np.full_like(close, np.nan)
+
+    dir_prev = np.ones(k)
+    lb_prev = np.full(k, np.nan)
+    ub_prev = np.full(k, np.nan)
+    bar_no = np.arange(n)[None, :] - start[:, None]
+    for t in range(n):
+        lb = lb_all[:, t].copy()
+        ub = ub_all[:, t].copy()
+        c = close[:, t]
+        active = bar_no[:, t] >= 1
+        with np.errstate(invalid="ignore"):
+            up = c > ub_prev
+            down = ~up & (c < lb_prev)
+        d = np.where(up, 1.0, np.where(down, -1.0, dir_prev))
+        hold = active & ~up & ~down
+        with np.errstate(invalid="ignore"):
+            lb = np.where(hold & (d > 0) & (lb < lb_prev), lb_prev, lb)
+            ub = np.where(hold & (d < 0) & (ub > ub_prev), ub_prev, ub)
+        d = np.where(active, d, 1.0)
+
+        trend[:, t] = np.where(active, np.where(d > 0, lb, ub), np.nan)
+        long_[:, t] = np.where(active & (d > 0), lb, np.nan)
+        short[:, t] = np.where(active & (d <= 0), ub, np.nan)
+        direction[:, t] = np.where(bar_no[:, t] >= length, d, np.nan)
+        dir_prev, lb_prev, ub_prev = d, lb, ub
+    return trend, direction, long_, short
+
+
+class PanelIndicators:
+    """패널 계산 결과. view(ticker)는 add_indicators와 같은 형태의 DataFrame을 돌려줍니다."""
+
+    def __init__(
+        self,
+        tickers: list[str],
+        indexes: dict[str, pd.Index],
+        columns: dict[str, np.ndarray],
+    ):
+        self.tickers = tickers
+        self.indexes = indexes
+        self.columns = columns
+        self._row = {ticker: i for i, ticker in enumerate(tickers)}
+
+    def view(self, ticker: str) -> pd.DataFrame:
+        index = self.indexes[ticker]
+        row = self._row[ticker]
+        size = len(index)
+        data = {col: values[row, values.shape[1] - size :] for col, values in self.columns.items()}
+        frame = pd.DataFrame(data, index=index, columns=INDICATOR_COLUMNS)
+        for col in BOOL_COLUMNS:
+            frame[col] = frame[col].astype(bool)
+        return frame
+
+    def views(self) -> dict[str, pd.DataFrame]:
+        return {ticker: self.view(ticker) for ticker in self.tickers}
+
+
+def compute_panel_indicators(
+    frames: Mapping[str, pd.DataFrame], spy_df: Optional[pd.DataFrame] = None
+) -> PanelIndicators:
+    """
+    여러 종목의 OHLCV를 [ticker, bar] 배열로 쌓아 add_indicators와 같은 지표를 한 번에 계산합니다.
+    """
+    tickers = [t for t, df in frames.items() if df is not None and not df.empty]
+    indexes = {t: frames[t].index for t in tickers}
+    k = len(tickers)
+    n = max((len(frames[t]) for t in tickers), default=0)
+
+    def stack(field: str) -> np.ndarray:
+        out = np.full((k, n), np.nan)
+        for r, t in enumerate(tickers):
+            values = frames[t][field].to_numpy(dtype=float)
+            out[r, n - len(values) :] = values
+        return out
+
+    o, h, l, c, v = (stack(f) for f in ("Open", "High", "Low", "Close", "Volume"))
+    start = np.array([n - len(frames[t]) for t in tickers], dtype=int)
+    cols: dict[str, np.ndarray] = {"Open": o, "High": h, "Low": l, "Close": c, "Volume": v}
+
+    # SPY 종가를 각 종목의 날짜에 맞춰 정렬 (ffill)
+    spy = np.full((k, n), np.nan)
+    if spy_df is not None and not spy_df.empty and "Close" in spy_df.columns:
+        for r, t in enumerate(tickers):
+            aligned = spy_df["Close"].reindex(indexes[t]).ffill()
+            spy[r, n - len(aligned) :] = aligned.to_numpy(dtype=float)
+
+    sma = {length: _rolling_mean(c, length) for length in (5, 10, 20, 50, 150, 200)}
+    for length in (5, 10, 20, 50, 200):
+        cols[f"SMA{length}"] = sma[length]
+
+    vol20 = _rolling_mean(v, 20)
+    with np.errstate(invalid="ignore"):
+        vol_std = _rolling_reduce(v, 20, lambda a, axis: np.std(a, axis=axis, ddof=1))
+        cols["VOL20"] = vol20
+        cols["VOL_Z"] = _divide(v - vol20, vol_std)
+        cols["VOL_PCTL60"] = _rank_max_pct(v)
+        cols["VolumeSpike"] = v > vol20 * 2
+        cols["VolumeSpikeStrength"] = _divide(v, vol20)
+
+    diff = c - _shift(c, 1)
+    for length in (14, 5):
+        pos = _ewm(np.where(diff < 0, 0.0, diff), 1.0 / length)
+        neg = _ewm(np.where(diff > 0, 0.0, diff), 1.0 / length)
+        cols[f"RSI{length}"] = 100 * _divide(pos, pos + np.abs(neg))
+
+    atr14 = _atr(h, l, c, 14, start)
+    cols["ATR14"] = atr14
+
+    hh14 = _rolling_reduce(h, 14, np.max)
+    ll14 = _rolling_reduce(l, 14, np.min)
+    raw_k = 100 * _divide(c - ll14, hh14 - ll14)
+    stoch_k = _rolling_mean(raw_k, 3)
+    stoch_d = _rolling_mean(stoch_k, 3)
+    cols["STOCHk_14_3_3"] = stoch_k
+    cols["STOCHd_14_3_3"] = stoch_d
+    cols["STOCHh_14_3_3"] = stoch_k - stoch_d
+
+    std20 = _rolling_reduce(c, 20, lambda a, axis: np.std(a, axis=axis, ddof=1))
+    mid = sma[20]
+    lower = mid - 2.0 * std20
+    upper = mid + 2.0 * std20
+    cols["BBL_20_2.0_2.0"] = lower
+    cols["BBM_20_2.0_2.0"] = mid
+    cols["BBU_20_2.0_2.0"] = upper
+    cols["BBB_20_2.0_2.0"] = 100 * _divide(upper - lower, mid)
+    cols["BBP_20_2.0_2.0"] = _divide(c - lower, upper - lower)
+
+    macd = _ewm(c, 2.0 / 13, seed_length=12, start=start) - _ewm(
+        c, 2.0 / 27, seed_length=26, start=start
+    )
+    signal = _ewm(macd, 2.0 / 10, seed_length=9, start=_first_valid(macd))
+    cols["MACD_12_26_9"] = macd
+    cols["MACDh_12_26_9"] = macd - signal
+    cols["MACDs_12_26_9"] = signal
+
+    def roc(length: int) -> np.ndarray:
+        past = _shift(c, length)
+        return 100 * _divide(c - past, past)
+
+    cols["ROC5"] = roc(5)
+
+    adx_atr = _atr(h, l, c, 14, start, prenan=True)
+    up = h - _shift(h, 1)
+    dn = _shift(l, 1) - l
+    with np.errstate(invalid="ignore"):
+        pos_dm = np.where(np.isnan(up) | np.isnan(dn), np.nan, np.where((up > dn) & (up > 0), up, 0.0))
+        neg_dm = np.where(np.isnan(up) | np.isnan(dn), np.nan, np.where((dn > up) & (dn > 0), dn, 0.0))
+    pos_dm = np.where(np.abs(pos_dm) < _EPS, 0.0, pos_dm)
+    neg_dm = np.where(np.abs(neg_dm) < _EPS, 0.0, neg_dm)
+    scale = _divide(100.0, adx_atr)
+    dmp = scale * _ewm(pos_dm, 1.0 / 14)
+    dmn = scale * _ewm(neg_dm, 1.0 / 14)
+    dx = 100 * _divide(np.abs(dmp - dmn), dmp + dmn)
+    adx = _ewm(dx, 1.0 / 14)
+    cols["ADX_14"] = adx
+    cols["ADXR_14_2"] = 0.5 * (adx + _shift(adx, 2))
+    cols["DMP_14"] = dmp
+    cols["DMN_14"] = dmn
+
+    st, st_dir, st_long, st_short = _supertrend(h, l, c, start)
+    cols["SUPERT_10_3.0"] = st
+    cols["SUPERTd_10_3.0"] = st_dir
+    cols["SUPERTl_10_3.0"] = st_long
+    cols["SUPERTs_10_3.0"] = st_short
+
+    dcu = _rolling_reduce(h, 20, np.max)
+    dcl = _rolling_reduce(l, 20, np.min)
+    cols["DCL_20_20"] = dcl
+    cols["DCM_20_20"] = 0.5 * (dcl + dcu)
+    cols["DCU_20_20"] = dcu
+
+    cols["SMA50_SLOPE"] = sma[50] - _shift(sma[50], 1)
+    cols["VWAP"] = _divide((h + l + c) / 3 * v, v)
+    # add_indicators의 BB_WIDTH는 BBU/BBL 컬럼명을 찾지 못해 항상 NaN (동일하게 유지)
+    cols["BB_WIDTH"] = np.full_like(c, np.nan)
+    cols["AVG_VOL20"] = vol20
+    with np.errstate(invalid="ignore"):
+        cols["LIQUIDITY_FILTER"] = vol20 > 500000
+    cols["ATR_PCT"] = _divide(atr14, c) * 100
+    prev_close = _shift(c, 1)
+    prev_open = _shift(o, 1)
+    cols["GAP_PCT"] = _divide(o, prev_close) - 1
+    cols["ATR_RATIO"] = _divide(atr14, _rolling_mean(atr14, 20))
+    cols["ROC1"] = roc(1)
+    cols["ROC3"] = roc(3)
+    with np.errstate(invalid="ignore"):
+        cols["BULL_ENGULF"] = (prev_close < prev_open) & (o < prev_close) & (c > prev_open)
+    cols["SMA150"] = sma[150]
+
+    high5 = _rolling_reduce(h, 5, np.max)
+    low5 = _rolling_reduce(l, 5, np.min)
+    cols["RANGE_LONG"] = _divide(dcu - dcl, dcl)
+    cols["RANGE_SHORT"] = _divide(high5 - low5, low5)
+    cols["VCP_VOL_REL"] = _divide(v, vol20)
+
+    for length, col in ((20, "RS_SHORT"), (60, "RS_MID")):
+        ticker_ret = _divide(c - _shift(c, length), _shift(c, length))
+        spy_ret = _divide(spy - _shift(spy, length), _shift(spy, length))
+        cols[col] = (ticker_ret - spy_ret) * 100
+
+    return PanelIndicators(tickers, indexes, cols)
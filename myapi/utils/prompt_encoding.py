@@ -0,0 +1,202 @@
+"""
+지표 DataFrame을 LLM 프롬프트용 압축 텍스트로 인코딩합니다.
+
+`export_slim_tail_csv(df, 100)`는 100행 × 30컬럼 CSV(수천 토큰)를 만들어 SQS 메시지와
+매 LLM 호출에 그대로 실렸습니다. `encode_indicator_frame`은 토큰 예산 안에 들어오도록
+- 트리거된 전략이 읽는 컬럼을 우선 선택하고 (나머지 지표는 예산이 남을 때만),
+- 최근 `recent`행은 일봉 그대로, 그 이전은 `step`일 봉으로 합치고,
+- 종가는 전일 대비 변화량, 가격 수준 컬럼(Open/High/Low/SMA/VWAP/밴드)은 같은 행 종가 대비
+  차이로 적어 자릿수를 줄입니다.
+토큰 수는 로컬 추정치(`estimate_tokens`)로 계산하므로 tokenizer 의존성이 없습니다.
+"""
+
+import logging
+import math
+import os
+import re
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from myapi.domain.signal.signal_schema import Strategy
+from myapi.utils.indicator_registry import STRATEGY_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_BUDGET = int(os.environ.get("PROMPT_DATAFRAME_TOKEN_BUDGET", 2000))
+DEFAULT_LOOKBACK = 100
+
+# 항상 포함하는 컬럼 / 예산이 남으면 추가하는 일반 지표 (우선순위 순)
+CORE_COLUMNS: tuple[str, ...] = ("Close", "High", "Low", "Volume")
+CONTEXT_COLUMNS: tuple[str, ...] = (
+    "RSI14",
+    "SMA20",
+    "SMA50",
+    "SMA200",
+    "ATR_PCT",
+    "MACDh_12_26_9",
+    "ADX_14",
+    "BB_WIDTH",
+    "VWAP",
+    "Open",
+    "ROC5",
+    "RS_MID",
+)
+
+# (일봉으로 남길 최근 행 수, 이전 구간을 합칠 봉 크기) - 앞에서부터 정밀한 순서
+HISTORY_LEVELS: tuple[tuple[int, int], ...] = ((20, 5), (20, 10), (10, 10), (10, 20))
+
+_PRICE_LEVEL = re.compile(
+    r"Open|High|Low|VWAP|(SMA|EMA)\d+|(BB[LMU]|DC[LMU])_[\d_.]+|SUPERT[ls]?_[\d_.]+"
+)
+# 여러 날을 한 봉으로 합칠 때의 집계 방식 (그 외 컬럼은 마지막 값)
+_BAR_AGG = {"Open": "first", "High": "max", "Low": "min", "Volume": "sum"}
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    숫자 위주 텍스트의 토큰 수 추정치. BPE tokenizer는 숫자를 최대 3자리씩 끊고
+    구분자(, . - 줄바꿈)도 대부분 별도 토큰이므로 문자 3개당 1토큰으로 계산합니다.
+    """
+    return math.ceil(len(text) / 3)
+
+
+def _is_price_level(column: str) -> bool:
+    return bool(_PRICE_LEVEL.fullmatch(column))
+
+
+def _fmt(value: float, decimals: int) -> str:
+    if value is None or not np.isfinite(value):
+        return ""
+    text = f"{value:.{decimals}f}"
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    return "0" if text in ("-0", "") else text
+
+
+def _dates(frame: pd.DataFrame) -> pd.Series:
+    if "Date" in frame.columns:
+        return pd.to_datetime(frame["Date"]).reset_index(drop=True)
+    return pd.Series(pd.to_datetime(frame.index))
+
+
+def _downsample(frame: pd.DataFrame, recent: int, step: int) -> pd.DataFrame:
+    """최근 `recent`행은 그대로, 이전 구간은 끝에서부터 `step`행씩 한 봉으로 합칩니다."""
+    if len(frame) <= recent:
+        return frame
+    older, latest = frame.iloc[:-recent], frame.iloc[-recent:]
+    # 마지막 블록이 일봉 구간 바로 앞에서 끝나도록 뒤에서부터 블록 번호를 매김
+    block = (len(older) - 1 - np.arange(len(older))) // step
+    agg = {c: _BAR_AGG.get(c, "last") for c in frame.columns}
+    bars = older.groupby(-block, sort=True).agg(agg)
+    return pd.concat([bars, latest], ignore_index=True)
+
+
+def _header(column: str) -> str:
+    if column == "Close":
+        return "dClose"
+    if column == "Volume":
+        return "VolK"
+    return f"{column}-C" if _is_price_level(column) else column
+
+
+def _format_columns(bars: pd.DataFrame, columns: list[str]) -> dict[str, list[str]]:
+    """컬럼별 셀 문자열 (후보 컬럼 조합마다 다시 포맷하지 않도록 한 번만 계산)."""
+    close = bars["Close"].to_numpy(dtype=float)
+    cells: dict[str, list[str]] = {
+        "Date": [f"{d:%m-%d}" for d in bars["_date"]],
+        # 첫 행 종가는 절댓값, 이후는 직전 행 대비 변화량
+        "Close": [_fmt(v, 2) for v in np.concatenate([close[:1], np.diff(close)])],
+    }
+    for c in columns:
+        if c in cells:
+            continue
+        values = bars[c].to_numpy(dtype=float)
+        if _is_price_level(c):
+            cells[c] = [_fmt(v, 2) for v in values - close]
+        elif c == "Volume":
+            cells[c] = [_fmt(v, 0) for v in values / 1000]
+        else:
+            cells[c] = [_fmt(v, 3) for v in values]
+    return cells
+
+
+def _render(cells: dict[str, list[str]], columns: list[str]) -> str:
+    names = ["Date"] + columns
+    lines = [",".join(_header(c) if c != "Date" else c for c in names)]
+    lines.extend(",".join(row) for row in zip(*(cells[c] for c in names)))
+    return "\n".join(lines)
+
+
+def _candidates(
+    core: list[str], strategy: list[str], context: list[str]
+) -> Iterator[tuple[list[str], int, int]]:
+    """정밀도가 높은 순서로 (컬럼, recent, step) 후보를 만듭니다."""
+    recent, step = HISTORY_LEVELS[0]
+    # 1) 가장 촘촘한 기간에서 일반 지표를 뒤에서부터 제거
+    for n in range(len(context), -1, -1):
+        yield core + strategy + context[:n], recent, step
+    # 2) 기간을 더 거칠게
+    for recent, step in HISTORY_LEVELS[1:]:
+        yield core + strategy, recent, step
+    # 3) 마지막으로 전략 컬럼도 뒤에서부터 제거
+    for n in range(len(strategy) - 1, -1, -1):
+        yield core + strategy[:n], recent, step
+
+
+def encode_indicator_frame(
+    df: pd.DataFrame,
+    strategies: Iterable[Strategy] = (),
+    token_budget: Optional[int] = None,
+    lookback: int = DEFAULT_LOOKBACK,
+) -> str:
+    """
+    지표 DataFrame의 최근 `lookback`일을 `token_budget` 추정 토큰 이내의 텍스트로 만듭니다.
+    예산 안에 들어오는 가장 정밀한 표현을 반환하고, 어떤 후보도 들어오지 않으면 가장 작은 것을 반환합니다.
+    """
+    if df.empty or "Close" not in df.columns:
+        return ""
+    budget = token_budget or DEFAULT_TOKEN_BUDGET
+
+    frame = df.tail(lookback)
+    numeric = set(frame.select_dtypes(include="number").columns)
+    core = [c for c in CORE_COLUMNS if c in numeric]
+    strategy: list[str] = []
+    for s in strategies:
+        for c in STRATEGY_COLUMNS.get(s, ()):
+            if c in numeric and c not in core and c not in strategy:
+                strategy.append(c)
+    context = [
+        c for c in CONTEXT_COLUMNS if c in numeric and c not in core + strategy
+    ]
+
+    dates = _dates(frame)
+    indexed = (
+        frame[core + strategy + context].reset_index(drop=True).assign(_date=dates)
+    )
+
+    text = ""
+    formatted: dict[tuple[int, int], dict[str, list[str]]] = {}
+    for columns, recent, step in _candidates(core, strategy, context):
+        cells = formatted.get((recent, step))
+        if cells is None:
+            bars = _downsample(indexed, recent, step)
+            cells = formatted[(recent, step)] = _format_columns(
+                bars, core + strategy + context
+            )
+        text = (
+            f"# {dates.iloc[0]:%Y-%m-%d}~{dates.iloc[-1]:%Y-%m-%d}, oldest first. "
+            f"Rows before the last {recent} are {step}-day bars "
+            "(High=max, Low=min, Volume=sum, others=last). "
+            "dClose: first row is the close, then change vs previous row; "
+            "X-C columns are X minus that row's close; VolK: volume in thousands.\n"
+            + _render(cells, columns)
+        )
+        tokens = estimate_tokens(text)
+        if tokens <= budget:
+            break
+    else:
+        logger.debug(f"Indicator frame exceeds token budget {budget}: ~{tokens}")
+
+    return text
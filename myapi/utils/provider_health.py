@@ -0,0 +1,127 @@
+"""Per-provider circuit breaker and latency window for hedged LLM calls.
+
+``WebSearchService.run_llm`` (FALLBACK) starts the secondary provider when
+the primary has not answered within its recent p95 latency, and skips a
+provider entirely while its circuit is open. A circuit opens when at least
+``MIN_CALLS`` of the last ``WINDOW`` calls were recorded and the failure rate
+reaches ``FAILURE_RATE``; after ``COOLDOWN`` seconds one trial call is let
+through (half-open) and its outcome closes or re-opens the circuit.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+WINDOW = 20  # 실패율 계산에 쓰는 최근 호출 수
+MIN_CALLS = 5
+FAILURE_RATE = 0.5
+COOLDOWN = 60.0  # open 상태 유지 시간(초)
+
+LATENCY_SAMPLES = 50
+HEDGE_MIN_SAMPLES = 10
+HEDGE_DEFAULT_DELAY = 30.0  # 표본이 부족할 때의 hedge 지연(초)
+HEDGE_MIN_DELAY = 3.0
+HEDGE_MAX_DELAY = 60.0
+
+
+class ProviderHealth:
+    def __init__(self, provider: str) -> None:
+        self.provider = provider
+        self._lock = threading.Lock()
+        self._outcomes: Deque[bool] = deque(maxlen=WINDOW)
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < COOLDOWN:
+            return "open"
+        return "half_open"
+
+    def allow(self) -> bool:
+        """호출해도 되는지 여부. half-open이면 시험 호출 하나만 허용합니다."""
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self, latency: float) -> None:
+        with self._lock:
+            self._latencies.append(latency)
+            if self._opened_at is not None:
+                # half-open 시험 호출 성공 → 이전 실패 기록을 지우고 닫음
+                self._opened_at = None
+                self._outcomes.clear()
+            self._trial_in_flight = False
+            self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._outcomes.append(False)
+            self._trial_in_flight = False
+            if self._opened_at is not None:
+                self._opened_at = time.monotonic()
+                return
+            failures = self._outcomes.count(False)
+            if (
+                len(self._outcomes) >= MIN_CALLS
+                and failures / len(self._outcomes) >= FAILURE_RATE
+            ):
+                self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """결과 없이 끝난 호출(취소 등)이 half-open 시험 슬롯을 반납합니다."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def hedge_delay(self) -> float:
+        """최근 성공 호출 지연의 p95 (HEDGE_MIN_DELAY ~ HEDGE_MAX_DELAY)."""
+        with self._lock:
+            samples = sorted(self._latencies)
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            return HEDGE_DEFAULT_DELAY
+        p95 = samples[min(len(samples) - 1, math.ceil(0.95 * len(samples)) - 1)]
+        return min(max(p95, HEDGE_MIN_DELAY), HEDGE_MAX_DELAY)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            calls = len(self._outcomes)
+            failures = self._outcomes.count(False)
+            state = self._state()
+        return {
+            "state": state,
+            "recent_calls": calls,
+            "failure_rate": failures / calls if calls else None,
+            "hedge_delay": self.hedge_delay(),
+        }
+
+
+_registry_lock = threading.Lock()
+_registry: Dict[str, ProviderHealth] = {}
+
+
+def get_provider_health(provider: str) -> ProviderHealth:
+    with _registry_lock:
+        health = _registry.get(provider)
+        if health is None:
+            health = _registry[provider] = ProviderHealth(provider)
+        return health
+
+
+def provider_health_snapshot() -> dict[str, Any]:
+    with _registry_lock:
+        providers = dict(_registry)
+    return {name: health.snapshot() for name, health in sorted(providers.items())}
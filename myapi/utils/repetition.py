@@ -0,0 +1,192 @@
+"""Linear-time removal of repeated words and phrases in LLM output.
+
+``TranslateService._clean_repetitive_text`` used two backtracking regexes::
+
+    re.sub(r"\\b(\\w+)\\s+\\1\\s+\\1+", r"\\1", text)   # collapse_repeated_words
+    re.sub(r"(.{10,}?)\\s*\\1+", r"\\1", text)           # collapse_repeated_phrases
+
+The phrase pattern tries every root length at every position, so one long
+line without a repeat costs O(n * line length) - seconds on a degenerate
+Korean report. The functions below return the same strings as those
+``re.sub`` calls:
+
+- words: one pass over word starts, O(n).
+- phrases: for a start ``i`` a root can only repeat at a later occurrence
+  ``c`` of its first 10 characters, and the shortest root for ``c`` is fixed
+  by the whitespace run right before ``c``. Occurrences come from an index of
+  10-character grams, roots are compared with a polynomial rolling hash (and
+  re-checked by string comparison before anything is removed), so each start
+  costs one bisect plus at most ``MAX_CANDIDATES`` O(1) comparisons:
+  O(n log n) overall.
+
+The only difference from the regex: when a 10-character prefix recurs more
+than ``MAX_CANDIDATES`` times on one line without forming a repeat, later
+occurrences are not examined for that start. That input is exactly the
+regex's quadratic case and does not occur in normal text.
+
+``python -m myapi.utils.repetition_bench`` compares both on normal and
+adversarial inputs.
+"""
+
+from bisect import bisect_left
+from typing import Optional
+
+MIN_PHRASE_LEN = 10
+MAX_CANDIDATES = 256
+
+_MOD = (1 << 61) - 1
+_BASE = 1_000_003
+
+
+def _is_word(ch: str) -> bool:
+    # re의 \w (str 패턴)와 동일
+    return ch.isalnum() or ch == "_"
+
+
+def collapse_repeated_words(text: str) -> str:
+    """
+    re.sub(r"\\b(\\w+)\\s+\\1\\s+\\1+", r"\\1", text) 와 같은 결과.
+    예: "매우 매우 매우 좋은" → "매우 좋은"
+    """
+    n = len(text)
+    out: list[str] = []
+    pos = i = 0
+    while i < n:
+        if not _is_word(text[i]) or (i > 0 and _is_word(text[i - 1])):
+            i += 1
+            continue
+        end = i
+        while end < n and _is_word(text[end]):
+            end += 1
+        match_end = _word_repeat_end(text, text[i:end], end)
+        if match_end is None:
+            i = end  # 단어 내부에는 \b가 없음
+            continue
+        out.append(text[pos:end])
+        pos = i = match_end
+    out.append(text[pos:])
+    return "".join(out)
+
+
+def _word_repeat_end(text: str, word: str, end: int) -> Optional[int]:
+    """word 뒤에 "공백 word 공백 word+"가 이어지면 매치 끝 위치."""
+    size = len(word)
+    k = _skip_space(text, end)
+    if k == end or not text.startswith(word, k):
+        return None
+    k += size
+    after = _skip_space(text, k)
+    if after == k or not text.startswith(word, after):
+        return None
+    k = after
+    while text.startswith(word, k):
+        k += size
+    return k
+
+
+def _skip_space(text: str, i: int) -> int:
+    n = len(text)
+    while i < n and text[i].isspace():
+        i += 1
+    return i
+
+
+class _RollingHash:
+    def __init__(self, text: str):
+        prefix = [0] * (len(text) + 1)
+        power = [1] * (len(text) + 1)
+        h = 0
+        for i, ch in enumerate(text):
+            h = (h * _BASE + ord(ch)) % _MOD
+            prefix[i + 1] = h
+            power[i + 1] = power[i] * _BASE % _MOD
+        self._prefix = prefix
+        self._power = power
+
+    def get(self, start: int, length: int) -> int:
+        return (
+            self._prefix[start + length] - self._prefix[start] * self._power[length]
+        ) % _MOD
+
+
+def collapse_repeated_phrases(text: str, min_len: int = MIN_PHRASE_LEN) -> str:
+    """re.sub(r"(.{10,}?)\\s*\\1+", r"\\1", text) 와 같은 결과 (min_len=10)."""
+    n = len(text)
+    if n < 2 * min_len:
+        return text
+
+    grams: dict[str, list[int]] = {}
+    for i in range(n - min_len + 1):
+        grams.setdefault(text[i : i + min_len], []).append(i)
+    if len(grams) == n - min_len + 1:
+        return text  # 반복되는 10자 조각이 없으면 반복 구절도 없음
+
+    # ws_start[c]: c 바로 앞 공백 구간의 시작 (앞 글자가 공백이 아니면 c)
+    ws_start = [0] * (n + 1)
+    for c in range(1, n + 1):
+        ws_start[c] = ws_start[c - 1] if text[c - 1].isspace() else c
+    # line_end[i]: i 이후 첫 줄바꿈 위치 (root에는 줄바꿈이 들어갈 수 없음)
+    line_end = [n] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        line_end[i] = i if text[i] == "\n" else line_end[i + 1]
+
+    hashes = _RollingHash(text)
+    out: list[str] = []
+    pos = i = 0
+    while i <= n - 2 * min_len:
+        occurrences = grams[text[i : i + min_len]]
+        match = None
+        if len(occurrences) > 1:
+            match = _shortest_root(
+                text, i, occurrences, ws_start, line_end[i], hashes, min_len
+            )
+        if match is None:
+            i += 1
+            continue
+        size, copy = match
+        end = copy + size
+        while end + size <= n and hashes.get(end, size) == hashes.get(i, size):
+            if text[end : end + size] != text[i : i + size]:
+                break
+            end += size
+        out.append(text[pos : i + size])
+        pos = i = end
+    out.append(text[pos:])
+    return "".join(out)
+
+
+def _shortest_root(
+    text: str,
+    i: int,
+    occurrences: list[int],
+    ws_start: list[int],
+    line_end: int,
+    hashes: _RollingHash,
+    min_len: int,
+) -> Optional[tuple[int, int]]:
+    """
+    i에서 시작하는 가장 짧은 root 길이와, 그 길이에서 regex의 greedy \\s*가 고르는
+    (가장 먼) 반복 시작 위치를 반환합니다.
+    반복 시작 c에 대한 root 길이는 max(min_len, ws_start[c] - i)로 정해지고
+    c가 커질수록 줄지 않으므로, 앞에서부터 보다가 길이가 늘어나면 멈춥니다.
+    """
+    n = len(text)
+    best: Optional[tuple[int, int]] = None
+    misses = 0
+    for k in range(bisect_left(occurrences, i + min_len), len(occurrences)):
+        c = occurrences[k]
+        size = max(min_len, ws_start[c] - i)
+        if size > line_end - i or c + size > n:
+            break
+        if best is not None and size > best[0]:
+            break
+        if (
+            hashes.get(i, size) == hashes.get(c, size)
+            and text[i : i + size] == text[c : c + size]
+        ):
+            best = (size, c)
+            continue
+        misses += 1
+        if misses >= MAX_CANDIDATES:
+            break
+    return best
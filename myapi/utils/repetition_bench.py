@@ -0,0 +1,159 @@
+"""Benchmark of :mod:`myapi.utils.repetition` against the regexes it replaces.
+
+Each case is cleaned by both implementations, outputs are compared, and the
+time of each is printed. The regex is skipped above ``--regex-limit``
+characters, because on the adversarial cases it grows quadratically::
+
+    python -m myapi.utils.repetition_bench --sizes 2000 8000 32000
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from typing import Callable, Optional
+
+from myapi.utils.repetition import (
+    collapse_repeated_phrases,
+    collapse_repeated_words,
+)
+
+_WORDS = re.compile(r"\b(\w+)\s+\1\s+\1+")
+_PHRASES = re.compile(r"(.{10,}?)\s*\1+")
+
+_KO_SENTENCES = (
+    "엔비디아는 데이터센터 매출이 예상치를 웃돌며 시간외 거래에서 상승했습니다.",
+    "연준 의장의 발언 이후 국채 금리가 하락하면서 성장주 전반이 반등했습니다.",
+    "반도체 업종은 공급망 우려에도 불구하고 견조한 수요를 보이고 있습니다.",
+    "애널리스트들은 목표 주가를 상향 조정하며 매수 의견을 유지했습니다.",
+    "거래량은 20일 평균 대비 두 배 이상 늘어나 추세 전환 가능성을 시사합니다.",
+)
+_EN_SENTENCES = (
+    "Revenue grew 12% year over year, driven by cloud and advertising.",
+    "The company raised full-year guidance after a strong quarter.",
+    "Margins compressed slightly due to higher input costs.",
+    "Shares are trading near the 50-day moving average with rising volume.",
+)
+
+
+def _fill(pieces: list[str], size: int, sep: str = " ") -> str:
+    text = ""
+    i = 0
+    while len(text) < size:
+        text += pieces[i % len(pieces)] + sep
+        i += 1
+    return text[:size]
+
+
+def korean_report(size: int) -> str:
+    """정상적인 한국어 리포트 (문장 순서만 섞임, 반복 없음에 가까움)."""
+    rnd = random.Random(size)
+    pieces = [
+        f"{rnd.choice(_KO_SENTENCES)} ({rnd.randint(1, 10**6)})" for _ in range(64)
+    ]
+    return _fill(pieces, size)
+
+
+def english_report(size: int) -> str:
+    rnd = random.Random(size)
+    pieces = [f"{rnd.choice(_EN_SENTENCES)} [{i}]" for i in range(64)]
+    return _fill(pieces, size, "\n")
+
+
+def degenerate_loop(size: int) -> str:
+    """모델이 같은 구절을 끝없이 반복하는 출력."""
+    return "분석 결과는 다음과 같습니다. " + _fill(
+        ["매수 신호가 유효합니다.", "매우 매우 매우 강한 상승 추세입니다."], size
+    )
+
+
+def near_miss_blocks(size: int) -> str:
+    """같은 10자 접두어가 한 줄에 계속 나오지만 바로 반복되지는 않는 입력."""
+    return _fill([f"abcdefghij{i}" for i in range(size)], size, "")
+
+
+def single_line_random(size: int) -> str:
+    """줄바꿈 없는 긴 한 줄 (regex가 위치마다 줄 끝까지 root 길이를 시도)."""
+    rnd = random.Random(size)
+    return "".join(rnd.choice("가나다라마바사아 ") for _ in range(size))
+
+
+def duplicated_report(size: int) -> str:
+    """리포트 전체가 한 번 더 이어서 나오는 출력 (가장 흔한 퇴화 형태)."""
+    half = korean_report(size // 2)
+    return half + " " + half
+
+
+def near_miss_repeated(size: int) -> str:
+    """
+    near_miss_blocks 문단이 통째로 한 번 더 나오는 입력. 같은 10자 접두어가 root 안에
+    MAX_CANDIDATES번 넘게 나오면 그 시작 위치의 반복은 찾지 않으므로 regex와 결과가 다릅니다.
+    """
+    half = near_miss_blocks(size // 2)
+    return half + half
+
+
+CASES: dict[str, Callable[[int], str]] = {
+    "korean_report": korean_report,
+    "english_report": english_report,
+    "degenerate_loop": degenerate_loop,
+    "near_miss_blocks": near_miss_blocks,
+    "single_line_random": single_line_random,
+    "duplicated_report": duplicated_report,
+    "near_miss_repeated": near_miss_repeated,
+}
+# MAX_CANDIDATES 제한 때문에 regex와 결과가 달라질 수 있는 경우 (실패로 세지 않음)
+CAPPED_CASES = frozenset({"near_miss_repeated"})
+
+
+def regex_clean(text: str) -> str:
+    return _PHRASES.sub(r"\1", _WORDS.sub(r"\1", text))
+
+
+def linear_clean(text: str) -> str:
+    return collapse_repeated_phrases(collapse_repeated_words(text))
+
+
+def _timed(fn: Callable[[str], str], text: str) -> tuple[str, float]:
+    started = time.perf_counter()
+    result = fn(text)
+    return result, time.perf_counter() - started
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2000, 8000, 32000])
+    parser.add_argument(
+        "--regex-limit",
+        type=int,
+        default=16000,
+        help="이 길이를 넘는 입력은 regex를 실행하지 않음",
+    )
+    args = parser.parse_args(argv)
+
+    mismatches = 0
+    print(f"{'case':<22}{'chars':>8}{'regex s':>10}{'linear s':>10}  same")
+    for name, build in CASES.items():
+        for size in args.sizes:
+            text = build(size)
+            cleaned, linear_time = _timed(linear_clean, text)
+            if size <= args.regex_limit:
+                expected, regex_time = _timed(regex_clean, text)
+                if expected == cleaned:
+                    same = "yes"
+                elif name in CAPPED_CASES:
+                    same = "capped"
+                else:
+                    same = "NO"
+                    mismatches += 1
+                regex_col = f"{regex_time:.4f}"
+            else:
+                same, regex_col = "-", "skipped"
+            print(f"{name:<22}{size:>8}{regex_col:>10}{linear_time:>10.4f}  {same}")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
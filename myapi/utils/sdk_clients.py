@@ -0,0 +1,132 @@
+"""Process-wide SDK client registry.
+
+``openai.OpenAI``, ``genai.Client`` and ``boto3.client`` each build their own
+HTTP connection pool, so constructing them per call pays client setup and a
+TLS handshake on every LLM or AWS request. Clients here are created once per
+(provider, base URL / region, credentials) and reused with keep-alive pools;
+all three SDK clients are safe to share across threads. Async clients hold
+connections bound to an event loop, so they are pooled per running loop.
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Any, Callable, Optional
+
+from myapi.utils.lazy_import import lazy_import
+from myapi.utils.llm_metrics import aon_http_request, on_http_request
+
+_logger = logging.getLogger(__name__)
+
+boto3 = lazy_import("boto3")
+botocore_config = lazy_import("botocore.config")
+httpx = lazy_import("httpx")
+openai = lazy_import("openai")
+genai = lazy_import("google.genai")
+
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 10
+KEEPALIVE_EXPIRY = 60.0
+
+_lock = threading.Lock()
+_clients: dict[tuple, Any] = {}
+# event loop -> {key: client}
+_loop_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _get_or_create(key: tuple, factory: Callable[[], Any]) -> Any:
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = factory()
+            _logger.debug("Created pooled %s client", key[0])
+    return client
+
+
+def _get_or_create_for_loop(key: tuple, factory: Callable[[], Any]) -> Any:
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = _loop_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None:
+            client = clients[key] = factory()
+            _logger.debug("Created pooled async %s client", key[0])
+    return client
+
+
+def _limits() -> Any:
+    return httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+
+
+def openai_client(api_key: Optional[str], base_url: Optional[str] = None) -> Any:
+    """OpenAI 호환 클라이언트 (OpenAI, Perplexity, Hyperbolic, Hugging Face)."""
+
+    def factory() -> Any:
+        http_client = openai.DefaultHttpxClient(
+            limits=_limits(), event_hooks={"request": [on_http_request]}
+        )
+        return openai.OpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+
+    return _get_or_create(("openai", base_url, api_key), factory)
+
+
+def async_openai_client(
+    api_key: Optional[str], base_url: Optional[str] = None
+) -> Any:
+    """현재 이벤트 루프에서 쓰는 openai.AsyncOpenAI 클라이언트."""
+
+    def factory() -> Any:
+        http_client = openai.DefaultAsyncHttpxClient(
+            limits=_limits(), event_hooks={"request": [aon_http_request]}
+        )
+        return openai.AsyncOpenAI(
+            api_key=api_key, base_url=base_url, http_client=http_client
+        )
+
+    return _get_or_create_for_loop(("openai", base_url, api_key), factory)
+
+
+def genai_client(api_key: Optional[str]) -> Any:
+    """Gemini 클라이언트 (API 키별)."""
+    return _get_or_create(("genai", api_key), lambda: genai.Client(api_key=api_key))
+
+
+def async_genai_client(api_key: Optional[str]) -> Any:
+    """현재 이벤트 루프에서 쓰는 Gemini 비동기 클라이언트 (genai.Client().aio)."""
+    return _get_or_create_for_loop(
+        ("genai", api_key), lambda: genai.Client(api_key=api_key).aio
+    )
+
+
+def boto3_client(
+    service_name: str,
+    region_name: Optional[str] = None,
+    aws_access_key_id: Optional[str] = None,
+    aws_secret_access_key: Optional[str] = None,
+) -> Any:
+    """boto3.client와 같은 인자로 서비스/리전/자격 증명별 공유 클라이언트를 반환합니다."""
+
+    def factory() -> Any:
+        return boto3.client(
+            service_name,
+            region_name=region_name,
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            config=botocore_config.Config(
+                max_pool_connections=MAX_CONNECTIONS, tcp_keepalive=True
+            ),
+        )
+
+    return _get_or_create(
+        ("boto3", service_name, region_name, aws_access_key_id, aws_secret_access_key),
+        factory,
+    )
+
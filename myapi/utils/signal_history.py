@@ -0,0 +1,247 @@
+"""
+evaluate_signals의 전략 조건을 전체 기간에 대해 벡터 연산으로 평가합니다.
+
+각 행 i의 값은 df.iloc[: i + 1]을 evaluate_signals에 넘겼을 때의 triggered와 같습니다.
+(evaluate_signals가 결과를 만들지 않는 경우는 False)
+"""
+
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from myapi.domain.signal.signal_schema import Strategy
+from myapi.utils.indicators import calculate_supertrend
+
+
+def _col(df: pd.DataFrame, name: str) -> Optional[pd.Series]:
+    return df[name] if name in df.columns else None
+
+
+def _all(index: pd.Index, *conditions: Optional[pd.Series]) -> pd.Series:
+    """조건을 AND로 묶습니다. 컬럼이 없어 None인 조건이 있으면 전부 False (NaN 비교도 False)."""
+    out = pd.Series(True, index=index)
+    for cond in conditions:
+        if cond is None:
+            return pd.Series(False, index=index)
+        out &= cond.fillna(False).astype(bool)
+    return out
+
+
+def evaluate_signals_history(
+    df: pd.DataFrame, strategies: Iterable[Strategy]
+) -> pd.DataFrame:
+    """
+    add_indicators 결과 전체 행에 대해 전략별 트리거 여부를 계산합니다.
+    :return: index=df.index, columns=strategies 인 bool DataFrame
+    """
+    close = df["Close"]
+    high = df["High"]
+    volume = df["Volume"]
+    close_prev = close.shift(1)
+    index = df.index
+    bar_count = pd.Series(np.arange(1, len(df) + 1), index=index)
+    false = pd.Series(False, index=index)
+
+    sma5, sma10, sma20 = _col(df, "SMA5"), _col(df, "SMA10"), _col(df, "SMA20")
+    sma50, sma150, sma200 = _col(df, "SMA50"), _col(df, "SMA150"), _col(df, "SMA200")
+    # evaluate_signals는 RSI14를 읽은 뒤 RSI_14 컬럼 값으로 덮어씀 (동일하게 유지)
+    rsi = _col(df, "RSI_14")
+    vol_z = _col(df, "VOL_Z")
+    adx = _col(df, "ADX_14")
+    dmp, dmn = _col(df, "DMP_14"), _col(df, "DMN_14")
+    st_dir = _col(df, "SUPERTd_10_3.0")
+    slope_50 = _col(df, "SMA50_SLOPE")
+
+    avg_volume = volume.rolling(20).mean()
+    vol_ratio20 = (volume / avg_volume).where(
+        (avg_volume != 0) & avg_volume.notna(), 0.0
+    )
+
+    supertrend_trend: Optional[pd.Series] = None
+
+    out: dict[str, pd.Series] = {}
+    for strategy in dict.fromkeys(strategies):
+        if strategy == "VOLUME_EXPANSION":
+            roc1 = _col(df, "ROC1")
+            triggered = _all(
+                index,
+                vol_ratio20 >= 1.5,
+                roc1 >= 0.02 if roc1 is not None else None,
+            )
+
+        elif strategy == "QUIET_PULLBACK":
+            atr_ratio = _col(df, "ATR_RATIO")
+            triggered = _all(
+                index,
+                (close_prev / sma10 - 1).abs() <= 0.01 if sma10 is not None else None,
+                atr_ratio < 0.7 if atr_ratio is not None else None,
+            )
+
+        elif strategy == "VOLATILITY_COMPRESSION":
+            bb_width = _col(df, "BB_WIDTH")
+            triggered = _all(
+                index,
+                bb_width <= bb_width.rolling(126).min() * 1.05
+                if bb_width is not None
+                else None,
+            )
+
+        elif strategy in ("RS_SHORT", "RS_MID"):
+            rs = _col(df, strategy)
+            triggered = _all(index, rs > 0 if rs is not None else None)
+
+        elif strategy == "VOLUME_SPIKE":
+            spike = _col(df, "VolumeSpike")
+            triggered = _all(
+                index,
+                spike,
+                rsi < 50 if rsi is not None else None,
+                close.pct_change() > 0.01,
+            )
+
+        elif strategy == "PULLBACK":
+            triggered = _all(
+                index,
+                close <= sma10 * 1.03 if sma10 is not None else None,
+                close >= sma50 * 0.98 if sma50 is not None else None,
+            )
+
+        elif strategy == "OVERSOLD":
+            bbl = _col(df, "BBL_20_2.0")
+            stoch_k = _col(df, "STOCHk_14_3_3")
+            triggered = _all(
+                index,
+                rsi < 40 if rsi is not None else None,
+                close <= bbl * 1.02 if bbl is not None else None,
+                stoch_k < 30 if stoch_k is not None else None,
+            )
+
+        elif strategy == "MACD_LONG":
+            hist = _col(df, "MACDh_12_26_9")
+            macd, signal = _col(df, "MACD_12_26_9"), _col(df, "MACDs_12_26_9")
+            triggered = _all(
+                index,
+                hist.shift(1) < 0.2 if hist is not None else None,
+                hist > -0.05 if hist is not None else None,
+                macd > signal if macd is not None and signal is not None else None,
+            )
+
+        elif strategy == "VOL_DRY_BOUNCE":
+            if vol_z is None or sma5 is None or sma20 is None:
+                triggered = false
+            else:
+                vdu = (vol_z <= -1) & (close < sma5) & (close > sma20)
+                ratio = close / sma20
+                triggered = _all(
+                    index,
+                    bar_count >= 60,
+                    vdu.astype(float).rolling(10, min_periods=1).max() > 0,
+                    close >= sma5,
+                    (ratio >= 0.95) & (ratio <= 1.05),
+                )
+
+        elif strategy == "GOLDEN_CROSS":
+            triggered = _all(
+                index,
+                (
+                    sma50 > sma200 * 0.99
+                    if sma50 is not None and sma200 is not None
+                    else None
+                ),
+                vol_z > 0.5 if vol_z is not None else None,
+            )
+
+        elif strategy == "MEAN_REVERSION":
+            triggered = _all(
+                index,
+                close > sma20 * 0.90 if sma20 is not None else None,
+                close < sma20 * 1.10 if sma20 is not None else None,
+                close_prev < sma20 * 0.95 if sma20 is not None else None,
+            )
+
+        elif strategy == "BREAKOUT":
+            high_52w = high.rolling(252).max()
+            triggered = _all(
+                index,
+                close > high_52w * 0.98,
+                rsi < 70 if rsi is not None else None,
+            )
+
+        elif strategy == "GAP_UP":
+            triggered = _all(
+                index,
+                close > close_prev * 1.02,
+                vol_z > 0.5 if vol_z is not None else None,
+            )
+
+        elif strategy == "MOMENTUM_SURGE":
+            price_chg_pct = (close / close.shift(4) - 1) * 100
+            vol_chg_pct = (volume / volume.rolling(5).mean() - 1) * 100
+            triggered = _all(
+                index,
+                bar_count >= 5,
+                price_chg_pct.abs() > 3,
+                vol_chg_pct > 50,
+            )
+
+        elif strategy in ("TREND_UP", "TREND_DOWN"):
+            if any(x is None for x in (sma50, sma200, adx, dmp, dmn, st_dir, slope_50)):
+                triggered = false
+            elif strategy == "TREND_UP":
+                triggered = _all(
+                    index,
+                    adx > 25,
+                    dmp > dmn,
+                    st_dir == 1,
+                    (close > sma50) & (sma50 > sma200),
+                    slope_50 > 0,
+                )
+            else:
+                triggered = _all(
+                    index,
+                    adx > 25,
+                    dmn > dmp,
+                    st_dir == -1,
+                    (close < sma50) & (sma50 < sma200),
+                    slope_50 < 0,
+                )
+
+        elif strategy == "DONCHIAN_BREAKOUT":
+            dcu = _col(df, "DCU_20_20")
+            triggered = _all(
+                index,
+                close > dcu.shift(1) if dcu is not None else None,
+                adx > 20 if adx is not None else None,
+                vol_z > 0 if vol_z is not None else None,
+            )
+
+        elif strategy == "VCP_DAILY":
+            range_long, range_short = _col(df, "RANGE_LONG"), _col(df, "RANGE_SHORT")
+            vol_rel = _col(df, "VCP_VOL_REL")
+            triggered = _all(
+                index,
+                (sma50 > sma150) & (sma150 > sma200)
+                if sma50 is not None and sma150 is not None and sma200 is not None
+                else None,
+                range_short < range_long * 0.75
+                if range_long is not None and range_short is not None
+                else None,
+                vol_rel < 1.0 if vol_rel is not None else None,
+            )
+
+        elif strategy in ("SUPERTREND_BUY", "SUPERTREND_SELL"):
+            if supertrend_trend is None:
+                _, supertrend_trend = calculate_supertrend(
+                    df, atr_length=10, multiplier=3.0
+                )
+            change = supertrend_trend.diff()
+            triggered = change == (2 if strategy == "SUPERTREND_BUY" else -2)
+
+        else:
+            # GAPPER, VWAP_BOUNCE: evaluate_signals에 조건이 구현되어 있지 않음
+            triggered = false
+
+        out[strategy] = triggered.fillna(False).astype(bool)
+
+    return pd.DataFrame(out, index=df.index)
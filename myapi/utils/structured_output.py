@@ -0,0 +1,62 @@
+"""Single-hop structured output for OpenAI-compatible chat completions.
+
+Perplexity accepts ``response_format={"type": "json_schema", ...}``, so the
+search call itself can return JSON matching the Pydantic schema. The reply is
+validated locally; only when that fails does the caller fall back to a second
+"repair" LLM call that restructures the text. Counters record how often each
+path is taken.
+"""
+
+import re
+import threading
+from collections import Counter
+from typing import Any, Optional, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+T = TypeVar("T", bound=BaseModel)
+
+_THINK_BLOCK = re.compile(r"<think>.*?</think>", re.DOTALL)
+_CODE_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+_lock = threading.Lock()
+_outcomes: Counter[str] = Counter()
+
+
+def json_schema_response_format(schema: Type[BaseModel]) -> dict[str, Any]:
+    return {
+        "type": "json_schema",
+        "json_schema": {"schema": schema.model_json_schema()},
+    }
+
+
+def parse_structured_output(content: Optional[str], schema: Type[T]) -> Optional[T]:
+    """모델 응답을 schema로 검증합니다. 실패하면 None (repair 호출 필요)."""
+    if not content:
+        return None
+    text = _THINK_BLOCK.sub("", content).strip()
+    text = _CODE_FENCE.sub("", text)
+    start, end = text.find("{"), text.rfind("}")
+    if start < 0 or end < start:
+        return None
+    try:
+        return schema.model_validate_json(text[start : end + 1])
+    except (ValidationError, ValueError):
+        return None
+
+
+def record_structured_output(outcome: str) -> None:
+    """outcome: "direct" (1회 호출로 검증 통과) 또는 "repaired" (repair 호출 사용)."""
+    with _lock:
+        _outcomes[outcome] += 1
+
+
+def structured_output_stats() -> dict[str, Any]:
+    with _lock:
+        direct, repaired = _outcomes["direct"], _outcomes["repaired"]
+    total = direct + repaired
+    return {
+        "direct": direct,
+        "repaired": repaired,
+        "repair_rate": repaired / total if total else None,
+    }
@@ -0,0 +1,197 @@
+"""Sentence-level translation memory in front of the LLM translator.
+
+``TranslateService`` translates every web search result, Mahaney stock, ETF
+portfolio and headline, and most of that text is boilerplate that was
+already translated on a previous day. Source text is split into sentences
+(and lines); each sentence is looked up by the hash of its
+whitespace-normalized form, and only the sentences that are not in memory
+are sent to the model. Translations are kept in a ``JsonDiskCache`` so they
+survive restarts, with hit/miss counters for the metrics endpoint.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+from myapi.utils.disk_cache import JsonDiskCache
+
+_logger = logging.getLogger(__name__)
+
+TRANSLATION_MEMORY_TTL = timedelta(
+    days=int(os.environ.get("TRANSLATION_MEMORY_TTL_DAYS", 30))
+)
+TRANSLATION_MEMORY_MAX_ENTRIES = 50000
+_PRUNE_EVERY = 500
+
+# 문장 경계: 줄바꿈, 또는 종결 부호(+닫는 따옴표/괄호) 뒤 공백 다음 대문자/숫자/여는 기호
+_BOUNDARY = re.compile(r"\n+|[.!?][\"')\]]?(\s+)(?=[A-Z0-9\"'(\[$-])")
+# 마침표로 끝나도 문장이 끝나지 않는 약어 (소문자 비교)
+_ABBREVIATIONS = frozenset(
+    "inc. corp. co. ltd. vs. e.g. i.e. mr. ms. dr. st. no. approx. est. "
+    "jan. feb. mar. apr. jun. jul. aug. sep. sept. oct. nov. dec.".split()
+)
+_SINGLE_INITIAL = re.compile(r"(?:^|\s)(?:[A-Z]\.)+$")
+_HANGUL = re.compile(r"[가-힣]")
+_LATIN_WORD = re.compile(r"[A-Za-z]{2}")
+
+Translator = Callable[[dict[str, str]], dict[str, str]]
+
+
+def split_sentences(text: str) -> list[tuple[str, str]]:
+    """
+    text를 (문장, 뒤따르는 구분자) 목록으로 나눕니다.
+    "".join(s + sep for s, sep in result) == text 가 항상 성립합니다.
+    """
+    pieces: list[tuple[str, str]] = []
+    start = 0
+    for match in _BOUNDARY.finditer(text):
+        spaced = match.group(1) is not None
+        end = match.start(1) if spaced else match.start()
+        sentence = text[start:end]
+        if spaced:
+            words = sentence.split()
+            if words and (
+                words[-1].lower() in _ABBREVIATIONS or _SINGLE_INITIAL.search(sentence)
+            ):
+                continue
+        pieces.append((sentence, text[end : match.end()]))
+        start = match.end()
+    pieces.append((text[start:], ""))
+    return pieces
+
+
+def _normalize(sentence: str) -> str:
+    return " ".join(sentence.split())
+
+
+def _needs_translation(sentence: str) -> bool:
+    stripped = sentence.strip()
+    return (
+        len(stripped) >= 5
+        and bool(_LATIN_WORD.search(stripped))
+        and not _HANGUL.search(stripped)
+    )
+
+
+class TranslationMemory:
+    def __init__(
+        self,
+        namespace: str = "translation_memory",
+        ttl: timedelta = TRANSLATION_MEMORY_TTL,
+        max_entries: int = TRANSLATION_MEMORY_MAX_ENTRIES,
+        root: Optional[str] = None,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._store = JsonDiskCache(namespace, root)
+        self._lock = threading.Lock()
+        self._counts: Counter[str] = Counter()
+        self._writes = 0
+
+    @staticmethod
+    def make_key(sentence: str, tier: str = "LLM") -> str:
+        normalized = _normalize(sentence)
+        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        # LLM 번역 키는 기존 형식 유지, 다른 tier(MT)는 접두사로 분리
+        return digest if tier == "LLM" else f"{tier.lower()}-{digest}"
+
+    def _lookup(self, key: str) -> Optional[str]:
+        value = self._store.get(key) if self._store.enabled else None
+        return value if isinstance(value, str) else None
+
+    def _remember(self, key: str, translation: str) -> None:
+        if not self._store.enabled or self.ttl.total_seconds() <= 0:
+            return
+        self._store.set(key, translation, datetime.now() + self.ttl)
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % _PRUNE_EVERY == 1
+        if prune:
+            self._store.prune(self.max_entries)
+
+    def translate_many(
+        self, texts: dict[str, str], translate: Translator, tier: str = "LLM"
+    ) -> dict[str, str]:
+        """
+        {path: text}를 번역합니다. 메모리에 없는 문장만 모아 translate({id: 문장})를
+        한 번 호출하고, 결과를 문장 단위로 저장한 뒤 원래 구분자대로 다시 조립합니다.
+        tier별로 저장 공간을 나눠 MT 번역이 LLM 번역 자리에 쓰이지 않게 합니다.
+        """
+        plans = {path: split_sentences(text) for path, text in texts.items()}
+
+        known: dict[str, str] = {}
+        missing: dict[str, str] = {}
+        hits = misses = 0
+        for pieces in plans.values():
+            for sentence, _ in pieces:
+                if not _needs_translation(sentence):
+                    continue
+                key = self.make_key(sentence, tier)
+                if key in known or key in missing:
+                    hits += 1  # 같은 요청 안의 중복 문장
+                    continue
+                cached = self._lookup(key)
+                if cached is not None:
+                    known[key] = cached
+                    hits += 1
+                else:
+                    missing[key] = _normalize(sentence)
+                    misses += 1
+
+        if missing:
+            ids = {str(i): key for i, key in enumerate(missing)}
+            try:
+                translated = translate({i: missing[key] for i, key in ids.items()})
+            except Exception as e:
+                _logger.warning("Translation of %d sentences failed: %s", len(ids), e)
+                translated = {}
+            for i, key in ids.items():
+                value = translated.get(i)
+                # 한국어 결과만 저장 (실패 시 원문이 돌아오면 다음에 다시 시도)
+                if isinstance(value, str) and _HANGUL.search(value):
+                    known[key] = value.strip()
+                    self._remember(key, known[key])
+
+        with self._lock:
+            self._counts["hits"] += hits
+            self._counts["misses"] += misses
+            self._counts["sentences_sent"] += len(missing)
+
+        results: dict[str, str] = {}
+        for path, pieces in plans.items():
+            parts: list[str] = []
+            for sentence, separator in pieces:
+                if _needs_translation(sentence):
+                    sentence = known.get(self.make_key(sentence, tier), sentence)
+                parts.append(sentence)
+                parts.append(separator)
+            results[path] = "".join(parts)
+        return results
+
+    def translate(self, text: str, translate: Translator, tier: str = "LLM") -> str:
+        return self.translate_many({"text": text}, translate, tier)["text"]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            hits, misses = self._counts["hits"], self._counts["misses"]
+            sent = self._counts["sentences_sent"]
+        lookups = hits + misses
+        return {
+            "enabled": self._store.enabled,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else None,
+            "sentences_sent": sent,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_translation_memory() -> TranslationMemory:
+    """프로세스 단위 번역 메모리 (TranslateService 인스턴스 간 공유)."""
+    return TranslationMemory()
@@ -0,0 +1,146 @@
+"""Routing between machine translation (AWS Translate) and the LLM.
+
+Short, low-stakes strings - headlines, labels, names, one-line fields - go to
+the machine translation tier, which answers in tens of milliseconds for a
+fraction of a cent. Long analytical prose (summaries, reasoning, multi
+sentence or markdown text) stays on the LLM, which keeps financial terms and
+tone. Per-tier call counts, characters, latency and estimated cost are kept
+so the routing can be checked against real traffic.
+"""
+
+import os
+import re
+import threading
+from collections import defaultdict
+from typing import Any, Literal, Optional, Protocol
+
+Tier = Literal["MT", "LLM"]
+
+# MT로 보낼 최대 길이 (문자 수)
+MT_MAX_CHARS = int(os.environ.get("TRANSLATION_MT_MAX_CHARS", 160))
+# TRANSLATION_MT_BACKEND=local 이면 AWS 대신 LocalMachineTranslator 사용 (테스트/로컬)
+MT_BACKEND = os.environ.get("TRANSLATION_MT_BACKEND", "aws")
+
+# 필드 이름에 이 단어가 있으면 분석 본문으로 보고 길이와 무관하게 LLM 사용
+LLM_FIELD_HINTS: tuple[str, ...] = (
+    "summary",
+    "analysis",
+    "reason",
+    "rationale",
+    "thesis",
+    "outlook",
+    "description",
+    "detail",
+    "report",
+    "commentary",
+    "insight",
+    "scenario",
+)
+
+# AWS Translate 표준 가격: 백만 문자당 $15
+MT_PRICE_PER_CHAR = 15.0 / 1_000_000
+
+_SENTENCE_END = re.compile(r"[.!?](\s|$)")
+_MARKDOWN = re.compile(r"^\s*(?:[-*#>]|\d+\.)\s", re.MULTILINE)
+_INDEX = re.compile(r"\[\d+\]")
+
+
+def _field_name(path: str) -> str:
+    """items[2].headline → headline"""
+    return _INDEX.sub("", path).rsplit(".", 1)[-1].lower()
+
+
+def choose_tier(path: str, text: str) -> Tier:
+    """
+    길이, 필드 경로, 내용 형태로 번역 tier를 고릅니다.
+    - 분석 필드(summary, reasoning 등) → LLM
+    - 여러 줄 / 마크다운 목록 / 2문장 이상 → LLM
+    - 그 외 MT_MAX_CHARS 이하의 짧은 문자열(제목, 라벨, 이름) → MT
+    """
+    field = _field_name(path) if path else ""
+    if field and any(hint in field for hint in LLM_FIELD_HINTS):
+        return "LLM"
+    stripped = text.strip()
+    if len(stripped) > MT_MAX_CHARS or "\n" in stripped:
+        return "LLM"
+    if _MARKDOWN.search(stripped) or len(_SENTENCE_END.findall(stripped)) > 1:
+        return "LLM"
+    return "MT"
+
+
+class MachineTranslator(Protocol):
+    def translate(self, text: str) -> str: ...
+
+
+class AwsMachineTranslator:
+    def __init__(self, client: Any) -> None:
+        self.client = client
+
+    def translate(self, text: str) -> str:
+        response = self.client.translate_text(
+            Text=text,
+            SourceLanguageCode="en",
+            TargetLanguageCode="ko",
+        )
+        return response["TranslatedText"]
+
+
+class LocalMachineTranslator:
+    """AWS 없이 라우팅을 확인하기 위한 대체 구현. 원문을 그대로 돌려줍니다."""
+
+    def translate(self, text: str) -> str:
+        return text
+
+
+def build_machine_translator(client: Optional[Any]) -> Optional[MachineTranslator]:
+    if MT_BACKEND == "local":
+        return LocalMachineTranslator()
+    if client is None:
+        return None
+    return AwsMachineTranslator(client)
+
+
+class TierStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._totals: dict[str, dict[str, float]] = defaultdict(
+            lambda: {"calls": 0, "errors": 0, "chars": 0, "latency": 0.0, "cost": 0.0}
+        )
+
+    def record(
+        self,
+        tier: Tier,
+        chars: int,
+        latency: float,
+        cost_usd: float,
+        error: bool = False,
+    ) -> None:
+        with self._lock:
+            totals = self._totals[tier]
+            totals["calls"] += 1
+            totals["errors"] += int(error)
+            totals["chars"] += chars
+            totals["latency"] += latency
+            totals["cost"] += cost_usd
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            totals = {tier: dict(values) for tier, values in self._totals.items()}
+        return {
+            tier: {
+                "calls": int(values["calls"]),
+                "errors": int(values["errors"]),
+                "chars": int(values["chars"]),
+                "latency_avg": (
+                    values["latency"] / values["calls"] if values["calls"] else None
+                ),
+                "cost_usd": round(values["cost"], 6),
+                "cost_per_1k_chars": (
+                    values["cost"] / values["chars"] * 1000 if values["chars"] else None
+                ),
+            }
+            for tier, values in sorted(totals.items())
+        }
+
+
+translation_tier_stats = TierStats()
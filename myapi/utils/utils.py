@@ -250,7 +250,7 @@ def export_slim_tail_csv(df: DataFrame, rows: int = 260):
     # 교집합만 선택해 예상치 못한 결측 컬럼 오류 방지
     cols_to_use = [c for c in keep_cols if c in df.columns]
 
-    return df.loc[:, cols_to_use].round(3).tail(rows).to_csv()
+    return df.loc[:, cols_to_use].tail(rows).round(3).to_csv()
 
 
 def format_signal_embed(response: SignalPromptResponse, model: str):
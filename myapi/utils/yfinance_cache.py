@@ -1,15 +1,11 @@
+import importlib
 import logging
 import os
 from collections.abc import Mapping, Sequence
 from pathlib import Path
 from typing import Any, Optional
 
-import yfinance as yf
-
-try:
-    from yfinance import cache as yf_cache
-except ImportError:  # pragma: no cover - safety guard for older releases
-    yf_cache = None  # type: ignore[assignment]
+from myapi.utils.lazy_import import is_loaded, lazy_import
 
 _logger = logging.getLogger(__name__)
 _CACHE_ENV_VAR = "YFINANCE_CACHE_DIR"
@@ -60,36 +56,48 @@ def configure_yfinance_cache(cache_dir: Optional[Path | str] = None) -> Optional
         _cache_path = None
         return None
 
-    if yf_cache is not None:
-        try:
-            yf_cache.set_cache_location(str(target))
-        except Exception as exc:
-            _logger.warning(
-                "Failed to set yfinance cache location to %s: %s", target, exc
-            )
-        else:
-            if hasattr(yf, "set_tz_cache_location"):
-                tz_dir = target / "tz"
-                if _ensure_dir(tz_dir):
-                    try:
-                        yf.set_tz_cache_location(str(tz_dir))
-                    except Exception as exc:  # pragma: no cover - defensive
-                        _logger.debug(
-                            "Could not set yfinance tz cache location: %s", exc
-                        )
-    else:  # pragma: no cover - defensive guard
-        _logger.debug("yfinance cache module not available")
-
     _configured = True
     _cache_path = target
+    if is_loaded(yf):
+        _apply_cache_location(yf)
     return _cache_path
 
 
+def _apply_cache_location(module: Any) -> None:
+    """Point yfinance's own caches at the configured directory (runs on first import)."""
+    if _cache_path is None:
+        return
+    try:
+        yf_cache = importlib.import_module("yfinance.cache")
+    except ImportError:  # pragma: no cover - defensive guard
+        _logger.debug("yfinance cache module not available")
+        return
+
+    try:
+        yf_cache.set_cache_location(str(_cache_path))
+    except Exception as exc:
+        _logger.warning(
+            "Failed to set yfinance cache location to %s: %s", _cache_path, exc
+        )
+        return
+
+    if hasattr(module, "set_tz_cache_location"):
+        tz_dir = _cache_path / "tz"
+        if _ensure_dir(tz_dir):
+            try:
+                module.set_tz_cache_location(str(tz_dir))
+            except Exception as exc:  # pragma: no cover - defensive
+                _logger.debug("Could not set yfinance tz cache location: %s", exc)
+
+
+# yfinance는 실제로 쓰일 때 import하고, 그 시점에 캐시 위치를 적용합니다.
+yf = lazy_import("yfinance", on_load=_apply_cache_location)
+
 configure_yfinance_cache()
 
 
 def safe_get_ticker_info(
-    tk: yf.Ticker, keys: Sequence[str] | None = None
+    tk: "yf.Ticker", keys: Sequence[str] | None = None
 ) -> dict[str, Any]:
     """Retrieve ticker info while tolerating missing fundamentals."""
     accessors = (